@@ -0,0 +1,31 @@
+"""
+Code lists shared by the data product definitions.
+
+The enums are defined only once here, so every process builds them once no matter how
+many definitions use them. The class names are used as the schema names in the
+generated specs, so they must not be renamed.
+
+Definitions import the enums from their modules, e.g.
+`from codelists.iso_3166 import Country`, so only the code lists a definition uses are
+built. The enums are also available from the package itself, importing their module
+on first use.
+"""
+from importlib import import_module
+
+# Module of each enum, relative to the package
+MODULES = {
+    "Country": ".iso_3166",
+    "ISO_3166_1_Alpha_3": ".iso_3166",
+    "ISO_4217_CurrencyCode": ".iso_4217",
+    "IndustrySector": ".nace",
+}
+
+
+def __getattr__(name: str):
+    if name not in MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(MODULES[name], __name__), name)
+
+
+def __dir__():
+    return sorted([*globals(), *MODULES])
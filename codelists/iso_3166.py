@@ -0,0 +1,504 @@
+"""
+ISO 3166-1 country codes
+"""
+from enum import Enum
+
+
+class ISO_3166_1_Alpha_3(str, Enum):
+    AFG = "AFG"
+    ALB = "ALB"
+    DZA = "DZA"
+    ASM = "ASM"
+    AND = "AND"
+    AGO = "AGO"
+    AIA = "AIA"
+    ATA = "ATA"
+    ATG = "ATG"
+    ARG = "ARG"
+    ARM = "ARM"
+    ABW = "ABW"
+    AUS = "AUS"
+    AUT = "AUT"
+    AZE = "AZE"
+    BHS = "BHS"
+    BHR = "BHR"
+    BGD = "BGD"
+    BRB = "BRB"
+    BLR = "BLR"
+    BEL = "BEL"
+    BLZ = "BLZ"
+    BEN = "BEN"
+    BMU = "BMU"
+    BTN = "BTN"
+    BOL = "BOL"
+    BIH = "BIH"
+    BWA = "BWA"
+    BVT = "BVT"
+    BRA = "BRA"
+    IOT = "IOT"
+    BRN = "BRN"
+    BGR = "BGR"
+    BFA = "BFA"
+    BDI = "BDI"
+    KHM = "KHM"
+    CMR = "CMR"
+    CAN = "CAN"
+    CPV = "CPV"
+    CYM = "CYM"
+    CAF = "CAF"
+    TCD = "TCD"
+    CHL = "CHL"
+    CHN = "CHN"
+    CXR = "CXR"
+    CCK = "CCK"
+    COL = "COL"
+    COM = "COM"
+    COG = "COG"
+    COD = "COD"
+    COK = "COK"
+    CRI = "CRI"
+    CIV = "CIV"
+    HRV = "HRV"
+    CUB = "CUB"
+    CYP = "CYP"
+    CZE = "CZE"
+    DNK = "DNK"
+    DJI = "DJI"
+    DMA = "DMA"
+    DOM = "DOM"
+    ECU = "ECU"
+    EGY = "EGY"
+    SLV = "SLV"
+    GNQ = "GNQ"
+    ERI = "ERI"
+    EST = "EST"
+    ETH = "ETH"
+    FLK = "FLK"
+    FRO = "FRO"
+    FJI = "FJI"
+    FIN = "FIN"
+    FRA = "FRA"
+    GUF = "GUF"
+    PYF = "PYF"
+    ATF = "ATF"
+    GAB = "GAB"
+    GMB = "GMB"
+    GEO = "GEO"
+    DEU = "DEU"
+    GHA = "GHA"
+    GIB = "GIB"
+    GRC = "GRC"
+    GRL = "GRL"
+    GRD = "GRD"
+    GLP = "GLP"
+    GUM = "GUM"
+    GTM = "GTM"
+    GGY = "GGY"
+    GIN = "GIN"
+    GNB = "GNB"
+    GUY = "GUY"
+    HTI = "HTI"
+    HMD = "HMD"
+    VAT = "VAT"
+    HND = "HND"
+    HKG = "HKG"
+    HUN = "HUN"
+    ISL = "ISL"
+    IND = "IND"
+    IDN = "IDN"
+    IRN = "IRN"
+    IRQ = "IRQ"
+    IRL = "IRL"
+    IMN = "IMN"
+    ISR = "ISR"
+    ITA = "ITA"
+    JAM = "JAM"
+    JPN = "JPN"
+    JEY = "JEY"
+    JOR = "JOR"
+    KAZ = "KAZ"
+    KEN = "KEN"
+    KIR = "KIR"
+    PRK = "PRK"
+    KOR = "KOR"
+    KWT = "KWT"
+    KGZ = "KGZ"
+    LAO = "LAO"
+    LVA = "LVA"
+    LBN = "LBN"
+    LSO = "LSO"
+    LBR = "LBR"
+    LBY = "LBY"
+    LIE = "LIE"
+    LTU = "LTU"
+    LUX = "LUX"
+    MAC = "MAC"
+    MKD = "MKD"
+    MDG = "MDG"
+    MWI = "MWI"
+    MYS = "MYS"
+    MDV = "MDV"
+    MLI = "MLI"
+    MLT = "MLT"
+    MHL = "MHL"
+    MTQ = "MTQ"
+    MRT = "MRT"
+    MUS = "MUS"
+    MYT = "MYT"
+    MEX = "MEX"
+    FSM = "FSM"
+    MDA = "MDA"
+    MCO = "MCO"
+    MNG = "MNG"
+    MNE = "MNE"
+    MSR = "MSR"
+    MAR = "MAR"
+    MOZ = "MOZ"
+    MMR = "MMR"
+    NAM = "NAM"
+    NRU = "NRU"
+    NPL = "NPL"
+    NLD = "NLD"
+    ANT = "ANT"
+    NCL = "NCL"
+    NZL = "NZL"
+    NIC = "NIC"
+    NER = "NER"
+    NGA = "NGA"
+    NIU = "NIU"
+    NFK = "NFK"
+    MNP = "MNP"
+    NOR = "NOR"
+    OMN = "OMN"
+    PAK = "PAK"
+    PLW = "PLW"
+    PSE = "PSE"
+    PAN = "PAN"
+    PNG = "PNG"
+    PRY = "PRY"
+    PER = "PER"
+    PHL = "PHL"
+    PCN = "PCN"
+    POL = "POL"
+    PRT = "PRT"
+    PRI = "PRI"
+    QAT = "QAT"
+    REU = "REU"
+    ROU = "ROU"
+    RUS = "RUS"
+    RWA = "RWA"
+    SHN = "SHN"
+    KNA = "KNA"
+    LCA = "LCA"
+    SPM = "SPM"
+    VCT = "VCT"
+    WSM = "WSM"
+    SMR = "SMR"
+    STP = "STP"
+    SAU = "SAU"
+    SEN = "SEN"
+    SRB = "SRB"
+    SYC = "SYC"
+    SLE = "SLE"
+    SGP = "SGP"
+    SVK = "SVK"
+    SVN = "SVN"
+    SLB = "SLB"
+    SOM = "SOM"
+    ZAF = "ZAF"
+    SGS = "SGS"
+    SSD = "SSD"
+    ESP = "ESP"
+    LKA = "LKA"
+    SDN = "SDN"
+    SUR = "SUR"
+    SJM = "SJM"
+    SWZ = "SWZ"
+    SWE = "SWE"
+    CHE = "CHE"
+    SYR = "SYR"
+    TWN = "TWN"
+    TJK = "TJK"
+    TZA = "TZA"
+    THA = "THA"
+    TLS = "TLS"
+    TGO = "TGO"
+    TKL = "TKL"
+    TON = "TON"
+    TTO = "TTO"
+    TUN = "TUN"
+    TUR = "TUR"
+    TKM = "TKM"
+    TCA = "TCA"
+    TUV = "TUV"
+    UGA = "UGA"
+    UKR = "UKR"
+    ARE = "ARE"
+    GBR = "GBR"
+    USA = "USA"
+    UMI = "UMI"
+    URY = "URY"
+    UZB = "UZB"
+    VUT = "VUT"
+    VEN = "VEN"
+    VNM = "VNM"
+    VGB = "VGB"
+    VIR = "VIR"
+    WLF = "WLF"
+    ESH = "ESH"
+    YEM = "YEM"
+    ZMB = "ZMB"
+    ZWE = "ZWE"
+
+
+# ISO 3166-1 alpha-2 country codes in lower case
+class Country(str, Enum):
+    AD = "ad"
+    AE = "ae"
+    AF = "af"
+    AG = "ag"
+    AI = "ai"
+    AL = "al"
+    AM = "am"
+    AO = "ao"
+    AQ = "aq"
+    AR = "ar"
+    AS = "as"
+    AT = "at"
+    AU = "au"
+    AW = "aw"
+    AX = "ax"
+    AZ = "az"
+    BA = "ba"
+    BB = "bb"
+    BD = "bd"
+    BE = "be"
+    BF = "bf"
+    BG = "bg"
+    BH = "bh"
+    BI = "bi"
+    BJ = "bj"
+    BL = "bl"
+    BM = "bm"
+    BN = "bn"
+    BO = "bo"
+    BQ = "bq"
+    BR = "br"
+    BS = "bs"
+    BT = "bt"
+    BV = "bv"
+    BW = "bw"
+    BY = "by"
+    BZ = "bz"
+    CA = "ca"
+    CC = "cc"
+    CD = "cd"
+    CF = "cf"
+    CG = "cg"
+    CH = "ch"
+    CI = "ci"
+    CK = "ck"
+    CL = "cl"
+    CM = "cm"
+    CN = "cn"
+    CO = "co"
+    CR = "cr"
+    CU = "cu"
+    CV = "cv"
+    CW = "cw"
+    CX = "cx"
+    CY = "cy"
+    CZ = "cz"
+    DE = "de"
+    DJ = "dj"
+    DK = "dk"
+    DM = "dm"
+    DO = "do"
+    DZ = "dz"
+    EC = "ec"
+    EE = "ee"
+    EG = "eg"
+    EH = "eh"
+    ER = "er"
+    ES = "es"
+    ET = "et"
+    FI = "fi"
+    FJ = "fj"
+    FK = "fk"
+    FM = "fm"
+    FO = "fo"
+    FR = "fr"
+    GA = "ga"
+    GB = "gb"
+    GD = "gd"
+    GE = "ge"
+    GF = "gf"
+    GG = "gg"
+    GH = "gh"
+    GI = "gi"
+    GL = "gl"
+    GM = "gm"
+    GN = "gn"
+    GP = "gp"
+    GQ = "gq"
+    GR = "gr"
+    GS = "gs"
+    GT = "gt"
+    GU = "gu"
+    GW = "gw"
+    GY = "gy"
+    HK = "hk"
+    HM = "hm"
+    HN = "hn"
+    HR = "hr"
+    HT = "ht"
+    HU = "hu"
+    ID = "id"
+    IE = "ie"
+    IL = "il"
+    IM = "im"
+    IN = "in"
+    IO = "io"
+    IQ = "iq"
+    IR = "ir"
+    IS = "is"
+    IT = "it"
+    JE = "je"
+    JM = "jm"
+    JO = "jo"
+    JP = "jp"
+    KE = "ke"
+    KG = "kg"
+    KH = "kh"
+    KI = "ki"
+    KM = "km"
+    KN = "kn"
+    KP = "kp"
+    KR = "kr"
+    KW = "kw"
+    KY = "ky"
+    KZ = "kz"
+    LA = "la"
+    LB = "lb"
+    LC = "lc"
+    LI = "li"
+    LK = "lk"
+    LR = "lr"
+    LS = "ls"
+    LT = "lt"
+    LU = "lu"
+    LV = "lv"
+    LY = "ly"
+    MA = "ma"
+    MC = "mc"
+    MD = "md"
+    ME = "me"
+    MF = "mf"
+    MG = "mg"
+    MH = "mh"
+    MK = "mk"
+    ML = "ml"
+    MM = "mm"
+    MN = "mn"
+    MO = "mo"
+    MP = "mp"
+    MQ = "mq"
+    MR = "mr"
+    MS = "ms"
+    MT = "mt"
+    MU = "mu"
+    MV = "mv"
+    MW = "mw"
+    MX = "mx"
+    MY = "my"
+    MZ = "mz"
+    NA = "na"
+    NC = "nc"
+    NE = "ne"
+    NF = "nf"
+    NG = "ng"
+    NI = "ni"
+    NL = "nl"
+    NO = "no"
+    NP = "np"
+    NR = "nr"
+    NU = "nu"
+    NZ = "nz"
+    OM = "om"
+    PA = "pa"
+    PE = "pe"
+    PF = "pf"
+    PG = "pg"
+    PH = "ph"
+    PK = "pk"
+    PL = "pl"
+    PM = "pm"
+    PN = "pn"
+    PR = "pr"
+    PS = "ps"
+    PT = "pt"
+    PW = "pw"
+    PY = "py"
+    QA = "qa"
+    RE = "re"
+    RO = "ro"
+    RS = "rs"
+    RU = "ru"
+    RW = "rw"
+    SA = "sa"
+    SB = "sb"
+    SC = "sc"
+    SD = "sd"
+    SE = "se"
+    SG = "sg"
+    SH = "sh"
+    SI = "si"
+    SJ = "sj"
+    SK = "sk"
+    SL = "sl"
+    SM = "sm"
+    SN = "sn"
+    SO = "so"
+    SR = "sr"
+    SS = "ss"
+    ST = "st"
+    SV = "sv"
+    SX = "sx"
+    SY = "sy"
+    SZ = "sz"
+    TC = "tc"
+    TD = "td"
+    TF = "tf"
+    TG = "tg"
+    TH = "th"
+    TJ = "tj"
+    TK = "tk"
+    TL = "tl"
+    TM = "tm"
+    TN = "tn"
+    TO = "to"
+    TR = "tr"
+    TT = "tt"
+    TV = "tv"
+    TW = "tw"
+    TZ = "tz"
+    UA = "ua"
+    UG = "ug"
+    UM = "um"
+    US = "us"
+    UY = "uy"
+    UZ = "uz"
+    VA = "va"
+    VC = "vc"
+    VE = "ve"
+    VG = "vg"
+    VI = "vi"
+    VN = "vn"
+    VU = "vu"
+    WF = "wf"
+    WS = "ws"
+    YE = "ye"
+    YT = "yt"
+    ZA = "za"
+    ZM = "zm"
+    ZW = "zw"
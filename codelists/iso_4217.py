@@ -0,0 +1,12 @@
+"""
+ISO 4217 currency codes, limited to the currencies of the Nordic countries
+"""
+from enum import Enum
+
+
+class ISO_4217_CurrencyCode(str, Enum):
+    EUR = "EUR"
+    SEK = "SEK"
+    NOK = "NOK"
+    DKK = "DKK"
+    ISK = "ISK"
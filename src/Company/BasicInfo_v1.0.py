@@ -31,3 +31,6 @@ DEFINITION = DataProductDefinition(
     request=BasicCompanyInfoRequest,
     response=BasicCompanyInfoResponse,
 )
+
+# Changes rarely and is polled often, unchanged responses are answered with a 304
+CONDITIONAL_REQUESTS = True
@@ -72,3 +72,6 @@ DEFINITION = DataProductDefinition(
     request=ShareholdersInfoRequest,
     response=ShareholdersInfoResponse,
 )
+
+# Changes rarely and is polled often, unchanged responses are answered with a 304
+CONDITIONAL_REQUESTS = True
@@ -253,3 +253,6 @@ DEFINITION = DataProductDefinition(
     requires_authorization=False,
     requires_consent=False,
 )
+
+# Served in binary formats as well for high volume machine-to-machine traffic
+CONTENT_TYPES = ["application/msgpack", "application/cbor"]
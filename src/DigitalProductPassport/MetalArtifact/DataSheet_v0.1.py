@@ -95,3 +95,6 @@ DEFINITION = DataProductDefinition(
     requires_authorization=False,
     requires_consent=False,
 )
+
+# Changes rarely and is polled often, unchanged responses are answered with a 304
+CONDITIONAL_REQUESTS = True
@@ -86,3 +86,6 @@ DEFINITION = DataProductDefinition(
     request=ChargingHistoryRequest,
     response=ChargingHistoryResponse,
 )
+
+# Served in binary formats as well for high volume machine-to-machine traffic
+CONTENT_TYPES = ["application/msgpack", "application/cbor"]
@@ -257,3 +257,6 @@ DEFINITION = DataProductDefinition(
     request=BatteryDataRequest,
     response=BatteryDataResponse,
 )
+
+# Data sheets rarely change after the battery is manufactured
+CACHE_POLICY = {"max_age": 86400, "stale_while_revalidate": 604800}
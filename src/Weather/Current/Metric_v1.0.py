@@ -51,3 +51,6 @@ DEFINITION = DataProductDefinition(
     request=CurrentWeatherMetricRequest,
     response=CurrentWeatherMetricResponse,
 )
+
+# The weather changes over minutes, a slightly stale response is fine meanwhile
+CACHE_POLICY = {"max_age": 600, "stale_while_revalidate": 300}
@@ -0,0 +1,5 @@
+"""
+Repository tooling built on top of ioxio-data-product-definition-tooling.
+
+Run ``python -m tooling --help`` from the repository root for the list of commands.
+"""
@@ -0,0 +1,12 @@
+import os
+import sys
+
+# Examples defined as sets are exported in hash order. Fix the hash seed so the
+# generated specs are byte-identical between runs and worker processes.
+if os.environ.get("PYTHONHASHSEED") != "0":
+    os.environ["PYTHONHASHSEED"] = "0"
+    os.execv(sys.executable, [sys.executable, "-m", "tooling", *sys.argv[1:]])
+
+from tooling.cli import cli  # noqa: E402
+
+cli(prog_name="python -m tooling")
@@ -0,0 +1,116 @@
+"""
+Definitions that mirror another definition with different metadata.
+
+Aliases are declared in src/aliases.json, e.g.
+
+{
+  "draft/Company/BasicInfo": {
+    "source": "Company/BasicInfo_v1.0",
+    "version": "0.0.1",
+    "deprecated": true
+  }
+}
+
+The spec of an alias is derived from the spec of its source, so the source doesn't
+need to be imported and converted again.
+"""
+import copy
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from definition_tooling.converter import DataProductDefinition
+
+ALIASES_FILE = "aliases.json"
+# Metadata of the definition that an alias can override
+ALIAS_FIELDS = ["version", "deprecated", "title", "description"]
+
+
+@dataclass(frozen=True)
+class Alias:
+    name: str
+    source: str
+    overrides: Dict[str, Any]
+
+    def hash(self) -> str:
+        data = json.dumps(
+            {"source": self.source, **self.overrides}, sort_keys=True
+        ).encode()
+        return hashlib.sha256(data).hexdigest()
+
+
+def load_aliases(src: Path) -> Dict[str, Alias]:
+    """
+    Load the aliases declared in the sources, by name
+    """
+    path = src / ALIASES_FILE
+    if not path.exists():
+        return {}
+    aliases = {}
+    for name, entry in json.loads(path.read_text(encoding="utf-8")).items():
+        entry = dict(entry)
+        source = entry.pop("source", None)
+        if not source:
+            raise ValueError(f'Alias {name} in {path} has no "source"')
+        unknown = set(entry) - set(ALIAS_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Alias {name} in {path} has unsupported fields: "
+                f"{', '.join(sorted(unknown))}"
+            )
+        aliases[name] = Alias(name=name, source=source, overrides=entry)
+    return aliases
+
+
+def operation_id(path: str) -> str:
+    """
+    Get the operation ID of a route in the same way as FastAPI and the upstream
+    converter do
+    """
+    return "request" + re.sub(r"\W", "_", path)
+
+
+def derive_spec(spec: dict, alias: Alias) -> dict:
+    """
+    Derive the OpenAPI spec of an alias from the spec of its source
+    """
+    spec = copy.deepcopy(spec)
+    overrides = alias.overrides
+    info = spec["info"]
+    for key in ("title", "description", "version"):
+        if key in overrides:
+            info[key] = overrides[key]
+
+    path = f"/{alias.name}"
+    ((_, path_item),) = spec["paths"].items()
+    spec["paths"] = {path: path_item}
+    old_operation = path_item["post"]
+    # Rebuilt to keep the keys in the order FastAPI outputs them in
+    operation = {}
+    for key, value in old_operation.items():
+        if key == "deprecated":
+            continue
+        if key == "summary":
+            value = overrides.get("title", value)
+        elif key == "description":
+            value = overrides.get("description", value)
+        operation[key] = value
+        if key == "operationId":
+            operation[key] = operation_id(path)
+            if overrides.get("deprecated", old_operation.get("deprecated", False)):
+                operation["deprecated"] = True
+    path_item["post"] = operation
+    return spec
+
+
+def alias_definition(
+    definition: "DataProductDefinition", alias: Alias
+) -> "DataProductDefinition":
+    """
+    Create the definition of an alias from the definition of its source
+    """
+    return type(definition)(**{**dict(definition), **alias.overrides})
@@ -0,0 +1,105 @@
+"""
+Minified and precompressed variants of the OpenAPI specs for serving them as-is.
+
+All variants have deterministic bytes, so they only change when the spec changes, and
+the variants of removed or renamed specs are removed. The size report is committed
+with the specs, so a change of the sizes shows up in review.
+"""
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from rich import print
+
+from tooling.converter import remove_empty_dirs
+from tooling.schema import iter_specs, load_spec
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_SIZE_REPORT = Path("sizes.json")
+VARIANT_SUFFIXES = (".min.json", ".min.json.gz", ".min.json.br")
+
+
+def minify(spec: dict) -> bytes:
+    return json.dumps(spec, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def gzip_compress(data: bytes) -> bytes:
+    # A fixed mtime keeps the gzip header, and thus the output, deterministic
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_compress(data: bytes) -> Optional[bytes]:
+    if brotli is None:
+        return None
+    return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def remove_stale_variants(dest: Path, expected: Set[Path]) -> None:
+    """
+    Remove the variants in dest that aren't expected, i.e. of specs that no longer
+    exist
+    """
+    if not dest.exists():
+        return
+    for path in sorted(dest.glob("**/*")):
+        if path.name.endswith(VARIANT_SUFFIXES) and path not in expected:
+            print(f"Removing stale {path}")
+            path.unlink()
+            remove_empty_dirs(path.parent, dest)
+
+
+def build_artifacts(
+    src: Path, dest: Path, report_path: Path = DEFAULT_SIZE_REPORT
+) -> Tuple[Dict[str, Dict[str, int]], bool]:
+    """
+    Write the minified, gzip and brotli variants of each spec in src to dest, and a
+    report of their sizes to report_path. Other variants in dest are removed.
+
+    :return: Sizes in bytes of each variant by definition name, and whether the report
+        changed
+    """
+    if brotli is None:
+        print("[yellow]brotli is not installed, skipping .br variants[/yellow]")
+
+    sizes = {}
+    expected = set()
+    for path in iter_specs(src):
+        name = path.relative_to(src).with_suffix("").as_posix()
+        minified = minify(load_spec(path))
+        variants = {
+            "minified": (".min.json", minified),
+            "gzip": (".min.json.gz", gzip_compress(minified)),
+            "brotli": (".min.json.br", brotli_compress(minified)),
+        }
+        sizes[name] = {"raw": path.stat().st_size}
+        for variant, (suffix, data) in variants.items():
+            if data is not None:
+                out_file = dest / f"{name}{suffix}"
+                write_if_changed(out_file, data)
+                expected.add(out_file)
+                sizes[name][variant] = len(data)
+    remove_stale_variants(dest, expected)
+
+    totals: Dict[str, int] = {}
+    for variant_sizes in sizes.values():
+        for variant, size in variant_sizes.items():
+            totals[variant] = totals.get(variant, 0) + size
+
+    report = {"total": totals, "definitions": sizes}
+    changed = write_if_changed(
+        report_path, (json.dumps(report, indent=2) + "\n").encode("utf-8")
+    )
+    return sizes, changed
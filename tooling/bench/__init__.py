@@ -0,0 +1,68 @@
+"""
+Benchmarks of the data product definitions.
+
+Results are written as JSON so they can be stored and compared between commits.
+"""
+import json
+import subprocess
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def git_revision() -> Optional[str]:
+    try:
+        completed_process = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            check=True,
+            capture_output=True,
+            encoding="utf-8",
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed_process.stdout.strip()
+
+
+def write_results(path: Path, results: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"revision": git_revision(), **results}
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def load_budgets(path: Optional[Path], section: str) -> Dict[str, Any]:
+    """
+    Load a section of a budgets file. Each section has "default" budgets and
+    "overrides" of them for specific definitions, e.g.
+
+    {"imports": {"default": {"wall_ms": 250}, "overrides": {"NSG/**": {...}}}}
+    """
+    if path is None:
+        return {"default": {}, "overrides": {}}
+    budgets = json.loads(path.read_text(encoding="utf-8")).get(section, {})
+    return {
+        "default": budgets.get("default", {}),
+        "overrides": budgets.get("overrides", {}),
+    }
+
+
+def budget_for(budgets: Dict[str, Any], name: str) -> Dict[str, float]:
+    """
+    Get the budgets of a definition. Overrides are glob patterns matched against the
+    definition name, later matches take precedence.
+    """
+    budget = dict(budgets["default"])
+    for pattern, override in budgets["overrides"].items():
+        if fnmatchcase(name, pattern):
+            budget.update(override)
+    return budget
+
+
+def over_budget(values: Dict[str, float], budget: Dict[str, float]) -> Dict[str, float]:
+    """
+    Get the values that exceed their budget
+    """
+    return {
+        key: value
+        for key, value in values.items()
+        if key in budget and value > budget[key]
+    }
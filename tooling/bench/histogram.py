@@ -0,0 +1,79 @@
+"""
+Latency histogram with a fixed relative precision, in the style of HdrHistogram.
+
+Values are recorded as integers, e.g. microseconds. Each value is rounded down to a
+bucket whose width grows with the magnitude of the value, so the histogram stays small
+while every percentile is accurate to the configured number of significant bits.
+"""
+from typing import Dict, Iterable
+
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+class Histogram:
+    """
+    :param precision_bits: Number of significant bits kept of each value. 11 bits
+        keeps the relative error of the recorded values under 0.05%.
+    """
+
+    def __init__(self, precision_bits: int = 11):
+        self.precision_bits = precision_bits
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.sum = 0
+        self.min = 0
+        self.max = 0
+
+    def _bucket(self, value: int) -> int:
+        shift = max(value.bit_length() - self.precision_bits, 0)
+        return (value >> shift) << shift
+
+    def _highest_equivalent(self, bucket: int) -> int:
+        shift = max(bucket.bit_length() - self.precision_bits, 0)
+        return bucket + (1 << shift) - 1
+
+    def record(self, value: int) -> None:
+        value = max(int(value), 0)
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        if not self.total or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.total += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        if other.total and (not self.total or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.total += other.total
+        self.sum += other.sum
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Get the value at or below which the given percentage of the values are
+        """
+        if not self.total:
+            return 0
+        threshold = percentile / 100 * self.total
+        cumulative = 0
+        for bucket in sorted(self.counts):
+            cumulative += self.counts[bucket]
+            if cumulative >= threshold:
+                return min(self._highest_equivalent(bucket), self.max)
+        return self.max
+
+    def summary(
+        self, scale: float = 1.0, percentiles: Iterable[float] = PERCENTILES
+    ) -> Dict[str, float]:
+        """
+        Summarize the histogram, with the values divided by scale, e.g. 1000 to turn
+        microseconds into milliseconds
+        """
+        result = {f"p{p:g}": round(self.percentile(p) / scale, 3) for p in percentiles}
+        result["min"] = round(self.min / scale, 3)
+        result["max"] = round(self.max / scale, 3)
+        result["mean"] = round(self.sum / self.total / scale, 3) if self.total else 0
+        return result
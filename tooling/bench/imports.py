@@ -0,0 +1,108 @@
+"""
+Import time and memory benchmark of the definition modules.
+
+Each definition is imported in a fresh interpreter, after the libraries shared by all
+definitions are imported, so only the cost of the definition itself is measured. As
+tracemalloc slows the import down several times, the peak memory is measured in a
+separate interpreter from the times.
+"""
+import json
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List
+
+from tooling.registry import DefinitionRegistry
+
+
+def measure_import(src: Path, name: str, trace_memory: bool) -> Dict[str, float]:
+    """
+    Import a definition and measure its times, or with trace_memory its peak memory.
+    Should be run in a fresh interpreter.
+    """
+    import definition_tooling.converter  # noqa: F401
+    from pydantic import BaseModel
+    from pydantic._internal._model_construction import ModelMetaclass
+
+    # Warm up the lazy parts of pydantic that are shared by all models
+    type("Warmup", (BaseModel,), {"__annotations__": {"x": int}})
+
+    model_time = 0.0
+    models = 0
+    depth = 0
+    original_new = ModelMetaclass.__new__
+
+    def timed_new(mcs, *args, **kwargs):
+        nonlocal model_time, models, depth
+        depth += 1
+        start = perf_counter()
+        try:
+            return original_new(mcs, *args, **kwargs)
+        finally:
+            depth -= 1
+            # Don't count models created while building another model twice
+            if not depth:
+                model_time += perf_counter() - start
+            models += 1
+
+    ModelMetaclass.__new__ = timed_new
+    registry = DefinitionRegistry(src)
+
+    if trace_memory:
+        tracemalloc.start()
+        registry.get(name)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"peak_kb": round(peak / 1024, 1)}
+
+    start = perf_counter()
+    registry.get(name)
+    wall_time = perf_counter() - start
+    return {
+        "wall_ms": round(wall_time * 1000, 3),
+        "model_build_ms": round(model_time * 1000, 3),
+        "models": models,
+    }
+
+
+def _run_in_subprocess(src: Path, name: str, trace_memory: bool) -> Dict[str, float]:
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tooling.bench.imports",
+            str(src.resolve()),
+            name,
+            str(int(trace_memory)),
+        ],
+        cwd=src.resolve().parent,
+        check=True,
+        capture_output=True,
+        encoding="utf-8",
+    )
+    return json.loads(completed_process.stdout)
+
+
+def run_import_benchmark(
+    src: Path, names: List[str], repeat: int = 1
+) -> Dict[str, Dict[str, float]]:
+    """
+    Import each definition in a fresh interpreter, and again in another one to measure
+    the peak memory. With repeat > 1 the fastest run is kept, as the slower ones are
+    only slowed down by noise.
+    """
+    results = {}
+    for name in names:
+        runs = [_run_in_subprocess(src, name, False) for _ in range(repeat)]
+        results[name] = {
+            **min(runs, key=lambda r: r["wall_ms"]),
+            **_run_in_subprocess(src, name, True),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    result = measure_import(Path(sys.argv[1]), sys.argv[2], bool(int(sys.argv[3])))
+    print(json.dumps(result))
@@ -0,0 +1,309 @@
+"""
+Load generator for gateways and data sources serving the data products.
+
+In the closed-loop mode a fixed number of connections each send the next request as
+soon as the previous response arrives. In the open-loop mode requests are sent at a
+fixed rate regardless of how fast the responses arrive, and the latency is measured
+from the time each request was scheduled, so a stalling server can't hide its latency
+by slowing down the requests (coordinated omission).
+
+With conditional requests the ETag of the last response to each request body is sent
+back in If-None-Match, like a client polling for changes, and the 304 responses are
+counted.
+"""
+import asyncio
+import json
+import ssl
+from dataclasses import dataclass, field
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from tooling.bench.histogram import Histogram
+from tooling.payloads import example_payload, model_schema
+from tooling.registry import DefinitionRegistry
+from tooling.synth import Synthesizer
+
+
+class ProtocolError(ValueError):
+    """
+    A response that isn't valid HTTP/1.1, e.g. with a malformed status line
+    """
+
+
+# Errors of a request that never got a valid response
+CONNECTION_ERRORS = (
+    OSError,
+    asyncio.IncompleteReadError,
+    asyncio.LimitOverrunError,
+    ProtocolError,
+)
+# Status codes of responses that never have a body
+BODYLESS_STATUSES = (204, 304)
+
+
+def request_bodies(
+    registry: DefinitionRegistry, name: str, body: str, count: int, seed: int
+) -> List[bytes]:
+    """
+    Build request bodies for a definition from its request model, either the example
+    payload or count synthesized payloads
+    """
+    model = registry[name].request
+    if body == "example":
+        payloads = [example_payload(model)]
+    else:
+        schema = model_schema(model)
+        generate = Synthesizer(schema.get("$defs", {})).compile(schema)
+        rng = Random(seed)
+        payloads = [generate(rng) for _ in range(count)]
+    return [json.dumps(p, separators=(",", ":")).encode("utf-8") for p in payloads]
+
+
+@dataclass
+class Target:
+    path: str
+    bodies: List[bytes]
+    histogram: Histogram = field(default_factory=Histogram)
+    requests: int = 0
+    # Number of failed requests by status code or exception name
+    errors: Dict[str, int] = field(default_factory=dict)
+    not_modified: int = 0
+    response_bytes: int = 0
+    # ETag of the last response to each request body
+    etags: Dict[bytes, str] = field(default_factory=dict)
+
+    def add_error(self, key: str) -> None:
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+
+class Connection:
+    """
+    HTTP/1.1 keep-alive connection, opened on first use and reopened after errors
+    """
+
+    def __init__(self, url: str, headers: Dict[str, str]):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.prefix = parts.path.rstrip("/")
+        self.headers = "".join(
+            f"{name}: {value}\r\n"
+            for name, value in {
+                "host": parts.netloc,
+                "content-type": "application/json",
+                **headers,
+            }.items()
+        )
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    def close(self) -> None:
+        if self.writer:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(
+        self, path: str, body: bytes, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], int]:
+        """
+        Send a POST request and read the whole response.
+
+        :param headers: Headers to send with this request only
+        :return: Status code, headers and body size of the response
+        :raises ProtocolError: When the response isn't valid HTTP/1.1
+        """
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl
+            )
+        self.writer.write(
+            (
+                f"POST {self.prefix}{path} HTTP/1.1\r\n{self.headers}"
+                + "".join(f"{k}: {v}\r\n" for k, v in (headers or {}).items())
+                + f"content-length: {len(body)}\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or not parts[1].isdigit() or len(parts[1]) != 3:
+            raise ProtocolError(f"Malformed status line {status_line[:100]!r}")
+        status = int(parts[1])
+        headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        size = 0
+        if status in BODYLESS_STATUSES:
+            pass
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            size = await self.read_chunked()
+        elif "content-length" in headers:
+            try:
+                size = int(headers["content-length"])
+            except ValueError:
+                raise ProtocolError("Invalid Content-Length") from None
+            await self.reader.readexactly(size)
+        else:
+            size = len(await self.reader.read())
+            headers["connection"] = "close"
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, headers, size
+
+    async def read_chunked(self) -> int:
+        """
+        Read a chunked body and the trailers after it
+
+        :return: Size of the body
+        """
+        total = 0
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            try:
+                size = int(line.split(b";")[0], 16)
+            except ValueError:
+                raise ProtocolError("Invalid chunk size") from None
+            if not size:
+                break
+            await self.reader.readexactly(size + 2)
+            total += size
+        while await self.reader.readuntil(b"\r\n") != b"\r\n":
+            pass
+        return total
+
+
+class LoadGenerator:
+    """
+    :param url: Base URL of the gateway or data source, the paths of the data products
+        are appended to it
+    :param targets: Data products to send requests to, picked randomly per request
+    :param headers: Extra headers to send with each request, e.g. authorization
+    :param conditional: Send the ETags of previous responses in If-None-Match
+    """
+
+    def __init__(
+        self,
+        url: str,
+        targets: List[Target],
+        headers: Optional[Dict[str, str]] = None,
+        seed: Optional[int] = None,
+        conditional: bool = False,
+    ):
+        self.url = url
+        self.targets = targets
+        self.headers = headers or {}
+        self.rng = Random(seed)
+        self.conditional = conditional
+
+    def connection(self) -> Connection:
+        return Connection(self.url, self.headers)
+
+    async def send(
+        self, connection: Connection, target: Target, start: Optional[float] = None
+    ) -> None:
+        """
+        Send one request to a target and record its latency. In the open-loop mode
+        start is the time the request was scheduled to be sent.
+        """
+        start = start or perf_counter()
+        body = self.rng.choice(target.bodies)
+        etag = target.etags.get(body) if self.conditional else None
+        try:
+            status, headers, size = await connection.request(
+                target.path, body, {"if-none-match": etag} if etag else None
+            )
+        except CONNECTION_ERRORS as e:
+            connection.close()
+            target.add_error(type(e).__name__)
+            return
+        target.histogram.record((perf_counter() - start) * 1_000_000)
+        target.requests += 1
+        target.response_bytes += size
+        if status >= 400:
+            target.add_error(str(status))
+        elif status == 304:
+            target.not_modified += 1
+        if self.conditional and "etag" in headers:
+            target.etags[body] = headers["etag"]
+
+    async def run_closed_loop(self, concurrency: int, duration: float) -> float:
+        """
+        :return: Elapsed time in seconds
+        """
+        start = perf_counter()
+        end = start + duration
+
+        async def worker() -> None:
+            connection = self.connection()
+            while perf_counter() < end:
+                await self.send(connection, self.rng.choice(self.targets))
+            connection.close()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return perf_counter() - start
+
+    async def run_open_loop(
+        self, rate: float, duration: float, max_connections: int
+    ) -> float:
+        """
+        :return: Elapsed time in seconds
+        """
+        idle: List[Connection] = []
+        semaphore = asyncio.Semaphore(max_connections)
+
+        async def scheduled_request(target: Target, scheduled: float) -> None:
+            async with semaphore:
+                connection = idle.pop() if idle else self.connection()
+                await self.send(connection, target, scheduled)
+                idle.append(connection)
+
+        tasks = set()
+        start = perf_counter()
+        for i in range(int(rate * duration)):
+            scheduled = start + i / rate
+            delay = scheduled - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(
+                scheduled_request(self.rng.choice(self.targets), scheduled)
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+        for connection in idle:
+            connection.close()
+        return perf_counter() - start
+
+    def results(self, elapsed: float) -> Dict[str, dict]:
+        """
+        Summarize the results of each path and the total, with latencies in
+        milliseconds
+        """
+        total = Target(path="total", bodies=[])
+        paths = {}
+        for target in sorted(self.targets, key=lambda t: t.path):
+            total.histogram.merge(target.histogram)
+            total.requests += target.requests
+            total.not_modified += target.not_modified
+            total.response_bytes += target.response_bytes
+            for key, count in target.errors.items():
+                total.errors[key] = total.errors.get(key, 0) + count
+            paths[target.path] = target
+        return {
+            path: {
+                "requests": target.requests,
+                "throughput_per_s": round(target.requests / elapsed, 1),
+                "errors": dict(sorted(target.errors.items())),
+                "not_modified": target.not_modified,
+                "response_bytes": target.response_bytes,
+                "latency_ms": target.histogram.summary(scale=1000),
+            }
+            for path, target in {**paths, "total": total}.items()
+        }
@@ -0,0 +1,260 @@
+"""
+Boot time and memory of a gateway building the routes of the specs.
+
+The gateway turns every spec into a FastAPI route with openapi-to-fastapi: the spec is
+validated, pydantic models are generated from its component schemas with
+datamodel-code-generator and imported, and the route is built with the models. Each
+step is timed per spec, and with tracemalloc the memory the route keeps and the peak
+memory while building it. The routes are built in a fresh interpreter, after the
+libraries are imported, so only the cost of the specs counts. As tracemalloc slows the
+build down several times, the memory is measured in a separate interpreter from the
+times.
+
+To see how the boot time scales with the number of definitions, the specs can be
+replicated under other paths, e.g. /scale1/AirQuality/Current_v1.0, up to a number of
+definitions.
+"""
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from tooling.schema import iter_specs, load_spec
+
+MIB = 1024 * 1024
+
+
+class PhaseTimer:
+    """
+    Time the calls of library functions as phases of building a route
+    """
+
+    def __init__(self):
+        self.times: Dict[str, float] = defaultdict(float)
+
+    def wrap(self, owner: Any, name: str, phase: str) -> None:
+        original = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.times[phase] += perf_counter() - start
+
+        setattr(owner, name, timed)
+
+    def take(self) -> Dict[str, float]:
+        """
+        Get the times of the phases since the last call
+        """
+        times = dict(self.times)
+        self.times.clear()
+        return times
+
+
+def max_rss() -> int:
+    """
+    Peak resident memory of the process in bytes
+    """
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB and macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def replicate_specs(
+    root: Path, dest: Path, definitions: Optional[int]
+) -> Tuple[List[Tuple[str, Path]], int]:
+    """
+    Get the specs under root, replicated to dest as many times as needed for the
+    number of definitions. The paths of the nth copy are prefixed with /scale{n}.
+
+    :return: Names and files of the definitions, the original ones first, and the
+        number of original definitions
+    """
+    originals = []
+    for path in iter_specs(root):
+        spec = load_spec(path)
+        if "paths" in spec:
+            originals.append((path.relative_to(root).with_suffix("").as_posix(), spec))
+    specs = [(name, root / f"{name}.json") for name, _ in originals]
+    if definitions is None or not originals:
+        return specs, len(specs)
+
+    copy = 1
+    while len(specs) < definitions:
+        for name, spec in originals[: definitions - len(specs)]:
+            paths = {f"/scale{copy}{p}": item for p, item in spec["paths"].items()}
+            out_file = dest / f"scale{copy}" / f"{name}.json"
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            out_file.write_text(json.dumps({**spec, "paths": paths}), encoding="utf-8")
+            specs.append((f"scale{copy}/{name}", out_file))
+        copy += 1
+    return specs[:definitions], len(originals)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def build_route(
+    app: Any, path: Path, timer: PhaseTimer, trace_memory: bool
+) -> Dict[str, float]:
+    """
+    Build the route of a spec into the app and measure it
+    """
+    from openapi_to_fastapi.routes import SpecRouter
+
+    if trace_memory:
+        # Don't count the garbage of the previous specs
+        gc.collect()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+    start = perf_counter()
+    try:
+        spec_router = SpecRouter(path)
+        parsed = perf_counter()
+        app.include_router(spec_router.to_fastapi_router())
+        end = perf_counter()
+    finally:
+        times = timer.take()
+
+    result = {
+        "bytes": path.stat().st_size,
+        "validate_ms": _ms(times.get("validate", 0.0)),
+        "generate_ms": _ms(times.get("generate", 0.0)),
+        "import_ms": _ms(times.get("models", 0.0) - times.get("generate", 0.0)),
+        "route_ms": _ms(end - parsed),
+        "total_ms": _ms(end - start),
+    }
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        result["retained_kb"] = round((current - before) / 1024, 1)
+        result["peak_kb"] = round((peak - before) / 1024, 1)
+    return result
+
+
+def measure_routes(
+    root: Path, definitions: Optional[int] = None, trace_memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Build the routes of the specs into one app, like the gateway does at boot. Should
+    be run in a fresh interpreter.
+    """
+    start = perf_counter()
+    from fastapi import FastAPI
+    from openapi_to_fastapi import model_generator, routes
+    from openapi_to_fastapi.validator.core import DefaultValidator
+
+    import_time = perf_counter() - start
+
+    timer = PhaseTimer()
+    timer.wrap(DefaultValidator, "validate", "validate")
+    timer.wrap(routes, "load_models", "models")
+    timer.wrap(model_generator, "generate_model_from_schema", "generate")
+
+    app = FastAPI()
+    results: Dict[str, Dict[str, float]] = {}
+    errors: Dict[str, str] = {}
+    failed = 0
+    scale = []
+    with tempfile.TemporaryDirectory() as tmp:
+        specs, originals = replicate_specs(root, Path(tmp), definitions)
+        if trace_memory:
+            tracemalloc.start()
+        boot_start = perf_counter()
+        for i, (name, path) in enumerate(specs, 1):
+            try:
+                result = build_route(app, path, timer, trace_memory)
+            except Exception as e:
+                failed += 1
+                if i <= originals:
+                    errors[name] = f"{type(e).__name__}: {e}"
+            else:
+                if i <= originals:
+                    results[name] = result
+            # Checkpoints after each copy of the tree show how the boot time grows
+            if i % originals == 0 or i == len(specs):
+                checkpoint = {
+                    "definitions": i,
+                    "boot_ms": _ms(perf_counter() - boot_start),
+                    "max_rss_mb": round(max_rss() / MIB, 1),
+                }
+                if trace_memory:
+                    traced = tracemalloc.get_traced_memory()[0]
+                    checkpoint["traced_mb"] = round(traced / MIB, 1)
+                scale.append(checkpoint)
+        boot_time = perf_counter() - boot_start
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {
+        "totals": {
+            "definitions": len(specs),
+            "failed": failed,
+            "routes": len(app.routes),
+            "library_import_ms": _ms(import_time),
+            "boot_ms": _ms(boot_time),
+            "max_rss_mb": round(max_rss() / MIB, 1),
+        },
+        "specs": results,
+        "errors": errors,
+        "scale": scale,
+    }
+
+
+def _run_in_subprocess(
+    root: Path, definitions: Optional[int], trace_memory: bool
+) -> Dict[str, Any]:
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tooling.bench.routes",
+            str(root.resolve()),
+            str(definitions or 0),
+            str(int(trace_memory)),
+        ],
+        cwd=root.resolve().parent,
+        check=True,
+        capture_output=True,
+        encoding="utf-8",
+    )
+    return json.loads(completed_process.stdout)
+
+
+def run_routes_benchmark(
+    root: Path, definitions: Optional[int] = None, trace_memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Build the routes of the specs in a fresh interpreter, and with trace_memory again
+    in another one to measure the memory
+    """
+    results = _run_in_subprocess(root, definitions, False)
+    if trace_memory:
+        traced = _run_in_subprocess(root, definitions, True)
+        for name, result in results["specs"].items():
+            memory = traced["specs"].get(name, {})
+            for key in ("retained_kb", "peak_kb"):
+                if key in memory:
+                    result[key] = memory[key]
+        for checkpoint, memory in zip(results["scale"], traced["scale"]):
+            checkpoint["traced_mb"] = memory["traced_mb"]
+    return results
+
+
+if __name__ == "__main__":
+    result = measure_routes(
+        Path(sys.argv[1]), int(sys.argv[2]) or None, bool(int(sys.argv[3]))
+    )
+    print(json.dumps(result))
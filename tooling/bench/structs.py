@@ -0,0 +1,192 @@
+"""
+Equivalence and cost of the struct mirrors of the definition models.
+
+The structs of a definition have to decode the example payloads and synthesized
+payloads the pydantic models accept, and encode them back to payloads that the models
+decode to the same values. They also have to reject the payloads with one string
+replaced by a value breaking its format that the models reject. The benchmark measures the memory per decoded instance and
+the decode and encode throughput of the structs and the pydantic models.
+"""
+import copy
+import json
+import tracemalloc
+from random import Random
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from tooling.bench.validation import throughput
+from tooling.payloads import example_payload, model_schema
+from tooling.registry import DefinitionRegistry
+from tooling.structs import compile_structs, nested_models
+from tooling.synth import Synthesizer
+
+# Number of instances kept alive to measure the memory per instance
+MEMORY_INSTANCES = 1000
+# Strings breaking the date, date-time and email formats
+INVALID_STRINGS = ["", "not-a-date", "2024-13-45", "a@b"]
+
+
+def string_mutations(payload: Any) -> Iterator[Any]:
+    """
+    Iterate over copies of a payload with one string replaced by an invalid string
+    """
+    stack: List[tuple] = [()]
+    while stack:
+        path = stack.pop()
+        value = payload
+        for key in path:
+            value = value[key]
+        if isinstance(value, dict):
+            stack.extend((*path, key) for key in reversed(list(value)))
+        elif isinstance(value, list):
+            stack.extend((*path, i) for i in reversed(range(len(value))))
+        elif isinstance(value, str) and path:
+            for replacement in INVALID_STRINGS:
+                mutated = copy.deepcopy(payload)
+                parent = mutated
+                for key in path[:-1]:
+                    parent = parent[key]
+                parent[path[-1]] = replacement
+                yield mutated
+
+
+def check_equivalence(
+    registry: DefinitionRegistry, name: str, backend: str, payloads: int, seed: int
+) -> List[Dict[str, Any]]:
+    """
+    Compare the structs of a definition with its pydantic models.
+
+    :return: The payloads for which they differ, with a description of the difference
+    """
+    definition = registry[name]
+    module = compile_structs(name, definition.request, definition.response, backend)
+    rng = Random(seed)
+    mismatches = []
+    for model in (definition.request, definition.response):
+        struct_type = getattr(module, model.__name__)
+        schema = model_schema(model)
+        generate = Synthesizer(schema.get("$defs", {})).compile(schema)
+        valid = [
+            example_payload(model, 1),
+            example_payload(model, 3),
+            *(generate(rng) for _ in range(payloads)),
+        ]
+        candidates = [*valid, *string_mutations(valid[0])]
+        for payload in candidates:
+            problem = _compare(model, struct_type, module, payload)
+            if problem:
+                mismatches.append(
+                    {"model": model.__name__, "payload": payload, "problem": problem}
+                )
+    return mismatches
+
+
+def _compare(
+    model: Type[BaseModel], struct_type: type, module: Any, payload: Any
+) -> Optional[str]:
+    data = json.dumps(payload).encode("utf-8")
+    try:
+        instance = model.model_validate_json(data)
+    except ValidationError:
+        instance = None
+    try:
+        struct = module.decode(data, struct_type)
+    except module.ValidationError as e:
+        if instance is not None:
+            return f"The struct rejects a valid payload: {e}"
+        return None
+    if instance is None:
+        return "The struct accepts a payload the model rejects"
+
+    encoded = module.encode(struct)
+    if module.decode(encoded, struct_type) != struct:
+        return "The struct changes when encoded and decoded again"
+    wire = json.loads(encoded)
+    # Fields with their default value can be left out
+    if not set(wire) <= set(instance.model_dump(by_alias=True)):
+        return f"The struct encodes the fields {sorted(wire)}"
+    if model.model_validate(wire) != instance:
+        return "The model decodes the encoded struct to a different value"
+    return None
+
+
+def memory_per_instance(decode: Any) -> float:
+    """
+    Measure the memory in bytes taken by each value returned by decode, including
+    the values nested in it
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [decode() for _ in range(MEMORY_INSTANCES)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del instances
+    return (after - before) / MEMORY_INSTANCES
+
+
+def benchmark_struct(
+    model: Type[BaseModel],
+    struct_type: type,
+    module: Any,
+    list_size: int,
+    min_time: float,
+) -> Dict[str, float]:
+    data = json.dumps(example_payload(model, list_size)).encode("utf-8")
+    instance = model.model_validate_json(data)
+    struct = module.decode(data, struct_type)
+    return {
+        "payload_bytes": len(data),
+        "model_bytes": round(
+            memory_per_instance(lambda: model.model_validate_json(data))
+        ),
+        "struct_bytes": round(
+            memory_per_instance(lambda: module.decode(data, struct_type, False))
+        ),
+        "model_decode_per_s": round(
+            throughput(lambda: model.model_validate_json(data), min_time), 1
+        ),
+        "struct_decode_per_s": round(
+            throughput(lambda: module.decode(data, struct_type), min_time), 1
+        ),
+        "struct_trusted_decode_per_s": round(
+            throughput(lambda: module.decode(data, struct_type, False), min_time), 1
+        ),
+        "model_encode_per_s": round(
+            throughput(lambda: instance.model_dump_json(by_alias=True), min_time), 1
+        ),
+        "struct_encode_per_s": round(
+            throughput(lambda: module.encode(struct), min_time), 1
+        ),
+    }
+
+
+def run_structs_benchmark(
+    registry: DefinitionRegistry,
+    names: List[str],
+    models: Optional[List[str]],
+    backend: str,
+    list_size: int,
+    min_time: float,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Benchmark the structs of the models of the definitions, and the models nested in
+    them, or only the models with the given names
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in names:
+        definition = registry[name]
+        module = compile_structs(name, definition.request, definition.response, backend)
+        found = {
+            **nested_models(definition.request),
+            **nested_models(definition.response),
+        }
+        for model_name, model in found.items():
+            if models and model_name not in models:
+                continue
+            results.setdefault(name, {})[model_name] = benchmark_struct(
+                model, getattr(module, model_name), module, list_size, min_time
+            )
+    return results
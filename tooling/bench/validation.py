@@ -0,0 +1,108 @@
+"""
+Validation and serialization throughput benchmark of the request and response models.
+
+The payloads are built from the examples of the fields, with every list filled with
+list_size items so the cost of list-heavy models shows up.
+"""
+import json
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Type
+
+from pydantic import BaseModel
+
+from tooling.payloads import example_payload, model_schema
+from tooling.registry import DefinitionRegistry
+
+OPERATIONS = ["validate_python", "validate_json", "dump_python", "dump_json"]
+
+
+def throughput(func: Callable[[], Any], min_time: float) -> float:
+    """
+    Call func repeatedly for at least min_time seconds and return the calls per second
+    """
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            return number / elapsed
+        number *= 2
+
+
+def count_object_lists(schema: dict) -> int:
+    """
+    Count the fields of a model schema, including nested models, that are lists of
+    objects
+    """
+    count = 0
+    schemas = [schema, *schema.get("$defs", {}).values()]
+    for model in schemas:
+        for prop in model.get("properties", {}).values():
+            options = prop.get("anyOf", [prop])
+            for option in options:
+                items = option.get("items", {})
+                if option.get("type") == "array" and "$ref" in items:
+                    count += 1
+    return count
+
+
+def benchmark_model(
+    model: Type[BaseModel], list_size: int, min_time: float
+) -> Dict[str, float]:
+    payload = example_payload(model, list_size)
+    data = json.dumps(payload).encode("utf-8")
+    instance = model.model_validate(payload)
+    operations = {
+        "validate_python": lambda: model.model_validate(payload),
+        "validate_json": lambda: model.model_validate_json(data),
+        "dump_python": lambda: instance.model_dump(by_alias=True),
+        "dump_json": lambda: instance.model_dump_json(by_alias=True),
+    }
+    result = {
+        "model": model.__name__,
+        "payload_bytes": len(data),
+        "object_lists": count_object_lists(model_schema(model)),
+    }
+    for operation in OPERATIONS:
+        result[f"{operation}_per_s"] = round(
+            throughput(operations[operation], min_time), 1
+        )
+    return result
+
+
+def run_validation_benchmark(
+    registry: DefinitionRegistry, names: List[str], list_size: int, min_time: float
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results = {}
+    for name in names:
+        definition = registry[name]
+        results[name] = {
+            "request": benchmark_model(definition.request, list_size, min_time),
+            "response": benchmark_model(definition.response, list_size, min_time),
+        }
+    return results
+
+
+def compare_results(
+    old: Dict[str, Dict[str, Dict[str, float]]],
+    new: Dict[str, Dict[str, Dict[str, float]]],
+) -> List[List[Any]]:
+    """
+    Compare the throughputs of two benchmark runs.
+
+    :return: Rows of definition, model, operation, old and new throughput and the
+        ratio of new to old
+    """
+    rows = []
+    for name in sorted(set(old) & set(new)):
+        for kind in ("request", "response"):
+            for operation in OPERATIONS:
+                key = f"{operation}_per_s"
+                before = old[name][kind][key]
+                after = new[name][kind][key]
+                rows.append(
+                    [name, kind, operation, before, after, round(after / before, 2)]
+                )
+    return rows
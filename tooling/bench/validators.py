@@ -0,0 +1,214 @@
+"""
+Conformance and throughput of the generated validators.
+
+The generated validators of each spec have to accept the example payloads and random
+payloads synthesized from the schemas, and report exactly the same errors as the
+generic schema checker for invalid payloads made by replacing or removing one value of
+a valid payload at a time. Every payload is also cross-checked with jsonschema, a
+standard JSON Schema implementation, which has to find the same payloads invalid. The
+throughput is compared with jsonschema and the schema checker.
+
+Date-times are checked like the models of the gateway check them, allowing a missing
+UTC offset, where jsonschema requires one as in RFC 3339.
+"""
+import copy
+import json
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from tooling.bench.validation import throughput
+from tooling.checker import FORMATS, SchemaChecker
+from tooling.code_lists import code_list_of
+from tooling.codegen import compile_validators
+from tooling.payloads import ExampleBuilder
+from tooling.schema import component_schemas, get_operation
+from tooling.synth import Synthesizer
+
+# Values that break the type or the constraints of most fields
+INVALID_VALUES = [None, True, -(10**12), 1.5, "", "x" * 5000, "not-a-date", [], {}]
+
+
+def _paths(value: Any, path: Tuple[Any, ...] = ()) -> Iterator[Tuple[Any, ...]]:
+    yield path
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _paths(item, (*path, key))
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            yield from _paths(item, (*path, i))
+
+
+def mutations(payload: Any) -> Iterator[Any]:
+    """
+    Iterate over copies of a payload with one value replaced by an invalid value or,
+    for properties of objects, removed
+    """
+    for path in _paths(payload):
+        for replacement in [*INVALID_VALUES, KeyError]:
+            if not path:
+                if replacement is KeyError:
+                    continue
+                yield replacement
+                continue
+            mutated = copy.deepcopy(payload)
+            parent = mutated
+            for key in path[:-1]:
+                parent = parent[key]
+            if replacement is KeyError:
+                if not isinstance(parent, dict):
+                    continue
+                del parent[path[-1]]
+            else:
+                parent[path[-1]] = replacement
+            yield mutated
+
+
+def with_code_list_enums(value: Any) -> Any:
+    """
+    Get a copy of a schema with the values of the code lists it references as enums
+    """
+    if isinstance(value, dict):
+        result = {k: with_code_list_enums(v) for k, v in value.items()}
+        code_list = code_list_of(value)
+        if code_list is not None:
+            result["enum"] = list(code_list.values)
+        return result
+    if isinstance(value, list):
+        return [with_code_list_enums(item) for item in value]
+    return value
+
+
+def json_schema_validator(definitions: Dict[str, dict], schema: dict) -> Any:
+    """
+    Get a jsonschema validator of a schema referencing the component schemas of a spec
+    """
+    from jsonschema import Draft202012Validator, FormatChecker
+
+    def valid_date_time(value: Any) -> bool:
+        # Like the standard checks, only strings are checked
+        return not isinstance(value, str) or FORMATS["date-time"](value)
+
+    format_checker = FormatChecker(list(FormatChecker.checkers))
+    format_checker.checks("date-time")(valid_date_time)
+    document = {
+        **schema,
+        "components": {"schemas": with_code_list_enums(definitions)},
+    }
+    return Draft202012Validator(document, format_checker=format_checker)
+
+
+def check_conformance(
+    spec: dict, payloads: int, max_mutations: int, seed: int
+) -> List[Dict[str, Any]]:
+    """
+    Compare the generated validators of a spec with the schema checker and jsonschema.
+
+    :return: The payloads for which they disagree, with the errors of the generated
+        validators and of the reference they disagree with
+    """
+    definitions = component_schemas(spec)
+    operation = get_operation(spec)
+    checker = SchemaChecker(definitions)
+    validators = compile_validators(spec)
+    rng = Random(seed)
+    mismatches = []
+    for kind, body in (
+        ("request", operation["requestBody"]),
+        ("response", operation["responses"]["200"]),
+    ):
+        schema = body["content"]["application/json"]["schema"]
+        validate = validators[f"validate_{kind}"]
+        reference = json_schema_validator(definitions, schema)
+        generate = Synthesizer(definitions).compile(schema)
+        valid = [
+            ExampleBuilder(definitions, 1).build(schema),
+            ExampleBuilder(definitions, 3).build(schema),
+            *(generate(rng) for _ in range(payloads)),
+        ]
+        invalid = [m for payload in valid for m in mutations(payload)]
+        if len(invalid) > max_mutations:
+            invalid = rng.sample(invalid, max_mutations)
+        for i, payload in enumerate(valid + invalid):
+            expected = checker.errors(schema, payload, ("body",))
+            got = validate(payload, ("body",))
+            if got != expected or (i < len(valid) and got):
+                mismatches.append(
+                    {
+                        "kind": kind,
+                        "reference": "checker",
+                        "payload": payload,
+                        "expected": expected,
+                        "errors": got,
+                    }
+                )
+            reference_errors = [e.message for e in reference.iter_errors(payload)]
+            if bool(got) != bool(reference_errors):
+                mismatches.append(
+                    {
+                        "kind": kind,
+                        "reference": "jsonschema",
+                        "payload": payload,
+                        "expected": reference_errors,
+                        "errors": got,
+                    }
+                )
+    return mismatches
+
+
+def benchmark_validators(
+    spec: dict, list_size: int, min_time: float
+) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the throughput of the generated validators, jsonschema and the schema
+    checker with the example payloads of a spec
+    """
+    definitions = component_schemas(spec)
+    operation = get_operation(spec)
+    checker = SchemaChecker(definitions)
+    validators = compile_validators(spec)
+    results = {}
+    for kind, body in (
+        ("request", operation["requestBody"]),
+        ("response", operation["responses"]["200"]),
+    ):
+        schema = body["content"]["application/json"]["schema"]
+        payload = ExampleBuilder(definitions, list_size).build(schema)
+        validate: Callable[[Any], List[dict]] = validators[f"validate_{kind}"]
+        reference = json_schema_validator(definitions, schema)
+        generated = throughput(lambda: validate(payload), min_time)
+        standard = throughput(lambda: list(reference.iter_errors(payload)), min_time)
+        generic = throughput(lambda: checker.errors(schema, payload), min_time)
+        results[kind] = {
+            "payload_bytes": len(json.dumps(payload).encode("utf-8")),
+            "generated_per_s": round(generated, 1),
+            "jsonschema_per_s": round(standard, 1),
+            "checker_per_s": round(generic, 1),
+            # Speedup over jsonschema, and over the schema checker
+            "speedup": round(generated / standard, 2),
+            "checker_speedup": round(generated / generic, 2),
+        }
+    return results
+
+
+def run_validators_benchmark(
+    specs: Dict[str, dict],
+    list_size: int,
+    min_time: float,
+    payloads: int,
+    max_mutations: int,
+    seed: int,
+) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Check the conformance of the generated validators and benchmark them.
+
+    :param specs: Specs by definition name
+    :return: Benchmark results and conformance mismatches by definition name
+    """
+    results = {}
+    mismatches = {}
+    for name, spec in specs.items():
+        found = check_conformance(spec, payloads, max_mutations, seed)
+        if found:
+            mismatches[name] = found
+        results[name] = benchmark_validators(spec, list_size, min_time)
+    return results, mismatches
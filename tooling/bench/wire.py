@@ -0,0 +1,72 @@
+"""
+Size and cost of the content types of the data products.
+
+Example payloads of the request and the response of each definition are encoded with
+the codec of each content type, checked to decode back to the same value, and measured
+for their encoded size and encode and decode throughput. The parse time includes
+validating the decoded value with the pydantic model, as a data product would.
+"""
+from typing import Dict, List, Type
+
+from pydantic import BaseModel
+
+from tooling.bench.validation import throughput
+from tooling.codecs import CODECS, JSON
+from tooling.payloads import example_payload
+from tooling.registry import DefinitionRegistry
+
+
+class RoundTripError(Exception):
+    pass
+
+
+def benchmark_codecs(
+    model: Type[BaseModel], content_types: List[str], list_size: int, min_time: float
+) -> Dict[str, Dict[str, float]]:
+    payload = example_payload(model, list_size)
+    results = {}
+    json_bytes = len(CODECS[JSON].encode(payload))
+    for content_type in content_types:
+        codec = CODECS[content_type]
+        data = codec.encode(payload)
+        if codec.decode(data) != payload:
+            raise RoundTripError(
+                f"{model.__name__} changes when encoded as {content_type}"
+            )
+        results[content_type] = {
+            "bytes": len(data),
+            "saving": round(1 - len(data) / json_bytes, 3),
+            "encode_per_s": round(
+                throughput(lambda: codec.encode(payload), min_time), 1
+            ),
+            "decode_per_s": round(throughput(lambda: codec.decode(data), min_time), 1),
+            "parse_per_s": round(
+                throughput(lambda: model.model_validate(codec.decode(data)), min_time),
+                1,
+            ),
+        }
+    return results
+
+
+def run_wire_benchmark(
+    registry: DefinitionRegistry,
+    names: List[str],
+    content_types: List[str],
+    list_size: int,
+    min_time: float,
+) -> Dict[str, Dict[str, Dict[str, Dict[str, float]]]]:
+    """
+    Benchmark the content types with the request and response of the definitions
+    """
+    content_types = [JSON, *(t for t in content_types if t != JSON)]
+    results: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = {}
+    for name in names:
+        definition = registry[name]
+        results[name] = {
+            kind: benchmark_codecs(model, content_types, list_size, min_time)
+            for kind, model in (
+                ("request", definition.request),
+                ("response", definition.response),
+            )
+        }
+    return results
@@ -0,0 +1,60 @@
+"""
+Catalog of all the data product specs, so consumers can discover the definitions by
+reading a single file and load the specs lazily.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import List
+
+from tooling.schema import get_operation, get_path, iter_specs
+
+CATALOG_VERSION = 1
+# Outside the definitions, as the tools walking them take every JSON file for a spec
+DEFAULT_CATALOG = Path("catalog.json")
+
+
+def header_is_required(operation: dict, name: str) -> bool:
+    for param in operation.get("parameters", []):
+        if param.get("in") == "header" and param.get("name", "").lower() == name:
+            return bool(param.get("required"))
+    return False
+
+
+def catalog_entry(path: Path, root: Path) -> dict:
+    content = path.read_bytes()
+    spec = json.loads(content)
+    operation = get_operation(spec)
+    return {
+        "path": get_path(spec),
+        "file": path.relative_to(root).as_posix(),
+        "version": spec["info"]["version"],
+        "deprecated": bool(operation.get("deprecated", False)),
+        "requires_authorization": header_is_required(operation, "authorization"),
+        "requires_consent": header_is_required(operation, "x-consent-token"),
+        "size": len(content),
+        # Hash of the exact bytes of the file, usable as a strong ETag
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
+
+
+def build_catalog(root: Path) -> List[dict]:
+    return sorted(
+        (catalog_entry(path, root) for path in iter_specs(root)),
+        key=lambda entry: entry["path"],
+    )
+
+
+def write_catalog(root: Path, out_file: Path) -> bool:
+    """
+    Write the catalog of the specs under root if it changed.
+
+    :return: True if the file was written
+    """
+    catalog = {"version": CATALOG_VERSION, "definitions": build_catalog(root)}
+    content = json.dumps(catalog, indent=2) + "\n"
+    if out_file.exists() and out_file.read_text(encoding="utf-8") == content:
+        return False
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_text(content, encoding="utf-8")
+    return True
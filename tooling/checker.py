@@ -0,0 +1,235 @@
+"""
+Validation of JSON values against the JSON schemas of the specs, without the models.
+
+Covers the parts of JSON schema the converter emits: types, required properties,
+enums, ranges, lengths, patterns and date and email formats. Errors are reported in the same
+format as the 422 responses of the data products.
+"""
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from tooling.code_lists import code_list_of
+
+Location = Tuple[Any, ...]
+
+# Python types and pydantic error types of the JSON schema types
+TYPES = {
+    "object": (dict, "dict_type"),
+    "array": (list, "list_type"),
+    "string": (str, "string_type"),
+    "integer": (int, "int_type"),
+    "number": ((int, float), "float_type"),
+    "boolean": (bool, "bool_type"),
+}
+RANGE_MESSAGES = {
+    "greater_than_equal": "greater than or equal to",
+    "greater_than": "greater than",
+    "less_than_equal": "less than or equal to",
+    "less_than": "less than",
+}
+
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _valid_date(value: str) -> bool:
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _valid_date_time(value: str) -> bool:
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+# One @ with something before it and a dotted domain after it, what the EmailStr of the
+# models requires at the least
+EMAIL = re.compile(r"^[^@\s]+@[^@\s.]+(\.[^@\s.]+)+$")
+
+
+def _valid_email(value: str) -> bool:
+    return EMAIL.match(value) is not None
+
+
+FORMATS = {"date": _valid_date, "date-time": _valid_date_time, "email": _valid_email}
+
+
+def error(loc: Location, msg: str, error_type: str) -> dict:
+    return {"loc": list(loc), "msg": msg, "type": error_type}
+
+
+class SchemaChecker:
+    """
+    Check JSON values against JSON schemas.
+
+    :param definitions: Schemas that "$ref" values point to, by name
+    """
+
+    def __init__(self, definitions: Dict[str, dict]):
+        self.definitions = definitions
+
+    def errors(self, schema: dict, value: Any, loc: Location = ()) -> List[dict]:
+        """
+        Get the validation errors of a value, empty when the value is valid
+        """
+        while "$ref" in schema:
+            schema = self.definitions[schema["$ref"].rpartition("/")[2]]
+        if "anyOf" in schema:
+            options = schema["anyOf"]
+            if any(not self.errors(option, value, loc) for option in options):
+                return []
+            # Report the errors of the first option that isn't null, as the null
+            # options only make a field optional
+            reported = next((o for o in options if o.get("type") != "null"), options[0])
+            return self.errors(reported, value, loc)
+        if "allOf" in schema:
+            return [e for s in schema["allOf"] for e in self.errors(s, value, loc)]
+        if "const" in schema and value != schema["const"]:
+            return [error(loc, f"Input should be {schema['const']!r}", "literal_error")]
+        if "enum" in schema and value not in schema["enum"]:
+            expected = ", ".join(repr(v) for v in schema["enum"])
+            return [error(loc, f"Input should be {expected}", "enum")]
+        code_list = code_list_of(schema)
+        if code_list and (
+            not isinstance(value, str) or value not in code_list.value_set
+        ):
+            expected = ", ".join(repr(v) for v in code_list.values)
+            return [error(loc, f"Input should be {expected}", "enum")]
+
+        schema_type = schema.get("type")
+        if schema_type is None:
+            return []
+        if schema_type == "null":
+            if value is None:
+                return []
+            return [error(loc, "Input should be None", "none_required")]
+        expected_type, error_type = TYPES[schema_type]
+        if not isinstance(value, expected_type) or (
+            isinstance(value, bool) and schema_type != "boolean"
+        ):
+            return [error(loc, f"Input should be a valid {schema_type}", error_type)]
+
+        if schema_type == "object":
+            return self._object_errors(schema, value, loc)
+        if schema_type == "array":
+            return self._array_errors(schema, value, loc)
+        if schema_type == "string":
+            return self._string_errors(schema, value, loc)
+        if schema_type in ("integer", "number"):
+            return self._number_errors(schema, value, loc)
+        return []
+
+    def _object_errors(self, schema: dict, value: dict, loc: Location) -> List[dict]:
+        errors = [
+            error((*loc, name), "Field required", "missing")
+            for name in schema.get("required", [])
+            if name not in value
+        ]
+        for name, prop in schema.get("properties", {}).items():
+            if name in value:
+                errors.extend(self.errors(prop, value[name], (*loc, name)))
+        return errors
+
+    def _array_errors(self, schema: dict, value: list, loc: Location) -> List[dict]:
+        errors = []
+        if len(value) < schema.get("minItems", 0):
+            errors.append(
+                error(
+                    loc,
+                    f"List should have at least {schema['minItems']} items",
+                    "too_short",
+                )
+            )
+        if "maxItems" in schema and len(value) > schema["maxItems"]:
+            errors.append(
+                error(
+                    loc,
+                    f"List should have at most {schema['maxItems']} items",
+                    "too_long",
+                )
+            )
+        if schema.get("uniqueItems"):
+            seen = []
+            for item in value:
+                if item in seen:
+                    errors.append(error(loc, "Set items should be unique", "set_type"))
+                    break
+                seen.append(item)
+        items = schema.get("items", {})
+        for i, item in enumerate(value):
+            errors.extend(self.errors(items, item, (*loc, i)))
+        return errors
+
+    @staticmethod
+    def _string_errors(schema: dict, value: str, loc: Location) -> List[dict]:
+        errors = []
+        if len(value) < schema.get("minLength", 0):
+            errors.append(
+                error(
+                    loc,
+                    f"String should have at least {schema['minLength']} characters",
+                    "string_too_short",
+                )
+            )
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            errors.append(
+                error(
+                    loc,
+                    f"String should have at most {schema['maxLength']} characters",
+                    "string_too_long",
+                )
+            )
+        if "pattern" in schema and not compile_regex(schema["pattern"]).search(value):
+            errors.append(
+                error(
+                    loc,
+                    f"String should match pattern '{schema['pattern']}'",
+                    "string_pattern_mismatch",
+                )
+            )
+        check_format = FORMATS.get(schema.get("format"))
+        if check_format and not check_format(value):
+            errors.append(
+                error(
+                    loc,
+                    f"Input should be a valid {schema['format']}",
+                    f"{schema['format'].replace('-', '_')}_parsing",
+                )
+            )
+        return errors
+
+    @staticmethod
+    def _number_errors(schema: dict, value: float, loc: Location) -> List[dict]:
+        checks = [
+            ("minimum", value >= schema.get("minimum", value), "greater_than_equal"),
+            (
+                "exclusiveMinimum",
+                value > schema.get("exclusiveMinimum", value - 1),
+                "greater_than",
+            ),
+            ("maximum", value <= schema.get("maximum", value), "less_than_equal"),
+            (
+                "exclusiveMaximum",
+                value < schema.get("exclusiveMaximum", value + 1),
+                "less_than",
+            ),
+        ]
+        return [
+            error(
+                loc,
+                f"Input should be {RANGE_MESSAGES[error_type]} {schema[key]}",
+                error_type,
+            )
+            for key, valid, error_type in checks
+            if not valid
+        ]
@@ -0,0 +1,1373 @@
+import json
+import os
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional
+
+from definition_tooling.log import print_error, print_table
+from rich import print
+from rich.console import Console
+from typer import Argument, Exit, Option, Typer
+
+from tooling.artifacts import DEFAULT_SIZE_REPORT, build_artifacts
+from tooling.bench import budget_for, load_budgets, over_budget, write_results
+from tooling.catalog import DEFAULT_CATALOG
+from tooling.code_lists import DEFAULT_CODE_LISTS
+from tooling.codecs import BINARY_CONTENT_TYPES, CODECS, JSON
+from tooling.columnar import (
+    DEFAULT_BLOCK_SIZE,
+    response_columns,
+    schema_json,
+    write_arrow_stream,
+    write_parquet,
+)
+from tooling.complexity import METRICS as COMPLEXITY_METRICS
+from tooling.complexity import check_complexity
+from tooling.converter import DEFAULT_MANIFEST, convert_definitions
+from tooling.extensions import content_types
+from tooling.proto import DEFAULT_LOCK as DEFAULT_PROTO_LOCK
+from tooling.proto import export_proto as export_proto_schema
+from tooling.proto import load_lock, save_lock
+from tooling.schema import iter_specs, load_spec
+
+cli = Typer(help="Tooling for the data product definitions in this repository")
+
+
+@cli.callback()
+def main():
+    pass
+
+
+@cli.command()
+def convert(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ...,
+        help="Path to definitions output",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    incremental: bool = Option(
+        False,
+        help="Only convert sources that changed since the last run and remove specs "
+        "of deleted sources",
+    ),
+    manifest: Path = Option(
+        DEFAULT_MANIFEST,
+        help="Path to the manifest used by the incremental mode",
+        dir_okay=False,
+    ),
+    pre_commit: bool = Option(True, help="Run pre-commit hooks on the modified files"),
+    jobs: int = Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of worker processes, 0 to use all CPU cores",
+        min=0,
+    ),
+    timings: bool = Option(False, help="Report conversion times of each definition"),
+    index: Path = Option(
+        DEFAULT_CATALOG,
+        help="Write a catalog of all the specs with their metadata and hashes here",
+        dir_okay=False,
+    ),
+    code_lists: Path = Option(
+        DEFAULT_CODE_LISTS,
+        help="Directory of the artifacts of the code lists referenced by the specs",
+        file_okay=False,
+    ),
+    watch: bool = Option(
+        False,
+        help="Keep running and convert the definitions again whenever their sources "
+        "change",
+    ),
+):
+    """
+    Convert python definitions to OpenAPI specs
+    """
+    if watch:
+        from tooling.watch import watch_definitions
+
+        try:
+            watch_definitions(
+                src,
+                dest,
+                manifest_path=manifest,
+                run_pre_commit=pre_commit,
+                jobs=jobs or os.cpu_count() or 1,
+                show_timings=timings,
+                index_path=index,
+                code_lists_path=code_lists,
+            )
+        except RuntimeError as e:
+            print_error(str(e))
+            raise Exit(code=1)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    should_fail_hook = convert_definitions(
+        src,
+        dest,
+        incremental=incremental,
+        manifest_path=manifest,
+        run_pre_commit=pre_commit,
+        jobs=jobs or os.cpu_count() or 1,
+        show_timings=timings,
+        index_path=index,
+        code_lists_path=code_lists,
+    )
+    raise Exit(code=int(should_fail_hook))
+
+
+@cli.command()
+def split_components(
+    src: Path = Argument(
+        ...,
+        help="Path to the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to the split output", file_okay=False),
+):
+    """
+    Move schemas shared by several specs to a common components document
+    """
+    from tooling.components import split_specs
+
+    size_before, size_after = split_specs(src, dest)
+    print(f"Total size {size_before} -> {size_after} bytes")
+
+
+@cli.command()
+def bundle(
+    src: Path = Argument(
+        ...,
+        help="Path to the split OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to the bundled output", file_okay=False),
+):
+    """
+    Create standalone specs from the output of split-components
+    """
+    from tooling.components import bundle_specs
+
+    bundle_specs(src, dest)
+
+
+@cli.command()
+def artifacts(
+    src: Path = Argument(
+        ...,
+        help="Path to the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to the artifacts output", file_okay=False),
+    report: Path = Option(
+        DEFAULT_SIZE_REPORT, help="Path to the size report", dir_okay=False
+    ),
+):
+    """
+    Create minified, gzip and brotli variants of the specs and a size report
+    """
+    sizes, changed = build_artifacts(src, dest, report)
+    variants = ["raw", "minified", "gzip", "brotli"]
+    totals = [sum(s.get(v, 0) for s in sizes.values()) for v in variants]
+    print_table(["Variant", "Total bytes"], list(zip(variants, totals)))
+    if changed:
+        print(f"Size report written to {report}")
+
+
+@cli.command(name="list")
+def list_definitions(
+    src: Path = Argument(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+):
+    """
+    List the definitions and their metadata without importing them
+    """
+    from tooling.registry import DefinitionRegistry
+
+    registry = DefinitionRegistry(src)
+    rows = []
+    for name in registry:
+        metadata = registry.metadata(name)
+        rows.append(
+            [
+                name,
+                metadata.version,
+                metadata.deprecated,
+                metadata.requires_authorization,
+                metadata.requires_consent,
+            ]
+        )
+    print_table(
+        ["Definition", "Version", "Deprecated", "Authorization", "Consent"], rows
+    )
+
+
+@cli.command()
+def bench_imports(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to benchmark, all by default"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    repeat: int = Option(1, help="Import each definition this many times", min=1),
+    output: Path = Option(
+        Path("build/bench/imports.json"), help="Path to the JSON results"
+    ),
+    budgets: Path = Option(
+        Path("budgets.json"),
+        help="JSON file with the budgets",
+        dir_okay=False,
+        exists=True,
+    ),
+    max_wall_ms: Optional[float] = Option(
+        None, help="Default budget for the import time"
+    ),
+    max_peak_kb: Optional[float] = Option(
+        None, help="Default budget for the peak memory use of the import"
+    ),
+):
+    """
+    Measure the import time, model build time and peak memory of each definition
+    """
+    from tooling.bench.imports import run_import_benchmark
+    from tooling.registry import DefinitionRegistry
+
+    registry = DefinitionRegistry(src)
+    results = run_import_benchmark(src, names or registry.names(), repeat=repeat)
+    write_results(output, {"imports": results})
+
+    import_budgets = load_budgets(budgets, "imports")
+    if max_wall_ms is not None:
+        import_budgets["default"]["wall_ms"] = max_wall_ms
+    if max_peak_kb is not None:
+        import_budgets["default"]["peak_kb"] = max_peak_kb
+
+    failed = {}
+    rows = []
+    for name, result in sorted(results.items(), key=lambda i: -i[1]["wall_ms"]):
+        exceeded = over_budget(result, budget_for(import_budgets, name))
+        if exceeded:
+            failed[name] = exceeded
+        rows.append(
+            [
+                name,
+                result["wall_ms"],
+                result["model_build_ms"],
+                result["models"],
+                result["peak_kb"],
+                ", ".join(exceeded),
+            ]
+        )
+    print_table(
+        ["Definition", "Wall ms", "Models ms", "Models", "Peak KiB", "Over budget"],
+        rows,
+        "red" if failed else None,
+    )
+    print(f"Results written to {output}")
+    if failed:
+        print_error(f"{len(failed)} definitions exceed their budgets")
+        raise Exit(code=1)
+
+
+@cli.command()
+def bench_validation(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to benchmark, all by default"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    list_size: int = Option(10, help="Number of items in each list of the payloads"),
+    min_time: float = Option(0.2, help="Minimum time in seconds per measurement"),
+    output: Path = Option(
+        Path("build/bench/validation.json"), help="Path to the JSON results"
+    ),
+    compare: Optional[Path] = Option(
+        None,
+        help="Earlier results to compare with",
+        dir_okay=False,
+        exists=True,
+    ),
+):
+    """
+    Measure validation and serialization throughput of the request and response models
+    """
+    from tooling.bench.validation import OPERATIONS as VALIDATION_OPERATIONS
+    from tooling.bench.validation import compare_results, run_validation_benchmark
+    from tooling.registry import DefinitionRegistry
+
+    registry = DefinitionRegistry(src)
+    results = run_validation_benchmark(
+        registry, names or registry.names(), list_size=list_size, min_time=min_time
+    )
+    write_results(output, {"list_size": list_size, "validation": results})
+
+    rows = []
+    for name, models in results.items():
+        for result in models.values():
+            rows.append(
+                [
+                    name,
+                    result["model"],
+                    result["payload_bytes"],
+                    result["object_lists"] or "",
+                    *(result[f"{op}_per_s"] for op in VALIDATION_OPERATIONS),
+                ]
+            )
+    # List-heavy models first, as they're the most expensive ones to process
+    rows.sort(key=lambda row: (-(row[3] or 0), row[0]))
+    print_table(
+        ["Definition", "Model", "Bytes", "Object lists"]
+        + [f"{op} /s" for op in VALIDATION_OPERATIONS],
+        rows,
+    )
+    print(f"Results written to {output}")
+
+    if compare:
+        old = json.loads(compare.read_text(encoding="utf-8"))["validation"]
+        print_table(
+            ["Definition", "Model", "Operation", "Before /s", "After /s", "Ratio"],
+            compare_results(old, results),
+        )
+
+
+@cli.command()
+def synth(
+    name: str = Argument(..., help="Definition to generate payloads for"),
+    model: str = Option(
+        "response", help="Model of the definition: request or response"
+    ),
+    schema: Optional[str] = Option(
+        None,
+        help="Generate a model nested in the request or response instead, e.g. "
+        "ChargingHistoryEntry",
+    ),
+    count: int = Option(1000, help="Number of payloads", min=0),
+    seed: int = Option(0, help="Seed of the random generator"),
+    list_min: int = Option(1, help="Minimum number of items in lists", min=0),
+    list_max: int = Option(3, help="Maximum number of items in lists", min=0),
+    optional_probability: float = Option(
+        0.8, help="Probability of including an optional field", min=0, max=1
+    ),
+    null_probability: float = Option(
+        0.1, help="Probability of a nullable field being null", min=0, max=1
+    ),
+    jobs: int = Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of worker processes, 0 to use all CPU cores",
+        min=0,
+    ),
+    validate: bool = Option(False, help="Validate each payload with the model"),
+    output: Path = Option(
+        Path("-"), "--output", "-o", help="Output NDJSON file, - for stdout"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+):
+    """
+    Generate random payloads respecting the constraints of the models as NDJSON
+    """
+    from tooling.payloads import model_schema
+    from tooling.registry import DefinitionRegistry
+    from tooling.synth import Synthesizer, write_ndjson
+
+    definition = DefinitionRegistry(src)[name]
+    model_cls = {"request": definition.request, "response": definition.response}[model]
+    model_json_schema = model_schema(model_cls)
+    definitions = model_json_schema.get("$defs", {})
+    target = definitions[schema] if schema else model_json_schema
+    if schema:
+        model_cls = None
+
+    synthesizer = Synthesizer(
+        definitions,
+        list_range=(list_min, list_max),
+        optional_probability=optional_probability,
+        null_probability=null_probability,
+    )
+    generator = synthesizer.compile(target)
+
+    console = Console(stderr=True)
+    start = perf_counter()
+    out = sys.stdout.buffer if str(output) == "-" else output.open("wb")
+    try:
+        written = write_ndjson(
+            generator,
+            out,
+            count=count,
+            seed=seed,
+            jobs=jobs or os.cpu_count() or 1,
+            validate=model_cls.model_validate_json if validate and model_cls else None,
+        )
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    elapsed = perf_counter() - start
+    console.print(
+        f"Wrote {count} payloads, {written / 1e6:.1f} MB in {elapsed:.1f} s "
+        f"({written / 1e6 / elapsed:.1f} MB/s)"
+    )
+
+
+@cli.command()
+def mock(
+    src: Path = Argument(
+        Path("DataProducts"),
+        help="Path to the OpenAPI specs of the definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    host: str = Option("127.0.0.1", help="Address to listen on"),
+    port: int = Option(8080, help="Port to listen on"),
+    workers: int = Option(
+        0,
+        "--workers",
+        "-w",
+        help="Number of worker processes, 0 to use all CPU cores",
+        min=0,
+    ),
+    settings: Optional[Path] = Option(
+        None,
+        help="JSON file with the latency, error rate and response settings of the "
+        "definitions",
+        dir_okay=False,
+        exists=True,
+    ),
+    seed: Optional[int] = Option(
+        None, help="Seed of the latencies, errors and responses"
+    ),
+):
+    """
+    Serve mock responses for the data products of the specs, for load testing
+    """
+    from tooling.mock import build_routes, load_settings, run_mock_server
+
+    routes = build_routes(src, load_settings(settings))
+    workers = workers or os.cpu_count() or 1
+    print(
+        f"Serving {len(routes)} data products on http://{host}:{port} with "
+        f"{workers} worker(s)"
+    )
+    run_mock_server(routes, host, port, workers, seed)
+
+
+@cli.command()
+def load(
+    url: str = Argument(
+        ..., help="Base URL of the gateway or data source, e.g. http://localhost:8080"
+    ),
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to send requests to, all by default"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    concurrency: int = Option(
+        10, help="Number of connections in the closed-loop mode", min=1
+    ),
+    rate: Optional[float] = Option(
+        None,
+        help="Requests per second, switches to the open-loop mode",
+        min=0.001,
+    ),
+    max_connections: int = Option(
+        1000, help="Maximum number of connections in the open-loop mode", min=1
+    ),
+    duration: float = Option(10.0, help="Duration of the test in seconds"),
+    body: str = Option(
+        "example",
+        help="Request bodies: example for the example payload of the request model, "
+        "synth for synthesized payloads",
+    ),
+    bodies: int = Option(100, help="Number of synthesized request bodies", min=1),
+    header: Optional[List[str]] = Option(
+        None, help='Extra header to send, e.g. "authorization: Bearer ..."'
+    ),
+    seed: int = Option(0, help="Seed of the request bodies and order"),
+    conditional: bool = Option(
+        False,
+        help="Send the ETag of the previous response to the same body in "
+        "If-None-Match, like a client polling for changes",
+    ),
+    output: Path = Option(
+        Path("build/bench/load.json"), help="Path to the JSON results"
+    ),
+):
+    """
+    Send load to a gateway or data source and measure the latency of each data product
+    """
+    import asyncio
+
+    from tooling.bench.load import LoadGenerator, Target, request_bodies
+    from tooling.registry import DefinitionRegistry
+
+    headers = {}
+    for line in header or []:
+        header_name, colon, value = line.partition(":")
+        if not colon or not header_name.strip():
+            print_error(f"Invalid header {line!r}, expected e.g. 'name: value'")
+            raise Exit(code=1)
+        headers[header_name.strip()] = value.strip()
+    registry = DefinitionRegistry(src)
+    targets = [
+        Target(
+            path="/" + name.lstrip("/"),
+            bodies=request_bodies(registry, name, body, bodies, seed),
+        )
+        for name in names or registry.names()
+    ]
+    generator = LoadGenerator(url, targets, headers, seed, conditional)
+    if rate:
+        settings = {"mode": "open", "rate": rate, "max_connections": max_connections}
+        elapsed = asyncio.run(generator.run_open_loop(rate, duration, max_connections))
+    else:
+        settings = {"mode": "closed", "concurrency": concurrency}
+        elapsed = asyncio.run(generator.run_closed_loop(concurrency, duration))
+
+    results = generator.results(elapsed)
+    write_results(
+        output,
+        {
+            "url": url,
+            **settings,
+            "conditional": conditional,
+            "duration_s": round(elapsed, 3),
+            "load": results,
+        },
+    )
+    percentiles = ["p50", "p90", "p99", "p99.9"]
+    print_table(
+        ["Path", "Requests", "Requests /s", "Errors", "304", "MB received"]
+        + [f"{p} ms" for p in percentiles],
+        [
+            [
+                path,
+                result["requests"],
+                result["throughput_per_s"],
+                sum(result["errors"].values()) or "",
+                result["not_modified"] or "",
+                f"{result['response_bytes'] / 1e6:.1f}",
+                *(result["latency_ms"][p] for p in percentiles),
+            ]
+            for path, result in results.items()
+        ],
+    )
+    print(f"Results written to {output}")
+
+
+@cli.command()
+def lint(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to lint, all by default"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    assumed_items: int = Option(
+        100, help="Number of items assumed for lists without a maximum", min=0
+    ),
+    assumed_length: int = Option(
+        1000, help="Length assumed for strings without a maximum", min=0
+    ),
+    output: Path = Option(Path("build/lint.json"), help="Path to the JSON report"),
+    strict: bool = Option(False, help="Exit with an error if anything is flagged"),
+):
+    """
+    Flag performance problems of the definitions and estimate worst-case payload sizes
+    """
+    from tooling.lint import lint_definition, worst_case_size
+    from tooling.registry import DefinitionRegistry
+
+    registry = DefinitionRegistry(src)
+    findings = []
+    sizes = {}
+    for name in names or registry.names():
+        findings.extend(lint_definition(registry, name))
+        definition = registry[name]
+        sizes[name] = {
+            "request": worst_case_size(
+                definition.request, assumed_items, assumed_length
+            ),
+            "response": worst_case_size(
+                definition.response, assumed_items, assumed_length
+            ),
+        }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "assumed_items": assumed_items,
+        "assumed_length": assumed_length,
+        "findings": [finding.__dict__ for finding in findings],
+        "worst_case_sizes": sizes,
+    }
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print_table(
+        ["Definition", "Location", "Rule", "Message"],
+        [[f.definition, f.location, f.rule, f.message] for f in findings],
+    )
+
+    def size_cell(size: dict) -> str:
+        return f"{size['bytes']:,}" + ("" if size["bounded"] else " *")
+
+    print_table(
+        ["Definition", "Request bytes", "Response bytes"],
+        [
+            [name, size_cell(size["request"]), size_cell(size["response"])]
+            for name, size in sorted(
+                sizes.items(), key=lambda item: -item[1]["response"]["bytes"]
+            )
+        ],
+    )
+    print(
+        f"* Sizes using the assumed {assumed_items} list items and {assumed_length} "
+        "characters where the definition has no limit"
+    )
+    print(f"Report written to {output}")
+    if strict and findings:
+        raise Exit(code=1)
+
+
+@cli.command()
+def check_complexity_budgets(
+    src: Path = Argument(
+        Path("DataProducts"),
+        help="Path to the OpenAPI specs of the definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    budgets: Path = Option(
+        Path("budgets.json"),
+        help="JSON file with the complexity budgets",
+        dir_okay=False,
+        exists=True,
+    ),
+):
+    """
+    Check the enum sizes, nesting depth, property count and size of the specs against
+    their budgets
+    """
+    results = check_complexity(src, load_budgets(budgets, "complexity"))
+    print_table(
+        ["Definition", *COMPLEXITY_METRICS],
+        [
+            [
+                name,
+                *(
+                    f"[red]{metrics[m]}[/red]" if m in exceeded else metrics[m]
+                    for m in COMPLEXITY_METRICS
+                ),
+            ]
+            for name, metrics, exceeded in results
+        ],
+    )
+    failed = False
+    for name, _, exceeded in results:
+        for metric, value in exceeded.items():
+            print_error(f"{name}: {metric} {value} exceeds the budget")
+            failed = True
+    if failed:
+        raise Exit(code=1)
+
+
+@cli.command()
+def validate(
+    files: Optional[List[Path]] = Argument(
+        None, help="Spec files to validate, all specs in the root by default"
+    ),
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    jobs: int = Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of worker processes, 0 to use all CPU cores",
+        min=0,
+    ),
+    gateway: Optional[bool] = Option(
+        None,
+        "--gateway/--no-gateway",
+        help="Also build the routes of the specs with openapi-to-fastapi like the "
+        "gateway, by default when it's installed",
+    ),
+):
+    """
+    Validate the OpenAPI specs and the data product definition rules in a single pass
+    """
+    from tooling.validator import select_specs, validate_files
+
+    installed = find_spec("openapi_to_fastapi") is not None
+    if gateway and not installed:
+        print_error("The gateway check requires `pip install openapi-to-fastapi`")
+        raise Exit(code=1)
+    if gateway is None:
+        gateway = installed
+    paths = select_specs(root, files) if files else None
+    passed, failed = 0, 0
+    for path, error in validate_files(
+        paths, root, jobs or os.cpu_count() or 1, gateway
+    ):
+        if error:
+            print_error(f"{path}: {error}")
+            failed += 1
+        else:
+            passed += 1
+
+    print_table(
+        ["Summary", "#"],
+        [["Passed", passed], ["Failed", failed], ["Total", passed + failed]],
+        "green" if not failed else "red",
+    )
+    if failed:
+        raise Exit(code=1)
+
+
+@cli.command()
+def gen_validators(
+    src: Path = Argument(
+        Path("DataProducts"),
+        help="Path to the OpenAPI specs of the definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Option(
+        Path("build/validators"), help="Directory to write the validator modules in"
+    ),
+):
+    """
+    Generate standalone Python validators of the request and response bodies
+    """
+    from tooling.codegen import write_validators
+
+    start = perf_counter()
+    written = write_validators(src, dest)
+    print(
+        f"Generated {len(written)} validators in {dest} in "
+        f"{perf_counter() - start:.2f}s"
+    )
+
+
+@cli.command()
+def bench_validators(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to benchmark, all by default"
+    ),
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    list_size: int = Option(10, help="Number of items in each list of the payloads"),
+    min_time: float = Option(0.2, help="Minimum time in seconds per measurement"),
+    payloads: int = Option(
+        20, help="Number of synthesized payloads to check the conformance with"
+    ),
+    max_mutations: int = Option(
+        500, help="Maximum number of invalid payloads to check per model"
+    ),
+    seed: int = Option(0, help="Seed of the synthesized payloads"),
+    output: Path = Option(
+        Path("build/bench/validators.json"), help="Path to the JSON results"
+    ),
+):
+    """
+    Check that the generated validators report the same errors as the generic schema
+    checker and find the same payloads invalid as jsonschema, and compare their
+    throughput
+    """
+    from tooling.bench.validators import run_validators_benchmark
+
+    if not find_spec("jsonschema"):
+        print_error("The benchmark requires `pip install jsonschema`")
+        raise Exit(code=1)
+    specs = {}
+    for path in iter_specs(root):
+        name = path.relative_to(root).with_suffix("").as_posix()
+        if not names or name in names:
+            spec = load_spec(path)
+            if "paths" in spec:
+                specs[name] = spec
+    results, mismatches = run_validators_benchmark(
+        specs, list_size, min_time, payloads, max_mutations, seed
+    )
+    write_results(output, {"list_size": list_size, "validators": results})
+
+    print_table(
+        [
+            "Definition",
+            "Model",
+            "Bytes",
+            "Generated /s",
+            "jsonschema /s",
+            "Checker /s",
+            "Speedup",
+        ],
+        [
+            [
+                name,
+                kind,
+                result["payload_bytes"],
+                f"{result['generated_per_s']:,.0f}",
+                f"{result['jsonschema_per_s']:,.0f}",
+                f"{result['checker_per_s']:,.0f}",
+                f"{result['speedup']}x",
+            ]
+            for name, kinds in results.items()
+            for kind, result in kinds.items()
+        ],
+    )
+    print(f"Results written to {output}")
+    for name, found in mismatches.items():
+        for mismatch in found[:3]:
+            print_error(
+                f"{name} {mismatch['kind']}: {json.dumps(mismatch['payload'])[:200]}\n"
+                f"  expected {mismatch['expected']} ({mismatch['reference']})\n"
+                f"  got {mismatch['errors']}"
+            )
+    if mismatches:
+        raise Exit(code=1)
+
+
+@cli.command()
+def bench_routes(
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    definitions: Optional[int] = Option(
+        None,
+        help="Replicate the specs up to this many definitions to see how the boot "
+        "time scales",
+        min=1,
+    ),
+    trace_memory: bool = Option(
+        True,
+        help="Measure the memory of each spec with tracemalloc, building the routes "
+        "a second time",
+    ),
+    top: int = Option(10, help="Number of the slowest specs to show", min=1),
+    output: Path = Option(
+        Path("build/bench/routes.json"), help="Path to the JSON results"
+    ),
+):
+    """
+    Measure the time and memory a gateway takes to build the routes and models of the
+    specs with openapi-to-fastapi
+    """
+    from tooling.bench.routes import run_routes_benchmark
+
+    if not find_spec("openapi_to_fastapi"):
+        print_error("The benchmark requires `pip install openapi-to-fastapi`")
+        raise Exit(code=1)
+    results = run_routes_benchmark(root, definitions, trace_memory)
+    write_results(output, {"routes": results})
+
+    specs = sorted(results["specs"].items(), key=lambda i: -i[1]["total_ms"])
+    memory = ["Retained KiB", "Peak KiB"] if trace_memory else []
+    print_table(
+        ["Definition", "KiB", "Generate ms", "Import ms", "Route ms", "Total ms"]
+        + memory,
+        [
+            [
+                name,
+                round(result["bytes"] / 1024, 1),
+                round(result["generate_ms"], 1),
+                round(result["import_ms"], 1),
+                round(result["route_ms"], 1),
+                round(result["total_ms"], 1),
+            ]
+            + ([result["retained_kb"], result["peak_kb"]] if trace_memory else [])
+            for name, result in specs[:top]
+        ],
+    )
+    if definitions:
+        rows = []
+        previous = {"definitions": 0, "boot_ms": 0.0}
+        for checkpoint in results["scale"]:
+            added = checkpoint["definitions"] - previous["definitions"]
+            rows.append(
+                [
+                    checkpoint["definitions"],
+                    round(checkpoint["boot_ms"] / 1000, 2),
+                    round((checkpoint["boot_ms"] - previous["boot_ms"]) / added, 1),
+                    checkpoint["max_rss_mb"],
+                ]
+                + ([checkpoint["traced_mb"]] if trace_memory else [])
+            )
+            previous = checkpoint
+        print_table(
+            ["Definitions", "Boot s", "ms / definition", "Max RSS MiB"]
+            + (["Traced MiB"] if trace_memory else []),
+            rows,
+        )
+    totals = results["totals"]
+    print(
+        f"Built {totals['definitions'] - totals['failed']} of {totals['definitions']} "
+        f"definitions in {totals['boot_ms'] / 1000:.2f} s, after importing the "
+        f"libraries in {totals['library_import_ms']:.0f} ms. Max RSS "
+        f"{totals['max_rss_mb']} MiB."
+    )
+    print(f"Results written to {output}")
+    for name, error in results["errors"].items():
+        print_error(f"{name}: {error}")
+    if totals["failed"]:
+        raise Exit(code=1)
+
+
+@cli.command()
+def gen_structs(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to generate structs for, all by default"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Option(
+        Path("build/structs"), help="Directory to write the struct modules in"
+    ),
+    backend: str = Option(
+        "slots", help="Kind of structs to generate: slots or msgspec"
+    ),
+):
+    """
+    Generate compact struct mirrors of the request and response models
+    """
+    from tooling.registry import DefinitionRegistry
+    from tooling.structs import BACKENDS as STRUCT_BACKENDS
+    from tooling.structs import write_structs
+
+    if backend not in STRUCT_BACKENDS:
+        print_error(f"Unknown backend {backend}")
+        raise Exit(code=1)
+    registry = DefinitionRegistry(src)
+    start = perf_counter()
+    written = write_structs(registry, names or registry.names(), dest, backend)
+    print(
+        f"Generated {len(written)} struct modules in {dest} in "
+        f"{perf_counter() - start:.2f}s"
+    )
+
+
+@cli.command()
+def bench_structs(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to benchmark, all by default"
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    models: Optional[List[str]] = Option(
+        None,
+        "--model",
+        help="Only benchmark the models with this name, e.g. ChargingHistoryEntry",
+    ),
+    backend: str = Option(
+        "slots", help="Kind of structs to benchmark: slots or msgspec"
+    ),
+    list_size: int = Option(10, help="Number of items in each list of the payloads"),
+    min_time: float = Option(0.1, help="Minimum time in seconds per measurement"),
+    payloads: int = Option(
+        20, help="Number of synthesized payloads to check the equivalence with"
+    ),
+    seed: int = Option(0, help="Seed of the synthesized payloads"),
+    output: Path = Option(
+        Path("build/bench/structs.json"), help="Path to the JSON results"
+    ),
+):
+    """
+    Check that the structs round-trip the same payloads as the pydantic models and
+    compare their memory use and decode and encode throughput
+    """
+    from tooling.bench.structs import check_equivalence, run_structs_benchmark
+    from tooling.registry import DefinitionRegistry
+    from tooling.structs import BACKENDS as STRUCT_BACKENDS
+
+    if backend not in STRUCT_BACKENDS:
+        print_error(f"Unknown backend {backend}")
+        raise Exit(code=1)
+    if backend == "msgspec" and not find_spec("msgspec"):
+        print_error("The msgspec backend requires `pip install msgspec`")
+        raise Exit(code=1)
+    registry = DefinitionRegistry(src)
+    names = names or registry.names()
+    mismatches = {}
+    for name in names:
+        found = check_equivalence(registry, name, backend, payloads, seed)
+        if found:
+            mismatches[name] = found
+
+    results = run_structs_benchmark(
+        registry, names, models, backend, list_size, min_time
+    )
+    write_results(
+        output, {"backend": backend, "list_size": list_size, "structs": results}
+    )
+    print_table(
+        [
+            "Definition",
+            "Model",
+            "Bytes",
+            "Model B/instance",
+            "Struct B/instance",
+            "Model decode /s",
+            "Struct decode /s",
+            "Trusted decode /s",
+            "Model encode /s",
+            "Struct encode /s",
+        ],
+        [
+            [
+                name,
+                model,
+                result["payload_bytes"],
+                f"{result['model_bytes']:,}",
+                f"{result['struct_bytes']:,}",
+                f"{result['model_decode_per_s']:,.0f}",
+                f"{result['struct_decode_per_s']:,.0f}",
+                f"{result['struct_trusted_decode_per_s']:,.0f}",
+                f"{result['model_encode_per_s']:,.0f}",
+                f"{result['struct_encode_per_s']:,.0f}",
+            ]
+            for name, found in results.items()
+            for model, result in found.items()
+        ],
+    )
+    print(f"Results written to {output}")
+    for name, found in mismatches.items():
+        for mismatch in found[:3]:
+            print_error(
+                f"{name} {mismatch['model']}: {mismatch['problem']}\n"
+                f"  {json.dumps(mismatch['payload'])[:200]}"
+            )
+    if mismatches:
+        raise Exit(code=1)
+
+
+def _binary_specs(root: Path, names: Optional[List[str]], every: bool) -> dict:
+    """
+    Load the specs with the given names, or the specs declaring binary content types
+    """
+    specs = {}
+    for path in iter_specs(root):
+        name = path.relative_to(root).with_suffix("").as_posix()
+        spec = load_spec(path)
+        if "paths" not in spec:
+            continue
+        if names:
+            if name in names:
+                specs[name] = spec
+        elif every or set(content_types(spec)) & set(BINARY_CONTENT_TYPES):
+            specs[name] = spec
+    return specs
+
+
+@cli.command()
+def export_proto(
+    names: Optional[List[str]] = Argument(
+        None,
+        help="Definitions to export, by default the ones declaring binary content types",
+    ),
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Option(Path("build/proto"), help="Directory to write the schemas in"),
+    lock: Path = Option(DEFAULT_PROTO_LOCK, help="Path to the field numbers lock file"),
+    every: bool = Option(False, "--all", help="Export all the definitions"),
+    check: bool = Option(
+        False,
+        help="Fail if the lock file is missing field numbers or types instead of "
+        "updating it",
+    ),
+):
+    """
+    Export Protocol Buffers schemas of the definitions, keeping the field numbers
+    stable with a lock file
+    """
+    numbering = load_lock(lock)
+    before = json.dumps(numbering, sort_keys=True)
+    specs = _binary_specs(root, names, every)
+    for name, spec in specs.items():
+        path = dest / f"{name}.proto"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        schema = export_proto_schema(spec, name, numbering.setdefault(name, {}))
+        path.write_text(schema, encoding="utf-8")
+    changed = json.dumps(numbering, sort_keys=True) != before
+    print(f"Exported {len(specs)} schemas to {dest}")
+    if changed and check:
+        print_error(
+            f"{lock} is missing field numbers or types, run "
+            "`python -m tooling export-proto` and commit it"
+        )
+        raise Exit(code=1)
+    if changed:
+        save_lock(lock, numbering)
+        print(f"Updated field numbers in {lock}")
+
+
+@cli.command()
+def bench_wire_formats(
+    names: Optional[List[str]] = Argument(
+        None,
+        help="Definitions to benchmark, by default the ones declaring binary content "
+        "types",
+    ),
+    src: Path = Option(
+        Path("src"),
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    every: bool = Option(False, "--all", help="Benchmark all the definitions"),
+    list_size: int = Option(10, help="Number of items in each list of the payloads"),
+    min_time: float = Option(0.1, help="Minimum time in seconds per measurement"),
+    output: Path = Option(
+        Path("build/bench/wire.json"), help="Path to the JSON results"
+    ),
+):
+    """
+    Compare the encoded size and the encode, decode and parse throughput of the
+    content types with the example payloads of the definitions
+    """
+    from tooling.bench.wire import RoundTripError, run_wire_benchmark
+    from tooling.registry import DefinitionRegistry
+
+    registry = DefinitionRegistry(src)
+    specs = _binary_specs(root, names, every)
+    try:
+        results = run_wire_benchmark(
+            registry, list(specs), BINARY_CONTENT_TYPES, list_size, min_time
+        )
+    except RoundTripError as e:
+        print_error(str(e))
+        raise Exit(code=1)
+    write_results(
+        output,
+        {
+            "list_size": list_size,
+            "implementations": {
+                t: CODECS[t].implementation for t in [JSON, *BINARY_CONTENT_TYPES]
+            },
+            "wire": results,
+        },
+    )
+    print_table(
+        [
+            "Definition",
+            "Model",
+            "Content type",
+            "Bytes",
+            "Saving",
+            "Encode /s",
+            "Decode /s",
+            "Parse /s",
+        ],
+        [
+            [
+                name,
+                kind,
+                content_type,
+                result["bytes"],
+                f"{result['saving']:.0%}",
+                f"{result['encode_per_s']:,.0f}",
+                f"{result['decode_per_s']:,.0f}",
+                f"{result['parse_per_s']:,.0f}",
+            ]
+            for name, kinds in results.items()
+            for kind, found in kinds.items()
+            for content_type, result in found.items()
+        ],
+    )
+    print(f"Results written to {output}")
+
+
+@cli.command()
+def export_arrow_schemas(
+    names: Optional[List[str]] = Argument(
+        None, help="Definitions to export, all by default"
+    ),
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Option(Path("build/arrow"), help="Directory to write the schemas in"),
+):
+    """
+    Export the Apache Arrow schemas of the responses of the definitions as JSON
+    """
+    written = 0
+    failed = False
+    for path in iter_specs(root):
+        name = path.relative_to(root).with_suffix("").as_posix()
+        spec = load_spec(path)
+        if "paths" not in spec or (names and name not in names):
+            continue
+        try:
+            columns = response_columns(spec)
+        except ValueError as e:
+            print_error(f"{name}: {e}")
+            failed = True
+            continue
+        target = dest / f"{name}.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            json.dumps(schema_json(columns), indent=2) + "\n", encoding="utf-8"
+        )
+        written += 1
+    print(f"Exported {written} schemas to {dest}")
+    if failed:
+        raise Exit(code=1)
+
+
+@cli.command()
+def ndjson_to_arrow(
+    name: str = Argument(..., help="Definition of the responses"),
+    source: Path = Argument(
+        ..., help="NDJSON file with a response per line", exists=True, dir_okay=False
+    ),
+    dest: Path = Argument(
+        ..., help="Directory of the Parquet dataset, or the Arrow IPC stream file"
+    ),
+    output_format: str = Option(
+        "parquet", "--format", help="Output format: parquet or ipc"
+    ),
+    explode: Optional[str] = Option(
+        None,
+        help="List of objects in the response to make a row of each item of, e.g. "
+        "batteryChargingHistory",
+    ),
+    partition_by: Optional[List[str]] = Option(
+        None, help="Column to partition the Parquet dataset by, can be repeated"
+    ),
+    block_size: int = Option(
+        DEFAULT_BLOCK_SIZE // 1024,
+        help="Size in KiB of the blocks of NDJSON read into each record batch",
+        min=1,
+    ),
+    row_group_size: int = Option(64 * 1024, help="Maximum rows per Parquet row group"),
+    root: Path = Option(
+        Path("DataProducts"),
+        help="Path to the root of the OpenAPI specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+):
+    """
+    Convert NDJSON responses of a definition to a Parquet dataset or an Arrow IPC
+    stream, in batches of bounded size
+    """
+    if not find_spec("pyarrow"):
+        print_error("Converting to Arrow requires `pip install pyarrow`")
+        raise Exit(code=1)
+    if output_format not in ("parquet", "ipc"):
+        print_error(f"Unknown format {output_format}")
+        raise Exit(code=1)
+    spec = load_spec(root / f"{name}.json")
+    start = perf_counter()
+    try:
+        if output_format == "parquet":
+            written = write_parquet(
+                source,
+                spec,
+                dest,
+                explode,
+                partition_by,
+                block_size * 1024,
+                row_group_size,
+            )
+        else:
+            if partition_by:
+                print_error("Only Parquet datasets can be partitioned")
+                raise Exit(code=1)
+            written = write_arrow_stream(source, spec, dest, explode, block_size * 1024)
+    except ValueError as e:
+        print_error(str(e))
+        raise Exit(code=1)
+    print(
+        f"Wrote {written:,} rows to {dest} in {perf_counter() - start:.2f}s, "
+        f"{source.stat().st_size / 1e6:.1f} MB of NDJSON"
+    )
@@ -0,0 +1,238 @@
+"""
+Code lists referenced by the specs instead of inline enums.
+
+A definition listing enums of the codelists package in CODE_LISTS gets, instead of the
+enum values, a pattern the values match and an x-code-list reference to a versioned
+artifact with the values:
+
+{"type": "string", "pattern": "^[A-Z]{2}$",
+ "x-code-list": {"name": "Country", "version": "1a2b3c4d5e6f",
+                 "path": "code-lists/Country_1a2b3c4d5e6f.json"}}
+
+The version is a hash of the values, so a spec keeps referencing the values it was
+generated with. The artifacts are written by the converter. The tooling loads each
+version of a code list from the code-lists directory of the project once per process
+and shares it between all the specs, and the generated validators have the values
+written into them.
+"""
+import hashlib
+import json
+import re
+import string
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Type
+
+# Not CodeLists, which only differs from the codelists package by case, and would be
+# merged with it on case-insensitive file systems
+DEFAULT_CODE_LISTS = Path("code-lists")
+# The artifacts the specs reference, wherever the tooling runs from
+PROJECT_CODE_LISTS = Path(__file__).resolve().parent.parent / DEFAULT_CODE_LISTS
+CODE_LIST_PACKAGE = "codelists"
+# Patterns with more alternatives than this only limit the characters and the length
+MAX_PATTERN_SHAPES = 20
+
+
+@dataclass(frozen=True)
+class CodeList:
+    name: str
+    version: str
+    title: Optional[str]
+    values: Tuple[str, ...]
+    value_set: FrozenSet[str]
+
+    def to_json(self) -> dict:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "title": self.title,
+            "values": list(self.values),
+        }
+
+
+def code_list_version(values: List[str]) -> str:
+    data = json.dumps(values, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:12]
+
+
+def artifact_path(name: str, version: str, root: Path = DEFAULT_CODE_LISTS) -> Path:
+    return root / f"{name}_{version}.json"
+
+
+def _char_class(char: str) -> str:
+    if char in string.digits:
+        return r"\d"
+    if char in string.ascii_uppercase:
+        return "[A-Z]"
+    if char in string.ascii_lowercase:
+        return "[a-z]"
+    return re.escape(char)
+
+
+def _shape(value: str) -> str:
+    """
+    Get a pattern matching the value and the values with the same kind of characters
+    in the same places, e.g. \\d{2}\\.\\d for 01.1
+    """
+    runs: List[List] = []
+    for char in value:
+        char_class = _char_class(char)
+        if runs and runs[-1][0] == char_class:
+            runs[-1][1] += 1
+        else:
+            runs.append([char_class, 1])
+    return "".join(c if n == 1 else f"{c}{{{n}}}" for c, n in runs)
+
+
+def code_list_pattern(values: List[str]) -> str:
+    """
+    Get a pattern matching all the values of a code list
+    """
+    shapes = sorted({_shape(v) for v in values})
+    if len(shapes) > MAX_PATTERN_SHAPES:
+        lengths = [len(v) for v in values]
+        return f"^.{{{min(lengths)},{max(lengths)}}}$"
+    if len(shapes) == 1:
+        return f"^{shapes[0]}$"
+    return f"^(?:{'|'.join(shapes)})$"
+
+
+def code_list_of_enum(enum: Type[Enum]) -> CodeList:
+    """
+    Get the code list of an enum of the codelists package
+    """
+    if enum.__module__.partition(".")[0] != CODE_LIST_PACKAGE:
+        raise ValueError(
+            f"{enum.__name__} isn't in the {CODE_LIST_PACKAGE} package, only the "
+            "enums shared from there can be code lists"
+        )
+    values = [member.value for member in enum]
+    if not all(isinstance(v, str) for v in values):
+        raise ValueError(f"The values of the code list {enum.__name__} must be strings")
+    doc = sys.modules[enum.__module__].__doc__ or ""
+    title = next((line.strip() for line in doc.splitlines() if line.strip()), None)
+    return CodeList(
+        name=enum.__name__,
+        version=code_list_version(values),
+        title=title,
+        values=tuple(values),
+        value_set=frozenset(values),
+    )
+
+
+def code_list_schema(schema: dict, code_list: CodeList) -> dict:
+    """
+    Replace the enum of a schema with the pattern and reference of its code list
+    """
+    if schema.get("enum") != list(code_list.values):
+        raise ValueError(f"The schema of {code_list.name} doesn't have its values")
+    result = {k: v for k, v in schema.items() if k != "enum"}
+    result["pattern"] = code_list_pattern(list(code_list.values))
+    result["x-code-list"] = {
+        "name": code_list.name,
+        "version": code_list.version,
+        "path": artifact_path(code_list.name, code_list.version).as_posix(),
+    }
+    return result
+
+
+@lru_cache(maxsize=None)
+def load_code_list(
+    name: str, version: str, root: Path = PROJECT_CODE_LISTS
+) -> CodeList:
+    """
+    Load a version of a code list from its artifact, once per process
+    """
+    path = artifact_path(name, version, root)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except OSError:
+        raise ValueError(
+            f"Code list {name} version {version} is missing, expected it in {path}"
+        ) from None
+    values = tuple(data["values"])
+    return CodeList(name, version, data.get("title"), values, frozenset(values))
+
+
+def code_list_of(schema: dict) -> Optional[CodeList]:
+    """
+    Get the code list a schema references, if any
+    """
+    reference = schema.get("x-code-list")
+    if reference is None:
+        return None
+    return load_code_list(reference["name"], reference["version"])
+
+
+def enum_values(schema: dict) -> Optional[List]:
+    """
+    Get the allowed values of a schema, from its enum or its code list
+    """
+    if "enum" in schema:
+        return schema["enum"]
+    code_list = code_list_of(schema)
+    return None if code_list is None else list(code_list.values)
+
+
+def code_list_references(value) -> Set[Tuple[str, str]]:
+    """
+    Get the names and versions of the code lists a spec references
+    """
+    found = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            reference = item.get("x-code-list")
+            if isinstance(reference, dict):
+                found.add((reference["name"], reference["version"]))
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return found
+
+
+def write_code_lists(
+    specs: Dict[str, dict], dest: Path
+) -> Tuple[List[Path], List[str]]:
+    """
+    Write the artifacts of the code lists the specs reference to dest, and remove the
+    artifacts no spec references anymore. The values come from the codelists package,
+    which has to be importable.
+
+    :return: The changed or removed files, and the references to versions of code
+        lists that the package no longer has
+    """
+    import codelists
+
+    wanted = set()
+    for spec in specs.values():
+        wanted |= code_list_references(spec)
+
+    changed = []
+    errors = []
+    expected = set()
+    for name, version in sorted(wanted):
+        enum = getattr(codelists, name, None)
+        code_list = code_list_of_enum(enum) if enum is not None else None
+        if code_list is None or code_list.version != version:
+            errors.append(f"{name} version {version} isn't in {CODE_LIST_PACKAGE}")
+            continue
+        path = artifact_path(name, version, dest)
+        expected.add(path)
+        data = json.dumps(code_list.to_json(), indent=2, ensure_ascii=False) + "\n"
+        if not path.exists() or path.read_text(encoding="utf-8") != data:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(data, encoding="utf-8")
+            changed.append(path)
+    # Artifacts are only removed when all the references were found, to not remove
+    # the ones of outdated specs
+    if dest.exists() and not errors:
+        for path in sorted(dest.glob("*.json")):
+            if path not in expected:
+                path.unlink()
+                changed.append(path)
+    return changed, errors
@@ -0,0 +1,319 @@
+"""
+Codecs of the content types the data products can declare.
+
+MessagePack and CBOR use the msgpack and cbor2 packages when they are installed, and
+otherwise pure Python implementations of the parts of the formats needed for JSON
+values: null, booleans, 64-bit integers, doubles, strings, arrays and maps with string
+keys.
+"""
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+CBOR = "application/cbor"
+
+
+@dataclass(frozen=True)
+class Codec:
+    content_type: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[bytes], Any]
+    # Name of the package used, "python" for the fallback implementation
+    implementation: str
+
+
+def _pack_msgpack(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(value)
+        elif -32 <= value < 0:
+            out.append(value & 0xFF)
+        elif 0 < value <= 0xFF:
+            out += struct.pack(">BB", 0xCC, value)
+        elif 0 < value <= 0xFFFF:
+            out += struct.pack(">BH", 0xCD, value)
+        elif 0 < value <= 0xFFFFFFFF:
+            out += struct.pack(">BI", 0xCE, value)
+        elif 0 < value <= 0xFFFFFFFFFFFFFFFF:
+            out += struct.pack(">BQ", 0xCF, value)
+        elif -0x80 <= value < 0:
+            out += struct.pack(">Bb", 0xD0, value)
+        elif -0x8000 <= value < 0:
+            out += struct.pack(">Bh", 0xD1, value)
+        elif -0x80000000 <= value < 0:
+            out += struct.pack(">Bi", 0xD2, value)
+        elif -(2**63) <= value < 0:
+            out += struct.pack(">Bq", 0xD3, value)
+        else:
+            raise OverflowError(f"Integer {value} doesn't fit in 64 bits")
+    elif isinstance(value, float):
+        out += struct.pack(">Bd", 0xCB, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        size = len(data)
+        if size < 32:
+            out.append(0xA0 | size)
+        elif size <= 0xFF:
+            out += struct.pack(">BB", 0xD9, size)
+        elif size <= 0xFFFF:
+            out += struct.pack(">BH", 0xDA, size)
+        else:
+            out += struct.pack(">BI", 0xDB, size)
+        out += data
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size <= 0xFFFF:
+            out += struct.pack(">BH", 0xDC, size)
+        else:
+            out += struct.pack(">BI", 0xDD, size)
+        for item in value:
+            _pack_msgpack(item, out)
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size <= 0xFFFF:
+            out += struct.pack(">BH", 0xDE, size)
+        else:
+            out += struct.pack(">BI", 0xDF, size)
+        for key, item in value.items():
+            _pack_msgpack(key, out)
+            _pack_msgpack(item, out)
+    else:
+        raise TypeError(f"Can't encode {type(value).__name__} as MessagePack")
+
+
+# Formats of the fixed size MessagePack values, by type byte
+_MSGPACK_FIXED = {
+    0xCA: (">f", 4),
+    0xCB: (">d", 8),
+    0xCC: (">B", 1),
+    0xCD: (">H", 2),
+    0xCE: (">I", 4),
+    0xCF: (">Q", 8),
+    0xD0: (">b", 1),
+    0xD1: (">h", 2),
+    0xD2: (">i", 4),
+    0xD3: (">q", 8),
+}
+# Formats of the lengths of strings, arrays and maps, by type byte
+_MSGPACK_LENGTHS = {
+    0xD9: ("str", ">B", 1),
+    0xDA: ("str", ">H", 2),
+    0xDB: ("str", ">I", 4),
+    0xDC: ("array", ">H", 2),
+    0xDD: ("array", ">I", 4),
+    0xDE: ("map", ">H", 2),
+    0xDF: ("map", ">I", 4),
+}
+
+
+def _unpack_msgpack(data: bytes, pos: int) -> Tuple[Any, int]:
+    byte = data[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+    if byte >= 0xE0:
+        return byte - 0x100, pos
+    if 0xA0 <= byte <= 0xBF:
+        kind, size = "str", byte & 0x1F
+    elif 0x90 <= byte <= 0x9F:
+        kind, size = "array", byte & 0x0F
+    elif 0x80 <= byte <= 0x8F:
+        kind, size = "map", byte & 0x0F
+    elif byte == 0xC0:
+        return None, pos
+    elif byte == 0xC2:
+        return False, pos
+    elif byte == 0xC3:
+        return True, pos
+    elif byte in _MSGPACK_FIXED:
+        fmt, width = _MSGPACK_FIXED[byte]
+        return struct.unpack_from(fmt, data, pos)[0], pos + width
+    elif byte in _MSGPACK_LENGTHS:
+        kind, fmt, width = _MSGPACK_LENGTHS[byte]
+        size = struct.unpack_from(fmt, data, pos)[0]
+        pos += width
+    else:
+        raise ValueError(f"Unsupported MessagePack type 0x{byte:02x} at {pos - 1}")
+
+    if kind == "str":
+        end = pos + size
+        return data[pos:end].decode("utf-8"), end
+    if kind == "array":
+        items = []
+        for _ in range(size):
+            item, pos = _unpack_msgpack(data, pos)
+            items.append(item)
+        return items, pos
+    result = {}
+    for _ in range(size):
+        key, pos = _unpack_msgpack(data, pos)
+        result[key], pos = _unpack_msgpack(data, pos)
+    return result, pos
+
+
+def _cbor_head(major: int, argument: int, out: bytearray) -> None:
+    major <<= 5
+    if argument < 24:
+        out.append(major | argument)
+    elif argument <= 0xFF:
+        out += struct.pack(">BB", major | 24, argument)
+    elif argument <= 0xFFFF:
+        out += struct.pack(">BH", major | 25, argument)
+    elif argument <= 0xFFFFFFFF:
+        out += struct.pack(">BI", major | 26, argument)
+    elif argument <= 0xFFFFFFFFFFFFFFFF:
+        out += struct.pack(">BQ", major | 27, argument)
+    else:
+        raise OverflowError(f"Integer {argument} doesn't fit in 64 bits")
+
+
+def _pack_cbor(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(0xF6)
+    elif value is True:
+        out.append(0xF5)
+    elif value is False:
+        out.append(0xF4)
+    elif isinstance(value, int):
+        if value >= 0:
+            _cbor_head(0, value, out)
+        else:
+            _cbor_head(1, -1 - value, out)
+    elif isinstance(value, float):
+        out += struct.pack(">Bd", 0xFB, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        _cbor_head(3, len(data), out)
+        out += data
+    elif isinstance(value, (list, tuple)):
+        _cbor_head(4, len(value), out)
+        for item in value:
+            _pack_cbor(item, out)
+    elif isinstance(value, dict):
+        _cbor_head(5, len(value), out)
+        for key, item in value.items():
+            _pack_cbor(key, out)
+            _pack_cbor(item, out)
+    else:
+        raise TypeError(f"Can't encode {type(value).__name__} as CBOR")
+
+
+_CBOR_ARGUMENTS = {24: (">B", 1), 25: (">H", 2), 26: (">I", 4), 27: (">Q", 8)}
+_CBOR_SIMPLE = {20: False, 21: True, 22: None}
+_CBOR_FLOATS = {25: (">e", 2), 26: (">f", 4), 27: (">d", 8)}
+
+
+def _unpack_cbor(data: bytes, pos: int) -> Tuple[Any, int]:
+    byte = data[pos]
+    pos += 1
+    major = byte >> 5
+    info = byte & 0x1F
+    if major == 7:
+        if info in _CBOR_SIMPLE:
+            return _CBOR_SIMPLE[info], pos
+        if info in _CBOR_FLOATS:
+            fmt, width = _CBOR_FLOATS[info]
+            return struct.unpack_from(fmt, data, pos)[0], pos + width
+        raise ValueError(f"Unsupported CBOR simple value {info} at {pos - 1}")
+    if info < 24:
+        argument = info
+    elif info in _CBOR_ARGUMENTS:
+        fmt, width = _CBOR_ARGUMENTS[info]
+        argument = struct.unpack_from(fmt, data, pos)[0]
+        pos += width
+    else:
+        raise ValueError(f"Unsupported CBOR length {info} at {pos - 1}")
+
+    if major == 0:
+        return argument, pos
+    if major == 1:
+        return -1 - argument, pos
+    if major == 3:
+        end = pos + argument
+        return data[pos:end].decode("utf-8"), end
+    if major == 4:
+        items = []
+        for _ in range(argument):
+            item, pos = _unpack_cbor(data, pos)
+            items.append(item)
+        return items, pos
+    if major == 5:
+        result = {}
+        for _ in range(argument):
+            key, pos = _unpack_cbor(data, pos)
+            result[key], pos = _unpack_cbor(data, pos)
+        return result, pos
+    raise ValueError(f"Unsupported CBOR major type {major} at {pos - 1}")
+
+
+def _decoder(unpack: Callable[[bytes, int], Tuple[Any, int]]) -> Callable:
+    def decode(data: bytes) -> Any:
+        value, end = unpack(data, 0)
+        if end != len(data):
+            raise ValueError(f"Extra data after position {end}")
+        return value
+
+    return decode
+
+
+def _encoder(pack: Callable[[Any, bytearray], None]) -> Callable:
+    def encode(value: Any) -> bytes:
+        out = bytearray()
+        pack(value, out)
+        return bytes(out)
+
+    return encode
+
+
+def _json_encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _codecs() -> Dict[str, Codec]:
+    codecs = {JSON: Codec(JSON, _json_encode, json.loads, "json")}
+    if msgpack is not None:
+        codecs[MSGPACK] = Codec(
+            MSGPACK,
+            lambda v: msgpack.packb(v, use_bin_type=True),
+            lambda d: msgpack.unpackb(d, raw=False),
+            "msgpack",
+        )
+    else:
+        codecs[MSGPACK] = Codec(
+            MSGPACK, _encoder(_pack_msgpack), _decoder(_unpack_msgpack), "python"
+        )
+    if cbor2 is not None:
+        codecs[CBOR] = Codec(CBOR, cbor2.dumps, cbor2.loads, "cbor2")
+    else:
+        codecs[CBOR] = Codec(
+            CBOR, _encoder(_pack_cbor), _decoder(_unpack_cbor), "python"
+        )
+    return codecs
+
+
+CODECS = _codecs()
+# Content types a definition can declare in addition to JSON
+BINARY_CONTENT_TYPES: List[str] = [MSGPACK, CBOR]
@@ -0,0 +1,500 @@
+"""
+Standalone Python validators generated from the OpenAPI specs.
+
+Every component schema of a spec is compiled into a plain Python function with the
+checks of the schema written out as code, so validating a value doesn't interpret the
+schema. The generated modules only depend on the standard library, with the values of
+the code lists the spec references written into them, and report the same errors as
+tooling.checker.SchemaChecker.
+"""
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List
+
+from tooling.checker import RANGE_MESSAGES, TYPES
+from tooling.code_lists import code_list_of
+from tooling.schema import (
+    component_schemas,
+    get_operation,
+    get_path,
+    iter_specs,
+    load_spec,
+    local_schema_name,
+)
+
+MODULE_DOCSTRING = '''"""
+Validators of the {path} data product, generated from its OpenAPI spec.
+
+Generated by `python -m tooling gen-validators`, don't edit by hand.
+"""
+'''
+# Imports and helpers the generated checks use
+HELPERS = """import re
+from datetime import date, datetime
+
+_MISSING = object()
+# One @ with something before it and a dotted domain after it
+_EMAIL = re.compile(r"^[^@\\s]+@[^@\\s.]+(\\.[^@\\s.]+)+$")
+
+
+def _error(loc, msg, error_type):
+    return {"loc": list(loc), "msg": msg, "type": error_type}
+
+
+def _valid_date(value):
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _valid_date_time(value):
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+def _valid_email(value):
+    return _EMAIL.match(value) is not None
+
+
+def _passes(check, value, loc):
+    errors = []
+    check(value, loc, errors)
+    return not errors
+"""
+MODULE_FOOTER = '''
+
+def validate_request(value, loc=()):
+    """
+    Validate a request body, returning the list of errors
+    """
+    errors = []
+    {request}(value, loc, errors)
+    return errors
+
+
+def validate_response(value, loc=()):
+    """
+    Validate a response body, returning the list of errors
+    """
+    errors = []
+    {response}(value, loc, errors)
+    return errors
+'''
+FORMAT_CHECKS = {
+    "date": "_valid_date",
+    "date-time": "_valid_date_time",
+    "email": "_valid_email",
+}
+INDENT = "    "
+
+
+def function_name(schema_name: str) -> str:
+    return f"_validate_{schema_name}"
+
+
+class ValidatorGenerator:
+    """
+    Generate the source code of validator functions for JSON schemas.
+
+    :param definitions: Schemas that "$ref" values point to, by name
+    """
+
+    def __init__(self, definitions: Dict[str, dict]):
+        self.definitions = definitions
+        self.constants: List[str] = []
+        self.functions: List[str] = []
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def constant(self, prefix: str, expression: str) -> str:
+        name = self._name(prefix)
+        self.constants.append(f"{name} = {expression}")
+        return name
+
+    def function(self, name: str, schema: dict) -> str:
+        """
+        Add a function checking a schema, with the errors appended to a list
+        """
+        body = self.emit(schema, "value", ["loc"], 1)
+        self.functions.append(
+            f"def {name}(value, loc, errors):\n" + "\n".join(body or [INDENT + "pass"])
+        )
+        return name
+
+    def source(self) -> str:
+        """
+        Get the source code of the constants and functions added so far
+        """
+        parts = []
+        if self.constants:
+            parts.append("\n".join(self.constants) + "\n")
+        parts.extend(f"\n{function}\n" for function in self.functions)
+        return "\n".join(parts)
+
+    @staticmethod
+    def loc(parts: List[str]) -> str:
+        if len(parts) == 1:
+            return parts[0]
+        return f"(*{parts[0]}, {', '.join(parts[1:])})"
+
+    def error(self, parts: List[str], msg: str, error_type: str, depth: int) -> str:
+        return (
+            f"{INDENT * depth}errors.append(_error({self.loc(parts)}, {msg!r}, "
+            f"{error_type!r}))"
+        )
+
+    def emit(self, schema: dict, var: str, loc: List[str], depth: int) -> List[str]:
+        """
+        Emit the lines checking the value in var against the schema
+        """
+        pad = INDENT * depth
+        if "$ref" in schema:
+            name = function_name(schema["$ref"].rpartition("/")[2])
+            return [f"{pad}{name}({var}, {self.loc(loc)}, errors)"]
+        if "anyOf" in schema:
+            return self.emit_any_of(schema["anyOf"], var, loc, depth)
+        if "allOf" in schema:
+            return [
+                line
+                for option in schema["allOf"]
+                for line in self.emit(option, var, loc, depth)
+            ]
+
+        lines = []
+        if "const" in schema:
+            lines.append(f"{pad}if {var} != {schema['const']!r}:")
+            lines.append(
+                self.error(
+                    loc,
+                    f"Input should be {schema['const']!r}",
+                    "literal_error",
+                    depth + 1,
+                )
+            )
+        if "enum" in schema:
+            values = schema["enum"]
+            expected = ", ".join(repr(v) for v in values)
+            keyword = "elif" if lines else "if"
+            if all(isinstance(v, str) for v in values):
+                # Only strings can be equal to the values, and only hashable values
+                # can be looked up in a set
+                values = self.constant("_ENUM", f"frozenset({values!r})")
+                lines.append(
+                    f"{pad}{keyword} not isinstance({var}, str) or {var} not in {values}:"
+                )
+            else:
+                values = self.constant("_ENUM", repr(tuple(values)))
+                lines.append(f"{pad}{keyword} {var} not in {values}:")
+            lines.append(
+                self.error(loc, f"Input should be {expected}", "enum", depth + 1)
+            )
+        if "x-code-list" in schema:
+            # The values are written into the module so it stays standalone
+            code_list = code_list_of(schema)
+            values = self.constant("_CODE_LIST", repr(code_list.values))
+            value_set = self.constant("_CODE_LIST_SET", f"frozenset({values})")
+            keyword = "elif" if lines else "if"
+            lines.append(
+                f"{pad}{keyword} not isinstance({var}, str) or "
+                f"{var} not in {value_set}:"
+            )
+            # The message lists all the values, it's only built for invalid values
+            lines.append(
+                f"{pad}{INDENT}errors.append(_error({self.loc(loc)}, 'Input should be '"
+                f" + ', '.join(map(repr, {values})), 'enum'))"
+            )
+        if not lines:
+            return self.emit_type(schema, var, loc, depth)
+        type_lines = self.emit_type(schema, var, loc, depth + 1)
+        if type_lines:
+            lines.append(f"{pad}else:")
+            lines.extend(type_lines)
+        return lines
+
+    def emit_any_of(
+        self, options: List[dict], var: str, loc: List[str], depth: int
+    ) -> List[str]:
+        pad = INDENT * depth
+        nullable = any(o.get("type") == "null" for o in options)
+        others = [o for o in options if o.get("type") != "null"]
+        if not others:
+            return self.emit({"type": "null"}, var, loc, depth)
+        if nullable and len(others) == 1:
+            # The common case of an optional field
+            return [f"{pad}if {var} is not None:"] + self.emit(
+                others[0], var, loc, depth + 1
+            )
+
+        checks = [f"{var} is None"] if nullable else []
+        names = []
+        for option in others:
+            names.append(self.function(self._name("_option"), option))
+            checks.append(f"_passes({names[-1]}, {var}, {self.loc(loc)})")
+        # The errors of the first option that isn't null are reported, like the
+        # schema checker does
+        return [
+            f"{pad}if not ({' or '.join(checks)}):",
+            f"{pad}{INDENT}{names[0]}({var}, {self.loc(loc)}, errors)",
+        ]
+
+    def emit_type(
+        self, schema: dict, var: str, loc: List[str], depth: int
+    ) -> List[str]:
+        pad = INDENT * depth
+        schema_type = schema.get("type")
+        if schema_type is None:
+            return []
+        if schema_type == "null":
+            return [
+                f"{pad}if {var} is not None:",
+                self.error(loc, "Input should be None", "none_required", depth + 1),
+            ]
+
+        python_type, error_type = TYPES[schema_type]
+        type_names = (
+            python_type.__name__
+            if isinstance(python_type, type)
+            else f"({', '.join(t.__name__ for t in python_type)})"
+        )
+        condition = f"not isinstance({var}, {type_names})"
+        if schema_type in ("integer", "number"):
+            # bool is a subclass of int
+            condition += f" or {var} is True or {var} is False"
+        lines = [
+            f"{pad}if {condition}:",
+            self.error(
+                loc, f"Input should be a valid {schema_type}", error_type, depth + 1
+            ),
+        ]
+
+        emitters = {
+            "object": self.emit_object,
+            "array": self.emit_array,
+            "string": self.emit_string,
+            "integer": self.emit_number,
+            "number": self.emit_number,
+        }
+        checks = (
+            emitters[schema_type](schema, var, loc, depth + 1)
+            if (schema_type in emitters)
+            else []
+        )
+        if checks:
+            lines.append(f"{pad}else:")
+            lines.extend(checks)
+        return lines
+
+    def emit_object(
+        self, schema: dict, var: str, loc: List[str], depth: int
+    ) -> List[str]:
+        pad = INDENT * depth
+        lines = []
+        for name in schema.get("required", []):
+            lines.append(f"{pad}if {name!r} not in {var}:")
+            lines.append(
+                self.error([*loc, repr(name)], "Field required", "missing", depth + 1)
+            )
+        for name, prop in schema.get("properties", {}).items():
+            item = self._name("_v")
+            checks = self.emit(prop, item, [*loc, repr(name)], depth + 1)
+            if not checks:
+                continue
+            lines.append(f"{pad}{item} = {var}.get({name!r}, _MISSING)")
+            lines.append(f"{pad}if {item} is not _MISSING:")
+            lines.extend(checks)
+        return lines
+
+    def emit_array(
+        self, schema: dict, var: str, loc: List[str], depth: int
+    ) -> List[str]:
+        pad = INDENT * depth
+        lines = []
+        if "minItems" in schema:
+            lines.append(f"{pad}if len({var}) < {schema['minItems']}:")
+            lines.append(
+                self.error(
+                    loc,
+                    f"List should have at least {schema['minItems']} items",
+                    "too_short",
+                    depth + 1,
+                )
+            )
+        if "maxItems" in schema:
+            lines.append(f"{pad}if len({var}) > {schema['maxItems']}:")
+            lines.append(
+                self.error(
+                    loc,
+                    f"List should have at most {schema['maxItems']} items",
+                    "too_long",
+                    depth + 1,
+                )
+            )
+        if schema.get("uniqueItems"):
+            seen = self._name("_seen")
+            item = self._name("_u")
+            lines.extend(
+                [
+                    f"{pad}{seen} = []",
+                    f"{pad}for {item} in {var}:",
+                    f"{pad}{INDENT}if {item} in {seen}:",
+                    self.error(
+                        loc, "Set items should be unique", "set_type", depth + 2
+                    ),
+                    f"{pad}{INDENT * 2}break",
+                    f"{pad}{INDENT}{seen}.append({item})",
+                ]
+            )
+        index = self._name("_i")
+        item = self._name("_x")
+        checks = self.emit(schema.get("items", {}), item, [*loc, index], depth + 1)
+        if checks:
+            lines.append(f"{pad}for {index}, {item} in enumerate({var}):")
+            lines.extend(checks)
+        return lines
+
+    def emit_string(
+        self, schema: dict, var: str, loc: List[str], depth: int
+    ) -> List[str]:
+        pad = INDENT * depth
+        lines = []
+        if "minLength" in schema:
+            lines.append(f"{pad}if len({var}) < {schema['minLength']}:")
+            lines.append(
+                self.error(
+                    loc,
+                    f"String should have at least {schema['minLength']} characters",
+                    "string_too_short",
+                    depth + 1,
+                )
+            )
+        if "maxLength" in schema:
+            lines.append(f"{pad}if len({var}) > {schema['maxLength']}:")
+            lines.append(
+                self.error(
+                    loc,
+                    f"String should have at most {schema['maxLength']} characters",
+                    "string_too_long",
+                    depth + 1,
+                )
+            )
+        if "pattern" in schema:
+            regex = self.constant("_PATTERN", f"re.compile({schema['pattern']!r})")
+            lines.append(f"{pad}if not {regex}.search({var}):")
+            lines.append(
+                self.error(
+                    loc,
+                    f"String should match pattern '{schema['pattern']}'",
+                    "string_pattern_mismatch",
+                    depth + 1,
+                )
+            )
+        string_format = schema.get("format")
+        if string_format in FORMAT_CHECKS:
+            lines.append(f"{pad}if not {FORMAT_CHECKS[string_format]}({var}):")
+            lines.append(
+                self.error(
+                    loc,
+                    f"Input should be a valid {string_format}",
+                    f"{string_format.replace('-', '_')}_parsing",
+                    depth + 1,
+                )
+            )
+        return lines
+
+    def emit_number(
+        self, schema: dict, var: str, loc: List[str], depth: int
+    ) -> List[str]:
+        pad = INDENT * depth
+        checks = [
+            ("minimum", "<", "greater_than_equal"),
+            ("exclusiveMinimum", "<=", "greater_than"),
+            ("maximum", ">", "less_than_equal"),
+            ("exclusiveMaximum", ">=", "less_than"),
+        ]
+        lines = []
+        for key, failing, error_type in checks:
+            if key in schema:
+                lines.append(f"{pad}if {var} {failing} {schema[key]!r}:")
+                lines.append(
+                    self.error(
+                        loc,
+                        f"Input should be {RANGE_MESSAGES[error_type]} {schema[key]}",
+                        error_type,
+                        depth + 1,
+                    )
+                )
+        return lines
+
+
+def generate_validator_module(spec: dict) -> str:
+    """
+    Generate the source code of the validator module of a spec
+    """
+    definitions = component_schemas(spec)
+    generator = ValidatorGenerator(definitions)
+    for name, schema in definitions.items():
+        generator.function(function_name(name), schema)
+
+    operation = get_operation(spec)
+    refs = {}
+    for kind, body in (
+        ("request", operation["requestBody"]),
+        ("response", operation["responses"]["200"]),
+    ):
+        ref = body["content"]["application/json"]["schema"]["$ref"]
+        refs[kind] = function_name(local_schema_name(ref))
+
+    return "\n".join(
+        [
+            MODULE_DOCSTRING.format(path=get_path(spec)) + HELPERS,
+            generator.source(),
+            MODULE_FOOTER.format(**refs),
+        ]
+    )
+
+
+def write_validators(root: Path, dest: Path) -> List[Path]:
+    """
+    Generate a validator module for every spec in root, mirroring the directory
+    structure of the specs in dest
+    """
+    written = []
+    for path in iter_specs(root):
+        spec = load_spec(path)
+        if "paths" not in spec:
+            continue
+        out_file = (dest / path.relative_to(root)).with_suffix(".py")
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        out_file.write_text(generate_validator_module(spec), encoding="utf-8")
+        written.append(out_file)
+    return written
+
+
+def load_validator_module(path: Path) -> ModuleType:
+    """
+    Import a generated validator module from its file
+    """
+    spec = importlib.util.spec_from_file_location(
+        "validator_" + path.stem.replace(".", "_"), str(path)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def compile_validators(spec: dict) -> Dict[str, Any]:
+    """
+    Generate and execute the validator module of a spec without writing it to disk
+    """
+    namespace: Dict[str, Any] = {}
+    exec(compile(generate_validator_module(spec), get_path(spec), "exec"), namespace)
+    return namespace
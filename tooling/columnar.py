@@ -0,0 +1,297 @@
+"""
+Apache Arrow schemas of the responses of the specs, and conversion of NDJSON responses
+to Arrow record batches and Parquet.
+
+Nested models are struct columns and lists of models are list columns of structs, e.g.
+the legs of LogisticsEmissions are a list<struct> column with the emissions per
+transport chain element as a list<struct> column in it. Date-times are UTC timestamps
+in microseconds, dates are date32 and enums are strings.
+
+The conversion parses each block of NDJSON straight to columns with pyarrow, so memory
+use is bounded by the block size rather than the size of the input. A list column can
+be exploded to one row per item, e.g. one row per ChargingHistoryEntry, with the line
+of the response they came from in the `_line` column.
+
+The schemas can be exported without pyarrow, the conversion requires
+`pip install pyarrow`.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from tooling.schema import component_schemas, get_operation
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# Types in the JSON form of the Arrow schemas, as in the Arrow integration test format
+JSON_TYPES: Dict[str, dict] = {
+    "int64": {"name": "int", "bitWidth": 64, "isSigned": True},
+    "double": {"name": "floatingpoint", "precision": "DOUBLE"},
+    "bool": {"name": "bool"},
+    "utf8": {"name": "utf8"},
+    "date32": {"name": "date", "unit": "DAY"},
+    "timestamp": {"name": "timestamp", "unit": "MICROSECOND", "timezone": "UTC"},
+    "list": {"name": "list"},
+    "struct": {"name": "struct"},
+}
+SCALAR_TYPES = {"integer": "int64", "number": "double", "boolean": "bool"}
+STRING_FORMATS = {"date-time": "timestamp", "date": "date32"}
+# Column with the line of the response each row of an exploded list comes from
+LINE_COLUMN = "_line"
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    # One of JSON_TYPES
+    type: str
+    nullable: bool = True
+    # Fields of structs, or the item of lists
+    children: Tuple["Column", ...] = ()
+
+    def to_json(self) -> dict:
+        return {
+            "name": self.name,
+            "nullable": self.nullable,
+            "type": JSON_TYPES[self.type],
+            "children": [c.to_json() for c in self.children],
+        }
+
+
+class ColumnBuilder:
+    """
+    Build the columns of the schemas of a spec.
+
+    :param definitions: Component schemas of the spec, by name
+    """
+
+    def __init__(self, definitions: Dict[str, dict]):
+        self.definitions = definitions
+        self.stack: List[str] = []
+
+    def column(self, name: str, schema: dict, nullable: bool) -> Column:
+        if "allOf" in schema and len(schema["allOf"]) == 1:
+            return self.column(name, schema["allOf"][0], nullable)
+        if "$ref" in schema:
+            ref = schema["$ref"].rpartition("/")[2]
+            if ref in self.stack:
+                raise ValueError(f"{name} is recursive, which Arrow can't represent")
+            self.stack.append(ref)
+            try:
+                return self.column(name, self.definitions[ref], nullable)
+            finally:
+                self.stack.pop()
+        if "anyOf" in schema:
+            options = [o for o in schema["anyOf"] if o.get("type") != "null"]
+            if len(options) != 1:
+                raise ValueError(f"{name} has values of several types")
+            return self.column(name, options[0], True)
+
+        schema_type = schema.get("type")
+        if schema_type == "object" and "properties" in schema:
+            required = set(schema.get("required", []))
+            children = tuple(
+                self.column(key, prop, key not in required)
+                for key, prop in schema["properties"].items()
+            )
+            return Column(name, "struct", nullable, children)
+        if schema_type == "array" and "items" in schema:
+            item = self.column("item", schema["items"], False)
+            return Column(name, "list", nullable, (item,))
+        if schema_type == "string" or (
+            "enum" in schema and all(isinstance(v, str) for v in schema["enum"])
+        ):
+            return Column(
+                name, STRING_FORMATS.get(schema.get("format"), "utf8"), nullable
+            )
+        if schema_type in SCALAR_TYPES:
+            return Column(name, SCALAR_TYPES[schema_type], nullable)
+        raise ValueError(f"{name} has no type Arrow can represent")
+
+
+def response_columns(spec: dict) -> List[Column]:
+    """
+    Get the columns of the successful response of a spec
+    """
+    operation = get_operation(spec)
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    response = ColumnBuilder(component_schemas(spec)).column("response", schema, False)
+    return list(response.children)
+
+
+def row_columns(columns: List[Column], explode: Optional[str] = None) -> List[Column]:
+    """
+    Get the columns of the rows, one per response or one per item of the exploded list
+    """
+    if explode is None:
+        return columns
+    for column in columns:
+        if column.name == explode:
+            (item,) = column.children or (None,)
+            if column.type == "list" and item.type == "struct":
+                return [Column(LINE_COLUMN, "int64", False), *item.children]
+            break
+    raise ValueError(f"The response has no list of objects named {explode}")
+
+
+def schema_json(columns: List[Column]) -> dict:
+    return {"fields": [c.to_json() for c in columns]}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+        import pyarrow.ipc
+        import pyarrow.json
+    except ImportError:
+        raise RuntimeError(
+            "Converting to Arrow requires `pip install pyarrow`"
+        ) from None
+    return pyarrow
+
+
+def _arrow_type(column: Column, read: bool = False) -> "pyarrow.DataType":
+    """
+    Get the Arrow type of a column. The JSON reader of pyarrow parses timestamps but not
+    dates, so for reading dates are strings that are then cast.
+    """
+    pa = _import_pyarrow()
+    if column.type == "struct":
+        return pa.struct([_arrow_field(c, read) for c in column.children])
+    if column.type == "list":
+        return pa.list_(_arrow_field(column.children[0], read))
+    if column.type == "date32":
+        return pa.string() if read else pa.date32()
+    return {
+        "int64": pa.int64,
+        "double": pa.float64,
+        "bool": pa.bool_,
+        "utf8": pa.string,
+        "timestamp": lambda: pa.timestamp("us", tz="UTC"),
+    }[column.type]()
+
+
+def _arrow_field(column: Column, read: bool = False) -> "pyarrow.Field":
+    pa = _import_pyarrow()
+    return pa.field(column.name, _arrow_type(column, read), nullable=column.nullable)
+
+
+def arrow_schema(columns: List[Column], read: bool = False) -> "pyarrow.Schema":
+    pa = _import_pyarrow()
+    return pa.schema([_arrow_field(c, read) for c in columns])
+
+
+def iter_record_batches(
+    source: Any,
+    spec: dict,
+    explode: Optional[str] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator["pyarrow.RecordBatch"]:
+    """
+    Read NDJSON responses in blocks of block_size bytes as record batches. Each line
+    has to fit in a block.
+
+    :param source: Path or binary file of the NDJSON
+    :param explode: Name of a list of objects in the response to make a row of each
+    item of
+    """
+    pa = _import_pyarrow()
+    columns = response_columns(spec)
+    read_schema = arrow_schema(columns, read=True)
+    schema = arrow_schema(columns)
+    rows_schema = arrow_schema(row_columns(columns, explode))
+    reader = pa.json.open_json(
+        str(source) if isinstance(source, Path) else source,
+        read_options=pa.json.ReadOptions(block_size=block_size),
+        parse_options=pa.json.ParseOptions(
+            explicit_schema=read_schema, unexpected_field_behavior="ignore"
+        ),
+    )
+    line = 0
+    for batch in reader:
+        if read_schema != schema:
+            batch = pa.RecordBatch.from_arrays(
+                [a.cast(f.type) for a, f in zip(batch.columns, schema)], schema=schema
+            )
+        if explode is None:
+            yield batch
+        else:
+            values = batch.column(explode)
+            parents = pa.compute.list_parent_indices(values).cast(pa.int64())
+            items = pa.compute.list_flatten(values)
+            yield pa.RecordBatch.from_arrays(
+                [pa.compute.add(parents, line), *items.flatten()], schema=rows_schema
+            )
+        line += batch.num_rows
+
+
+def write_parquet(
+    source: Any,
+    spec: dict,
+    dest: Path,
+    explode: Optional[str] = None,
+    partition_by: Optional[List[str]] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    row_group_size: int = 64 * 1024,
+) -> int:
+    """
+    Convert NDJSON responses to a Parquet dataset in dest, in directories named after
+    the values of the partition_by columns, e.g. freightType=Containerized. Record
+    batches are written as they're read, at most row_group_size rows per row group.
+
+    :return: Number of rows written
+    """
+    pa = _import_pyarrow()
+    columns = row_columns(response_columns(spec), explode)
+    scalars = {c.name for c in columns if c.type not in ("list", "struct")}
+    for name in partition_by or []:
+        if name not in scalars:
+            raise ValueError(f"Can't partition by {name}, it's not a scalar column")
+
+    written = 0
+
+    def counted(batches: Iterator["pyarrow.RecordBatch"]):
+        nonlocal written
+        for batch in batches:
+            written += batch.num_rows
+            yield batch
+
+    pa.dataset.write_dataset(
+        counted(iter_record_batches(source, spec, explode, block_size)),
+        dest,
+        schema=arrow_schema(columns),
+        format="parquet",
+        partitioning=partition_by or None,
+        partitioning_flavor="hive" if partition_by else None,
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=row_group_size,
+    )
+    return written
+
+
+def write_arrow_stream(
+    source: Any,
+    spec: dict,
+    dest: Path,
+    explode: Optional[str] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> int:
+    """
+    Convert NDJSON responses to an Arrow IPC stream, writing record batches as they're
+    read
+
+    :return: Number of rows written
+    """
+    pa = _import_pyarrow()
+    schema = arrow_schema(row_columns(response_columns(spec), explode))
+    written = 0
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with pa.ipc.new_stream(str(dest), schema) as writer:
+        for batch in iter_record_batches(source, spec, explode, block_size):
+            writer.write_batch(batch)
+            written += batch.num_rows
+    return written
@@ -0,0 +1,89 @@
+"""
+Complexity metrics of the OpenAPI specs.
+
+Large enums, deeply nested models and large specs slow down building the routes of a
+gateway and validating every request, so they are checked against budgets.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from tooling.bench import budget_for, over_budget
+from tooling.schema import component_schemas, get_operation, iter_specs
+
+METRICS = ["enum_values", "depth", "properties", "spec_bytes"]
+
+
+def _iter_schemas(value: Any) -> Iterator[dict]:
+    if isinstance(value, dict):
+        yield value
+        for item in value.values():
+            yield from _iter_schemas(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_schemas(item)
+
+
+class DepthCounter:
+    """
+    Count the depth of nested objects in a schema, following "$ref" values
+    """
+
+    def __init__(self, definitions: Dict[str, dict]):
+        self.definitions = definitions
+        self._depths: Dict[str, int] = {}
+
+    def depth(self, schema: Any) -> int:
+        if isinstance(schema, list):
+            return max((self.depth(item) for item in schema), default=0)
+        if not isinstance(schema, dict):
+            return 0
+        if "$ref" in schema:
+            name = schema["$ref"].rpartition("/")[2]
+            if name not in self._depths:
+                # Recursive references count as one level
+                self._depths[name] = 1
+                self._depths[name] = self.depth(self.definitions[name])
+            return self._depths[name]
+        nested = max((self.depth(value) for value in schema.values()), default=0)
+        return nested + 1 if "properties" in schema else nested
+
+
+def spec_metrics(spec: dict, spec_bytes: int) -> Dict[str, int]:
+    definitions = component_schemas(spec)
+    operation = get_operation(spec)
+    counter = DepthCounter(definitions)
+    models = [
+        operation["requestBody"],
+        operation["responses"]["200"],
+    ]
+    return {
+        "enum_values": max(
+            (len(s["enum"]) for s in _iter_schemas(spec) if "enum" in s), default=0
+        ),
+        "depth": counter.depth(models),
+        "properties": sum(
+            len(schema.get("properties", {})) for schema in definitions.values()
+        ),
+        "spec_bytes": spec_bytes,
+    }
+
+
+def check_complexity(
+    root: Path, budgets: Dict[str, Any]
+) -> List[Tuple[str, Dict[str, int], Dict[str, int]]]:
+    """
+    Compute the complexity metrics of each spec under the root.
+
+    :return: Definition name, metrics and the metrics over budget of each spec
+    """
+    results = []
+    for path in iter_specs(root):
+        data = path.read_bytes()
+        spec = json.loads(data)
+        if "paths" not in spec:
+            continue
+        name = path.relative_to(root).with_suffix("").as_posix()
+        metrics = spec_metrics(spec, len(data))
+        results.append((name, metrics, over_budget(metrics, budget_for(budgets, name))))
+    return results
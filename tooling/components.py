@@ -0,0 +1,178 @@
+"""
+Deduplication of component schemas shared by several data product specs.
+
+The split view moves every schema that's identical in two or more specs to a common
+components document and references it from each spec with "$ref". The bundled view
+turns the split specs back into standalone specs.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from rich import print
+
+from tooling.schema import (
+    LOCAL_SCHEMA_PREFIX,
+    component_schemas,
+    dump_spec,
+    get_operation,
+    iter_refs,
+    iter_specs,
+    load_spec,
+    local_schema_name,
+    rewrite_refs,
+)
+
+COMMON_DOCUMENT = "components.json"
+
+
+def schema_hash(schema: dict) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def pinned_schemas(spec: dict) -> Set[str]:
+    """
+    Names of the request and response models of a spec. These are always kept in the
+    spec itself, as data product specs must define them in "#/components/schemas/".
+    """
+    operation = get_operation(spec)
+    bodies = [operation.get("requestBody", {}), operation["responses"].get("200", {})]
+    names = set()
+    for body in bodies:
+        ref = body.get("content", {}).get("application/json", {}).get("schema", {})
+        if ref.get("$ref", "").startswith(LOCAL_SCHEMA_PREFIX):
+            names.add(local_schema_name(ref["$ref"]))
+    return names
+
+
+def find_shared_schemas(specs: List[dict]) -> Dict[str, dict]:
+    """
+    Find the component schemas that can be shared between the specs.
+
+    A schema is shared when it's used by at least two specs, has the same content in
+    all of them and only references other shared schemas.
+    """
+    variants: Dict[str, Dict[str, dict]] = {}
+    usages: Dict[str, int] = {}
+    pinned: Set[str] = set()
+    for spec in specs:
+        pinned |= pinned_schemas(spec)
+        for name, schema in component_schemas(spec).items():
+            variants.setdefault(name, {})[schema_hash(schema)] = schema
+            usages[name] = usages.get(name, 0) + 1
+
+    candidates = {
+        name
+        for name, schemas in variants.items()
+        if len(schemas) == 1 and usages[name] > 1 and name not in pinned
+    }
+
+    changed = True
+    while changed:
+        changed = False
+        for name in sorted(candidates):
+            (schema,) = variants[name].values()
+            refs = {local_schema_name(ref) for ref in iter_refs(schema)}
+            if not refs <= candidates:
+                candidates.remove(name)
+                changed = True
+
+    return {name: next(iter(variants[name].values())) for name in sorted(candidates)}
+
+
+def split_spec(spec: dict, shared: Dict[str, dict], common_ref: str) -> dict:
+    """
+    Replace the shared schemas of a spec with references to the common document
+    """
+
+    def rewrite(ref: str) -> str:
+        if ref.startswith(LOCAL_SCHEMA_PREFIX) and local_schema_name(ref) in shared:
+            return common_ref + ref
+        return ref
+
+    spec = rewrite_refs(spec, rewrite)
+    spec["components"]["schemas"] = {
+        name: schema
+        for name, schema in component_schemas(spec).items()
+        if name not in shared
+    }
+    return spec
+
+
+def bundle_spec(spec: dict, common: Dict[str, dict]) -> dict:
+    """
+    Inline the schemas a split spec references from common documents.
+
+    :param spec: The split spec
+    :param common: Mapping from the document part of the references, as used in the
+        spec, to the component schemas of the loaded document
+    """
+    schemas = dict(component_schemas(spec))
+    pending = [ref for ref in iter_refs(spec) if not ref.startswith("#")]
+    while pending:
+        document, _, pointer = pending.pop().partition("#")
+        name = local_schema_name("#" + pointer)
+        if name in schemas:
+            continue
+        schema = common[document][name]
+        schemas[name] = schema
+        pending.extend(document + ref for ref in iter_refs(schema))
+
+    spec = dict(spec, components=dict(spec["components"]))
+    spec["components"]["schemas"] = {name: schemas[name] for name in sorted(schemas)}
+    return rewrite_refs(spec, lambda ref: "#" + ref.partition("#")[2])
+
+
+def write_document(path: Path, document: dict) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = dump_spec(document).encode("utf-8")
+    path.write_bytes(content)
+    return len(content)
+
+
+def split_specs(src: Path, dest: Path) -> Tuple[int, int]:
+    """
+    Write the specs from src to dest with their shared schemas moved to a common
+    components document at the root of dest.
+
+    :return: Total size of the specs in bytes before and after the split
+    """
+    paths = [p for p in iter_specs(src) if p.name != COMMON_DOCUMENT]
+    specs = [load_spec(p) for p in paths]
+    shared = find_shared_schemas(specs)
+
+    common_path = dest / COMMON_DOCUMENT
+    size_after = write_document(common_path, {"components": {"schemas": shared}})
+    size_before = 0
+    for path, spec in zip(paths, specs):
+        size_before += path.stat().st_size
+        out_file = dest / path.relative_to(src)
+        common_ref = Path(os.path.relpath(common_path, out_file.parent)).as_posix()
+        size_after += write_document(out_file, split_spec(spec, shared, common_ref))
+
+    print(f"Moved {len(shared)} shared schemas to {common_path}")
+    return size_before, size_after
+
+
+def bundle_specs(src: Path, dest: Path) -> None:
+    """
+    Write standalone versions of the split specs in src to dest
+    """
+    loaded: Dict[Path, Dict[str, dict]] = {}
+    for path in iter_specs(src):
+        if path.name == COMMON_DOCUMENT:
+            continue
+        spec = load_spec(path)
+        common = {}
+        for ref in iter_refs(spec):
+            document = ref.partition("#")[0]
+            if not document or document in common:
+                continue
+            document_path = (path.parent / document).resolve()
+            if document_path not in loaded:
+                loaded[document_path] = component_schemas(load_spec(document_path))
+            common[document] = loaded[document_path]
+        write_document(dest / path.relative_to(src), bundle_spec(spec, common))
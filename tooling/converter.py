@@ -0,0 +1,518 @@
+"""
+Incremental conversion of the python definitions to OpenAPI specs.
+
+A manifest keeps the hashes of every source and the local modules it imports, so only
+the specs whose inputs changed are rebuilt and specs of removed sources are deleted.
+The specs of aliases are derived from the specs of their sources without importing
+anything.
+"""
+import hashlib
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from importlib.metadata import version
+from itertools import chain
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from definition_tooling.log import print_table
+from rich import print
+
+from tooling.aliases import ALIASES_FILE, Alias, derive_spec, load_aliases
+from tooling.catalog import write_catalog
+from tooling.code_lists import DEFAULT_CODE_LISTS, write_code_lists
+from tooling.extensions import apply_extensions
+from tooling.schema import iter_specs, load_spec
+from tooling.sources import (
+    ensure_importable,
+    file_hash,
+    find_local_dependencies,
+    get_definition_name,
+    get_module_name,
+    import_source,
+    iter_sources,
+)
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = Path(".convert-manifest.json")
+
+# Changes to any of these invalidate every spec in the manifest
+TOOLCHAIN_PACKAGES = ["ioxio-data-product-definition-tooling", "pydantic", "fastapi"]
+TOOLCHAIN_MODULES = [
+    "__main__.py",
+    "aliases.py",
+    "code_lists.py",
+    "codecs.py",
+    "converter.py",
+    "extensions.py",
+    "sources.py",
+]
+
+
+def styled_error(error: str, path: Path) -> str:
+    """
+    Style error messages to make them clearer and easier to read
+    """
+    return f"[bold red]{error}[/bold red] in [yellow]{path}[/yellow]:exclamation:"
+
+
+def toolchain_fingerprint() -> str:
+    """
+    Fingerprint of everything besides the sources that affects the generated specs
+    """
+    digest = hashlib.sha256()
+    for package in TOOLCHAIN_PACKAGES:
+        digest.update(f"{package}=={version(package)}\n".encode())
+    for name in TOOLCHAIN_MODULES:
+        digest.update(name.encode())
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+def spec_hash(spec: dict) -> str:
+    """
+    Hash of the spec content that doesn't depend on formatting of the file
+    """
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def read_spec_hash(path: Path) -> Optional[str]:
+    try:
+        return spec_hash(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return None
+
+
+@dataclass
+class ManifestEntry:
+    output: str
+    inputs: Dict[str, str]
+    spec_hash: str
+
+
+@dataclass
+class Manifest:
+    toolchain: str = ""
+    definitions: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != MANIFEST_VERSION:
+            return cls()
+        return cls(
+            toolchain=data["toolchain"],
+            definitions={
+                name: ManifestEntry(**entry)
+                for name, entry in data["definitions"].items()
+            },
+        )
+
+    def save(self, path: Path) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "toolchain": self.toolchain,
+            "definitions": {
+                name: self.definitions[name].__dict__
+                for name in sorted(self.definitions)
+            },
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+@dataclass
+class Source:
+    path: Path
+    definition_name: str
+    out_file: Path
+    inputs: Dict[str, str]
+    alias: Optional[Alias] = None
+
+
+def collect_sources(src: Path, dest: Path) -> List[Source]:
+    """
+    Find all definition sources and hash them together with their local dependencies.
+
+    Aliases are listed after the other sources, with the inputs of the source they
+    mirror and the hash of their own entry.
+    """
+    sources = [collect_source(p, src, dest) for p in iter_sources(src)]
+    by_name = {s.definition_name: s for s in sources}
+    for alias in load_aliases(src).values():
+        sources.append(alias_source(alias, src, dest, by_name))
+    return sources
+
+
+def collect_source(path: Path, src: Path, dest: Path) -> Source:
+    """
+    Hash a definition source together with its local dependencies
+    """
+    project_root = src.resolve().parent
+    inputs = {path.as_posix(): file_hash(path)}
+    for dependency in find_local_dependencies(path.resolve(), [project_root]):
+        key = dependency.relative_to(project_root).as_posix()
+        inputs[key] = file_hash(dependency)
+    return Source(
+        path=path,
+        definition_name=get_definition_name(path, src),
+        out_file=(dest / path.relative_to(src)).with_suffix(".json"),
+        inputs=inputs,
+    )
+
+
+def alias_source(
+    alias: Alias, src: Path, dest: Path, by_name: Dict[str, Source]
+) -> Source:
+    """
+    Get the source of an alias, with the inputs of the source it mirrors
+    """
+    aliases_path = src / ALIASES_FILE
+    inputs = {f"{aliases_path.as_posix()}#{alias.name}": alias.hash()}
+    if alias.source in by_name:
+        inputs.update(by_name[alias.source].inputs)
+    return Source(
+        path=aliases_path,
+        definition_name=alias.name,
+        out_file=dest / f"{alias.name}.json",
+        inputs=inputs,
+        alias=alias,
+    )
+
+
+def is_up_to_date(source: Source, entry: Optional[ManifestEntry]) -> bool:
+    if entry is None or entry.inputs != source.inputs:
+        return False
+    if entry.output != source.out_file.as_posix():
+        return False
+    # Catch manual edits and deletions of the generated spec
+    return read_spec_hash(source.out_file) == entry.spec_hash
+
+
+@dataclass
+class BuildResult:
+    openapi: Optional[dict]
+    errors: List[str]
+    import_time: float
+    export_time: float
+
+
+def build_spec(source: Source) -> BuildResult:
+    """
+    Import a definition and export its OpenAPI spec. The spec is None on errors.
+
+    Errors are returned instead of printed so the output stays in order when the
+    sources are converted in worker processes.
+    """
+    from definition_tooling.converter import export_openapi_spec
+    from pydantic import ValidationError
+
+    start = perf_counter()
+    try:
+        module = import_source(source.path, get_module_name(source.definition_name))
+    except ValidationError as e:
+        errors = [styled_error("Validation error", source.path), str(e)]
+        return BuildResult(None, errors, perf_counter() - start, 0.0)
+    import_time = perf_counter() - start
+
+    try:
+        definition = getattr(module, "DEFINITION")
+    except AttributeError:
+        errors = [styled_error("Error finding DEFINITION variable", source.path)]
+        return BuildResult(None, errors, import_time, 0.0)
+
+    start = perf_counter()
+    openapi = export_openapi_spec(definition, source.definition_name)
+    try:
+        openapi = apply_extensions(openapi, module)
+    except ValueError as e:
+        errors = [styled_error("Invalid spec extension", source.path), str(e)]
+        return BuildResult(None, errors, import_time, perf_counter() - start)
+    return BuildResult(openapi, [], import_time, perf_counter() - start)
+
+
+def build_alias_spec(source: Source, built: Dict[str, dict], dest: Path) -> BuildResult:
+    """
+    Derive the spec of an alias from the spec of its source, either built in this run
+    or already in dest
+    """
+    alias = source.alias
+    start = perf_counter()
+    spec = built.get(alias.source)
+    if spec is None:
+        try:
+            spec = json.loads(
+                (dest / f"{alias.source}.json").read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            error = f"Error finding the spec of {alias.source} for {alias.name}"
+            return BuildResult(None, [styled_error(error, source.path)], 0.0, 0.0)
+    return BuildResult(derive_spec(spec, alias), [], 0.0, perf_counter() - start)
+
+
+def build_specs(sources: List[Source], jobs: int) -> Iterator[BuildResult]:
+    """
+    Build the specs of the sources, yielding the results in the order of the sources
+    regardless of the number of worker processes used.
+    """
+    if jobs <= 1 or len(sources) <= 1:
+        for source in sources:
+            yield build_spec(source)
+        return
+
+    # Workers are forked where possible, so they inherit the already imported tooling
+    # and the hash seed of this process, making the output identical to a serial run
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        # Submit the biggest sources first to keep all the workers busy until the end
+        futures = {}
+        for source in sorted(sources, key=lambda s: -s.path.stat().st_size):
+            futures[source.definition_name] = executor.submit(build_spec, source)
+        for source in sources:
+            yield futures[source.definition_name].result()
+
+
+def unordered(value: Any) -> Any:
+    """
+    Get a form of a JSON value that compares equal regardless of the order of lists
+    """
+    if isinstance(value, dict):
+        return {k: unordered(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [unordered(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True))
+    return value
+
+
+def write_spec(out_file: Path, openapi: dict) -> bool:
+    """
+    Write the spec if its content changed. Returns True if the file was written.
+    """
+    current_spec = {}
+    if out_file.exists():
+        current_spec = json.loads(out_file.read_text(encoding="utf-8"))
+    # Examples built from sets don't have a stable order, so it's ignored. The plain
+    # comparison is a lot faster and covers almost every case.
+    if current_spec == openapi:
+        return False
+    if unordered(current_spec) == unordered(openapi):
+        return False
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_text(
+        json.dumps(openapi, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return True
+
+
+def remove_empty_dirs(path: Path, root: Path) -> None:
+    """
+    Remove the directory and its parents up to the root for as long as they're empty
+    """
+    root = root.resolve()
+    path = path.resolve()
+    while path != root and path.is_relative_to(root) and not any(path.iterdir()):
+        path.rmdir()
+        path = path.parent
+
+
+def remove_orphans(sources: List[Source], manifest: Manifest, dest: Path) -> bool:
+    """
+    Remove the specs of the manifest whose sources no longer exist
+
+    :return: True if specs were removed
+    """
+    removed = False
+    current_names = {s.definition_name for s in sources}
+    for name in sorted(set(manifest.definitions) - current_names):
+        out_file = Path(manifest.definitions.pop(name).output)
+        if out_file.exists():
+            print(f"Removing orphaned {out_file}")
+            out_file.unlink()
+            remove_empty_dirs(out_file.parent, dest)
+            removed = True
+    return removed
+
+
+def print_timings(
+    timings: List[Tuple[Source, BuildResult]], wall_time: float, jobs: int
+) -> None:
+    rows = [
+        [
+            source.definition_name,
+            f"{result.import_time * 1000:.1f}",
+            f"{result.export_time * 1000:.1f}",
+            f"{(result.import_time + result.export_time) * 1000:.1f}",
+        ]
+        for source, result in timings
+    ]
+    total = sum(r.import_time + r.export_time for _, r in timings)
+    # The wall times of the definitions, which overlap with several jobs
+    rows.append(["Sum of definitions", "", "", f"{total * 1000:.1f}"])
+    rows.append([f"Wall time ({jobs} jobs)", "", "", f"{wall_time * 1000:.1f}"])
+    print_table(["Definition", "Import ms", "Export ms", "Total ms"], rows)
+
+
+def export_sources(
+    stale: List[Source],
+    dest: Path,
+    manifest: Manifest,
+    jobs: int = 1,
+    check_untracked: bool = True,
+) -> Tuple[List[Tuple[Source, BuildResult]], List[Path], bool]:
+    """
+    Convert the sources and write the specs whose content changed, recording them in
+    the manifest. Aliases are derived after the definitions they mirror.
+
+    :return: The result of each source, the written specs and whether the pre-commit
+        hook should fail, i.e. a spec was written, is untracked or failed to convert.
+    """
+    timings = []
+    written = []
+    should_fail_hook = False
+    if stale and check_untracked:
+        # Importing the upstream tooling is slow, skip it when there's nothing to do
+        from definition_tooling.converter.converter import file_is_untracked
+
+    definitions = [s for s in stale if s.alias is None]
+    aliases = [s for s in stale if s.alias is not None]
+    built = {}
+    # Aliases are derived lazily, once the definitions they mirror have been built
+    results = chain(
+        zip(definitions, build_specs(definitions, jobs)),
+        ((s, build_alias_spec(s, built, dest)) for s in aliases),
+    )
+    for source, result in results:
+        timings.append((source, result))
+        if result.openapi is None:
+            for error in result.errors:
+                print(error)
+            should_fail_hook = True
+            manifest.definitions.pop(source.definition_name, None)
+            continue
+        built[source.definition_name] = result.openapi
+
+        if write_spec(source.out_file, result.openapi):
+            print(f"Exporting {source.out_file}")
+            written.append(source.out_file)
+            # Hook should fail as we modified the file.
+            should_fail_hook = True
+        elif check_untracked and file_is_untracked(source.out_file):
+            print(f"Untracked {source.out_file}")
+            should_fail_hook = True
+        else:
+            print(f"Skipping {source.out_file}")
+
+        manifest.definitions[source.definition_name] = ManifestEntry(
+            output=source.out_file.as_posix(),
+            inputs=source.inputs,
+            spec_hash=read_spec_hash(source.out_file),
+        )
+    return timings, written, should_fail_hook
+
+
+def sync_code_lists(dest: Path, code_lists_path: Path) -> bool:
+    """
+    Write the artifacts of the code lists the specs in dest reference
+
+    :return: True if artifacts were written or removed, or code lists are missing
+    """
+    specs = {p.as_posix(): load_spec(p) for p in iter_specs(dest)}
+    changed, errors = write_code_lists(specs, code_lists_path)
+    for path in changed:
+        print(f"{'Exporting' if path.exists() else 'Removing'} {path}")
+    for error in errors:
+        print(styled_error(error, code_lists_path))
+    return bool(changed or errors)
+
+
+def convert_definitions(
+    src: Path,
+    dest: Path,
+    incremental: bool = False,
+    manifest_path: Path = DEFAULT_MANIFEST,
+    run_pre_commit: bool = True,
+    jobs: int = 1,
+    show_timings: bool = False,
+    index_path: Optional[Path] = None,
+    code_lists_path: Optional[Path] = DEFAULT_CODE_LISTS,
+) -> bool:
+    """
+    Convert the python definitions in src to OpenAPI specs in dest.
+
+    In incremental mode only the sources whose inputs changed since the last run
+    recorded in the manifest are converted, and specs generated from sources that no
+    longer exist are removed.
+
+    With jobs > 1 the sources are imported and exported in a pool of worker
+    processes. The specs are still written in the same order and with the same
+    content as with a single process.
+
+    With an index_path a catalog of all the specs in dest is written there, usually
+    catalog.json in the project so it's committed with the specs.
+
+    The artifacts of the code lists the specs in dest reference are written to
+    code_lists_path, and the ones no spec references anymore are removed.
+
+    :return: True if the pre-commit hook should fail, i.e. files were modified, are
+        untracked or a definition failed to convert.
+    """
+    ensure_importable(src)
+
+    toolchain = toolchain_fingerprint()
+    manifest = Manifest.load(manifest_path) if incremental else Manifest()
+    # Entries are kept even if the toolchain changed to be able to find orphans
+    toolchain_changed = manifest.toolchain != toolchain
+    manifest.toolchain = toolchain
+
+    sources = collect_sources(src, dest)
+    stale = [
+        s
+        for s in sources
+        if toolchain_changed
+        or not is_up_to_date(s, manifest.definitions.get(s.definition_name))
+    ]
+
+    should_fail_hook = False
+    modified_files = []
+
+    if incremental and remove_orphans(sources, manifest, dest):
+        should_fail_hook = True
+
+    start = perf_counter()
+    timings, written, failed = export_sources(stale, dest, manifest, jobs)
+    modified_files.extend(written)
+    should_fail_hook = should_fail_hook or failed
+
+    if show_timings and timings:
+        print_timings(timings, wall_time=perf_counter() - start, jobs=jobs)
+
+    if incremental:
+        print(
+            f"{len(sources) - len(stale)} up to date, {len(stale)} converted "
+            f"({len(modified_files)} changed)"
+        )
+        manifest.save(manifest_path)
+
+    # Run hooks on all modified files at once to save overhead from subprocess
+    if modified_files and run_pre_commit:
+        from definition_tooling.converter.converter import run_pre_commit_hooks_on_files
+
+        run_pre_commit_hooks_on_files(modified_files)
+
+    # Also run when nothing was converted, to restore edited or removed artifacts
+    if code_lists_path and sync_code_lists(dest, code_lists_path):
+        should_fail_hook = True
+
+    # The catalog is written last as it hashes the final, formatted, files
+    if index_path and write_catalog(dest, index_path):
+        print(f"Updated catalog {index_path}")
+        should_fail_hook = True
+
+    return should_fail_hook
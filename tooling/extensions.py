@@ -0,0 +1,218 @@
+"""
+Optional additions to the specs, declared next to DEFINITION in the python sources.
+
+The upstream converter ignores these module variables, so the sources stay compatible
+with it:
+
+CONTENT_TYPES = ["application/msgpack", "application/cbor"]
+    Content types the request and the successful response can also be sent in, besides
+    JSON, with the same schema.
+
+CACHE_POLICY = {"max_age": 300, "stale_while_revalidate": 60, "vary": ["authorization"]}
+    How long the successful response stays valid, in seconds, how long after that a
+    stale response can be served while it's revalidated, and the request headers the
+    response varies by. Definitions requiring consent or authorization have to vary by
+    x-consent-token or authorization to be cached. {"no_store": True} forbids caching.
+    Added as the x-cache-policy extension of the operation and the Cache-Control and
+    Vary headers of the successful response.
+
+CONDITIONAL_REQUESTS = True
+    The successful response has an ETag header, and requests can send it back in the
+    If-None-Match header to get an empty 304 response while the data hasn't changed.
+    The 304 response is declared in the x-conditional-requests extension of the
+    operation.
+
+CODE_LISTS = [IndustrySector, Country]
+    Enums of the codelists package to reference as shared code lists instead of listing
+    their values in the spec, see tooling.code_lists.
+"""
+import copy
+from enum import Enum
+from types import ModuleType
+from typing import Any, Dict, List, Type
+
+from tooling.code_lists import code_list_of_enum, code_list_schema
+from tooling.codecs import BINARY_CONTENT_TYPES, JSON
+
+CACHE_POLICY_KEYS = ["max_age", "stale_while_revalidate", "vary", "no_store"]
+IF_NONE_MATCH_DESCRIPTION = (
+    "ETag of a previous response, to get a 304 response if it hasn't changed"
+)
+
+
+def add_content_types(spec: dict, content_types: List[str]) -> dict:
+    """
+    Declare additional content types for the request body and the 200 response
+    """
+    unsupported = [t for t in content_types if t not in BINARY_CONTENT_TYPES]
+    if unsupported:
+        raise ValueError(
+            f"Unsupported content types: {', '.join(unsupported)}, supported are "
+            f"{', '.join(BINARY_CONTENT_TYPES)}"
+        )
+    spec = copy.deepcopy(spec)
+    for path_item in spec["paths"].values():
+        operation = path_item["post"]
+        for body in (operation["requestBody"], operation["responses"]["200"]):
+            content = body["content"]
+            for content_type in content_types:
+                content[content_type] = copy.deepcopy(content[JSON])
+    return spec
+
+
+def cache_control(policy: Dict[str, Any]) -> str:
+    """
+    Get the Cache-Control header of a cache policy
+    """
+    if policy.get("no_store"):
+        return "no-store"
+    directives = [f"max-age={policy['max_age']}"]
+    if policy.get("stale_while_revalidate"):
+        directives.append(f"stale-while-revalidate={policy['stale_while_revalidate']}")
+    return ", ".join(directives)
+
+
+def _header_name(name: str) -> str:
+    return "-".join(part.capitalize() for part in name.split("-"))
+
+
+def add_cache_policy(spec: dict, policy: Dict[str, Any], definition: Any) -> dict:
+    """
+    Declare how long the successful response of a spec can be cached
+    """
+    unknown = set(policy) - set(CACHE_POLICY_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown cache policy keys: {', '.join(sorted(unknown))}")
+    if policy.get("no_store"):
+        if len(policy) > 1:
+            raise ValueError("A no_store cache policy can't have other keys")
+        extension = {"noStore": True}
+        vary: List[str] = []
+    else:
+        for key in ("max_age", "stale_while_revalidate"):
+            value = policy.get(key, 0)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"The {key} of the cache policy must be seconds")
+        if "max_age" not in policy:
+            raise ValueError("The cache policy requires max_age or no_store")
+        vary = [v.lower() for v in policy.get("vary", [])]
+        for header, required in (
+            ("authorization", definition.requires_authorization),
+            ("x-consent-token", definition.requires_consent),
+        ):
+            if required and policy["max_age"] and header not in vary:
+                raise ValueError(
+                    f"The response requires the {header} header, so the cache policy "
+                    f"must vary by it"
+                )
+        extension = {
+            "maxAge": policy["max_age"],
+            "staleWhileRevalidate": policy.get("stale_while_revalidate", 0),
+            "vary": vary,
+        }
+
+    spec = copy.deepcopy(spec)
+    for path_item in spec["paths"].values():
+        operation = path_item["post"]
+        headers = {
+            p["name"] for p in operation.get("parameters", []) if p["in"] == "header"
+        }
+        missing = [v for v in vary if v not in headers]
+        if missing:
+            raise ValueError(
+                f"The cache policy varies by {', '.join(missing)}, which the request "
+                "doesn't have"
+            )
+        operation["x-cache-policy"] = extension
+        response_headers = operation["responses"]["200"].setdefault("headers", {})
+        response_headers["Cache-Control"] = {
+            "description": "How long the response can be cached",
+            "schema": {"type": "string", "enum": [cache_control(policy)]},
+        }
+        if vary:
+            response_headers["Vary"] = {
+                "description": "Request headers the response varies by",
+                "schema": {
+                    "type": "string",
+                    "enum": [", ".join(_header_name(v) for v in vary)],
+                },
+            }
+    return spec
+
+
+def add_conditional_requests(spec: dict) -> dict:
+    """
+    Declare the ETag header of the successful response, the If-None-Match header of
+    the request and the 304 response. The 304 response is in the x-conditional-requests
+    extension of the operation, as openapi-to-fastapi requires a JSON body model for
+    each response and a 304 response has no body.
+    """
+    etag = {
+        "description": "Version of the response, to send in If-None-Match",
+        "schema": {"type": "string"},
+    }
+    spec = copy.deepcopy(spec)
+    for path_item in spec["paths"].values():
+        operation = path_item["post"]
+        operation.setdefault("parameters", []).append(
+            {
+                "name": "if-none-match",
+                "in": "header",
+                "required": False,
+                "schema": {
+                    "type": "string",
+                    "description": IF_NONE_MATCH_DESCRIPTION,
+                    "title": "If-None-Match",
+                },
+                "description": IF_NONE_MATCH_DESCRIPTION,
+            }
+        )
+        operation["responses"]["200"].setdefault("headers", {})["ETag"] = etag
+        operation["x-conditional-requests"] = {
+            "notModified": {
+                "description": "Not Modified, the response still has the ETag sent "
+                "in If-None-Match",
+                "headers": {"ETag": etag},
+            }
+        }
+    return spec
+
+
+def add_code_lists(spec: dict, enums: List[Type[Enum]]) -> dict:
+    """
+    Replace the inline enums of a spec with references to their code lists
+    """
+    spec = copy.deepcopy(spec)
+    schemas = spec["components"]["schemas"]
+    for enum in enums:
+        code_list = code_list_of_enum(enum)
+        if code_list.name not in schemas:
+            raise ValueError(f"The spec doesn't use the code list {code_list.name}")
+        schemas[code_list.name] = code_list_schema(schemas[code_list.name], code_list)
+    return spec
+
+
+def content_types(spec: dict) -> List[str]:
+    """
+    Get the content types of the request body of a spec
+    """
+    (path_item,) = spec["paths"].values()
+    return list(path_item["post"]["requestBody"]["content"])
+
+
+def apply_extensions(spec: dict, module: ModuleType) -> dict:
+    """
+    Apply the additions declared in the module of a definition to its spec
+    """
+    types = getattr(module, "CONTENT_TYPES", None)
+    if types:
+        spec = add_content_types(spec, types)
+    policy = getattr(module, "CACHE_POLICY", None)
+    if policy is not None:
+        spec = add_cache_policy(spec, policy, module.DEFINITION)
+    if getattr(module, "CONDITIONAL_REQUESTS", False):
+        spec = add_conditional_requests(spec)
+    enums = getattr(module, "CODE_LISTS", None)
+    if enums:
+        spec = add_code_lists(spec, enums)
+    return spec
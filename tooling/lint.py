@@ -0,0 +1,244 @@
+"""
+Performance lint of the definitions and worst-case payload sizes.
+
+The lint flags constructs that make the cost of a request unpredictable for a gateway:
+lists and strings without an upper bound, offset pagination, responses that echo the
+whole request and set fields. The worst-case size is the largest compact JSON document
+the constraints of a model allow, with assumed bounds where there are none.
+"""
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from tooling.payloads import model_schema
+from tooling.registry import DefinitionRegistry
+
+try:
+    import re._parser as sre_parse
+    from re._constants import MAXREPEAT
+except ImportError:  # Python < 3.11
+    import sre_parse
+    from sre_constants import MAXREPEAT
+
+# Widest serialized forms of the values that don't have a length constraint
+FORMAT_LENGTHS = {
+    "date": 10,
+    # e.g. 2023-01-01T00:00:00.000000+00:00
+    "date-time": 32,
+    "email": 254,
+    "uri": 2083,
+}
+# Integers without both bounds are assumed to fit in 64 bits
+INTEGER_LENGTH = len(str(-(2**63)))
+NUMBER_LENGTH = len(repr(-1.7976931348623157e308))
+# A control character is escaped as \uXXXX
+CHARACTER_BYTES = 6
+
+
+@dataclass(frozen=True)
+class Finding:
+    definition: str
+    location: str
+    rule: str
+    message: str
+
+
+def _options(schema: dict) -> List[dict]:
+    return [o for o in schema.get("anyOf", [schema]) if o.get("type") != "null"]
+
+
+def _bounded_pattern_length(pattern: str) -> Optional[int]:
+    """
+    Get the maximum length of the strings matching an anchored pattern, None if the
+    pattern doesn't limit the length
+    """
+    if not (pattern.startswith("^") and pattern.endswith("$")):
+        return None
+    width = sre_parse.parse(pattern).getwidth()[1]
+    return None if width >= MAXREPEAT else width
+
+
+def _string_length(schema: dict) -> Optional[int]:
+    if "maxLength" in schema:
+        return schema["maxLength"]
+    if "format" in schema and schema["format"] in FORMAT_LENGTHS:
+        return FORMAT_LENGTHS[schema["format"]]
+    if "pattern" in schema:
+        return _bounded_pattern_length(schema["pattern"])
+    return None
+
+
+def _iter_properties(schema: dict) -> Iterator[Tuple[str, str, dict]]:
+    """
+    Iterate over the model name, field name and schema of every field of a model and
+    the models nested in it
+    """
+    for model in [schema, *schema.get("$defs", {}).values()]:
+        for name, prop in model.get("properties", {}).items():
+            yield model.get("title", ""), name, prop
+
+
+def lint_model(definition: str, model: Type[BaseModel], kind: str) -> Iterator[Finding]:
+    # Python field names are easier to find in the sources than the aliases
+    schema = model.model_json_schema(by_alias=False)
+    for model_name, name, prop in _iter_properties(schema):
+        location = f"{model_name}.{name}"
+        for option in _options(prop):
+            option_type = option.get("type")
+            if option_type == "array":
+                if option.get("uniqueItems"):
+                    yield Finding(
+                        definition,
+                        location,
+                        "set-field",
+                        "Set fields have to be checked for duplicates on validation",
+                    )
+                if "maxItems" not in option:
+                    yield Finding(
+                        definition, location, "unbounded-list", "List has no max_length"
+                    )
+            elif (
+                option_type == "string"
+                and "enum" not in option
+                and _string_length(option) is None
+            ):
+                yield Finding(
+                    definition,
+                    location,
+                    "unbounded-string",
+                    "String has no max_length",
+                )
+        if kind == "request" and name == "offset":
+            yield Finding(
+                definition,
+                location,
+                "offset-pagination",
+                "Offset pagination gets slower the deeper the page, prefer a cursor",
+            )
+
+
+def lint_definition(registry: DefinitionRegistry, name: str) -> List[Finding]:
+    definition = registry[name]
+    findings = [
+        *lint_model(name, definition.request, "request"),
+        *lint_model(name, definition.response, "response"),
+    ]
+    if issubclass(definition.response, definition.request):
+        findings.append(
+            Finding(
+                name,
+                definition.response.__name__,
+                "echoed-request",
+                f"Response extends {definition.request.__name__} and echoes the "
+                "whole request back",
+            )
+        )
+    # A field can be flagged in both the request and the response
+    return sorted(set(findings), key=lambda f: (f.location, f.rule))
+
+
+class SizeEstimator:
+    """
+    Estimate the largest compact JSON serialization a schema allows.
+
+    :param definitions: Schemas that "$ref" values point to, by name
+    :param assumed_items: Number of items assumed for lists without maxItems
+    :param assumed_length: Length assumed for strings without maxLength
+    """
+
+    def __init__(
+        self, definitions: Dict[str, dict], assumed_items: int, assumed_length: int
+    ):
+        self.definitions = definitions
+        self.assumed_items = assumed_items
+        self.assumed_length = assumed_length
+        self._resolving: Set[str] = set()
+
+    def estimate(self, schema: dict) -> Tuple[int, bool]:
+        """
+        :return: Size in bytes and whether the size is bounded by the constraints
+            alone, i.e. no assumed bounds were needed
+        """
+        if "$ref" in schema:
+            name = schema["$ref"].rpartition("/")[2]
+            if name in self._resolving:
+                # Recursive models have no bound, count one more level as null
+                return 4, False
+            self._resolving.add(name)
+            try:
+                return self.estimate(self.definitions[name])
+            finally:
+                self._resolving.discard(name)
+        if "const" in schema:
+            return len(json.dumps(schema["const"], separators=(",", ":"))), True
+        if "enum" in schema:
+            return (
+                max(len(json.dumps(v, ensure_ascii=False)) for v in schema["enum"]),
+                True,
+            )
+        if "allOf" in schema:
+            return self.estimate(schema["allOf"][0])
+        if "anyOf" in schema:
+            estimates = [self.estimate(o) for o in schema["anyOf"]]
+            return max(e[0] for e in estimates), all(e[1] for e in estimates)
+
+        schema_type = schema.get("type", "object")
+        if schema_type == "object":
+            return self._estimate_object(schema)
+        if schema_type == "array":
+            items, bounded = self.estimate(schema.get("items", {}))
+            count = schema.get("maxItems")
+            if count is None:
+                count, bounded = self.assumed_items, False
+            return 2 + count * items + max(count - 1, 0), bounded
+        if schema_type == "string":
+            if schema.get("format") in FORMAT_LENGTHS:
+                # Formatted values are plain ASCII
+                return 2 + FORMAT_LENGTHS[schema["format"]], True
+            length = _string_length(schema)
+            bounded = length is not None
+            if length is None:
+                length = self.assumed_length
+            return 2 + length * CHARACTER_BYTES, bounded
+        if schema_type == "integer":
+            return self._estimate_integer(schema)
+        if schema_type == "number":
+            return NUMBER_LENGTH, True
+        if schema_type == "boolean":
+            return 5, True
+        return 4, True
+
+    def _estimate_object(self, schema: dict) -> Tuple[int, bool]:
+        size = 2
+        bounded = True
+        properties = schema.get("properties", {})
+        for name, prop in properties.items():
+            value, value_bounded = self.estimate(prop)
+            size += len(json.dumps(name, ensure_ascii=False)) + 1 + value
+            bounded = bounded and value_bounded
+        if not properties and "additionalProperties" in schema:
+            # Free-form dictionaries have no bound on the keys
+            return 2 + self.assumed_length * CHARACTER_BYTES, False
+        return size + max(len(properties) - 1, 0), bounded
+
+    @staticmethod
+    def _estimate_integer(schema: dict) -> Tuple[int, bool]:
+        limits = [
+            schema[key]
+            for key in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+            if key in schema
+        ]
+        if len(limits) < 2:
+            return INTEGER_LENGTH, True
+        return max(len(str(int(limit))) for limit in limits), True
+
+
+def worst_case_size(
+    model: Type[BaseModel], assumed_items: int, assumed_length: int
+) -> Dict[str, object]:
+    schema = model_schema(model)
+    estimator = SizeEstimator(schema.get("$defs", {}), assumed_items, assumed_length)
+    size, bounded = estimator.estimate(schema)
+    return {"bytes": size, "bounded": bounded}
@@ -0,0 +1,387 @@
+"""
+Local stand-in for the data sources of the data products, for load testing gateways.
+
+Each spec under the definitions directory is mounted on its POST route. Requests are
+validated against the request schema of the spec and answered with a response built
+from the examples or synthesized from the response schema. The server runs in several
+pre-forked worker processes that accept connections from one shared socket.
+
+Successful responses have the Cache-Control and Vary headers declared in the spec, and
+for specs with conditional requests an ETag of the body, with a 304 response to
+requests sending the same ETag in If-None-Match.
+"""
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import socket
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from http import HTTPStatus
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tooling.checker import error
+from tooling.codegen import compile_validators
+from tooling.payloads import ExampleBuilder
+from tooling.schema import (
+    component_schemas,
+    get_operation,
+    get_path,
+    iter_specs,
+    load_spec,
+)
+from tooling.synth import Synthesizer
+
+DEFAULT_SETTINGS = {
+    # Mean and standard deviation of the added response latency
+    "latency_ms": 0.0,
+    "latency_jitter_ms": 0.0,
+    # Share of requests answered with one of the error responses of the spec
+    "error_rate": 0.0,
+    # Number of items in each list of the response
+    "list_size": 1,
+    # "example" for a fixed response built from the examples of the fields,
+    # "synth" for a new random response to every request
+    "response": "example",
+}
+MAX_HEADER_SIZE = 64 * 1024
+
+
+def load_settings(path: Optional[Path]) -> Dict[str, Any]:
+    """
+    Load the mock settings file. The "default" settings apply to all definitions and
+    the "overrides" to definitions matching a glob pattern, e.g.
+
+    {"default": {"latency_ms": 20}, "overrides": {"Weather/*": {"error_rate": 0.01}}}
+    """
+    settings = {"default": {}, "overrides": {}}
+    if path is not None:
+        settings.update(json.loads(path.read_text(encoding="utf-8")))
+    return settings
+
+
+def settings_for(settings: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """
+    Get the settings of a definition, later matching overrides take precedence
+    """
+    result = {**DEFAULT_SETTINGS, **settings["default"]}
+    for pattern, override in settings["overrides"].items():
+        if fnmatchcase(name, pattern):
+            result.update(override)
+    unknown = set(result) - set(DEFAULT_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown mock settings: {', '.join(sorted(unknown))}")
+    return result
+
+
+def json_body(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def schema_of(response: dict) -> Optional[dict]:
+    return response.get("content", {}).get("application/json", {}).get("schema")
+
+
+def reason_phrase(status: int, default: str) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return default
+
+
+@dataclass
+class Route:
+    path: str
+    settings: Dict[str, Any]
+    validate: Callable[[Any], List[dict]]
+    respond: Callable[[Random], bytes]
+    # Status code, reason and body of each error response of the spec
+    errors: List[Tuple[int, str, bytes]] = field(default_factory=list)
+    # Headers of the successful response with a fixed value in the spec
+    headers: Dict[str, str] = field(default_factory=dict)
+    # Whether the spec declares ETags and 304 responses
+    conditional: bool = False
+
+
+def etag_of(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check if an ETag is in an If-None-Match header, with the weak comparison
+    """
+    if if_none_match.strip() == "*":
+        return True
+    tags = (t.strip() for t in if_none_match.split(","))
+    return any((t[2:] if t.startswith("W/") else t) == etag for t in tags)
+
+
+def fixed_headers(response: dict) -> Dict[str, str]:
+    """
+    Get the headers of a response that have a single possible value in the spec, e.g.
+    Cache-Control
+    """
+    headers = {}
+    for name, header in response.get("headers", {}).items():
+        values = header.get("schema", {}).get("enum", [])
+        if len(values) == 1:
+            headers[name] = values[0]
+    return headers
+
+
+def build_route(spec: dict, settings: Dict[str, Any]) -> Route:
+    path = get_path(spec)
+    route_settings = settings_for(settings, path.lstrip("/"))
+    definitions = component_schemas(spec)
+    operation = get_operation(spec)
+    response_schema = schema_of(operation["responses"]["200"])
+    validators = compile_validators(spec)
+    list_size = route_settings["list_size"]
+
+    if route_settings["response"] == "synth":
+        generate = Synthesizer(definitions, (list_size, list_size)).compile(
+            response_schema
+        )
+
+        def respond(rng: Random) -> bytes:
+            return json_body(generate(rng))
+
+    else:
+        body = json_body(ExampleBuilder(definitions, list_size).build(response_schema))
+
+        def respond(rng: Random) -> bytes:
+            return body
+
+    errors = []
+    for status, response in operation["responses"].items():
+        error_schema = schema_of(response)
+        if status in ("200", "422") or error_schema is None:
+            continue
+        error_body = ExampleBuilder(definitions).build(error_schema)
+        reason = reason_phrase(int(status), response["description"])
+        errors.append((int(status), reason, json_body(error_body)))
+
+    return Route(
+        path=path,
+        settings=route_settings,
+        validate=lambda body: validators["validate_request"](body, ("body",)),
+        respond=respond,
+        errors=errors,
+        headers=fixed_headers(operation["responses"]["200"]),
+        conditional="x-conditional-requests" in operation,
+    )
+
+
+def build_routes(root: Path, settings: Dict[str, Any]) -> Dict[str, Route]:
+    routes = {}
+    for spec_path in iter_specs(root):
+        spec = load_spec(spec_path)
+        if "paths" not in spec:
+            continue
+        route = build_route(spec, settings)
+        routes[route.path] = route
+    return routes
+
+
+class BadRequest(Exception):
+    """
+    A request whose head can't be read, answered with the status before closing the
+    connection
+    """
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+
+
+def parse_head(head: bytes) -> Tuple[str, str, Dict[str, str], int]:
+    """
+    Parse the request line and the headers of a request
+
+    :return: Method, target, headers with lowercase names and length of the body
+    :raises BadRequest: When the request is malformed or has a chunked body
+    """
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    parts = request_line.split(" ")
+    if len(parts) != 3:
+        raise BadRequest(400, "Malformed request line")
+    method, target, _ = parts
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise BadRequest(
+            501, "Transfer-Encoding isn't supported, send a Content-Length"
+        )
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise BadRequest(400, "Invalid Content-Length")
+    return method, target, headers, length
+
+
+def write_response(
+    writer: asyncio.StreamWriter,
+    status: int,
+    reason: str,
+    body: bytes,
+    headers: Dict[str, str],
+    keep_alive: bool,
+) -> None:
+    # A 304 response has no body nor a length of its own
+    if status != 304:
+        headers = {
+            "content-type": "application/json",
+            "content-length": str(len(body)),
+            **headers,
+        }
+    headers["connection"] = "keep-alive" if keep_alive else "close"
+    head = f"HTTP/1.1 {status} {reason}\r\n" + "".join(
+        f"{name}: {value}\r\n" for name, value in headers.items()
+    )
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
+
+
+class MockServer:
+    """
+    Serve the routes over HTTP/1.1 with keep-alive
+    """
+
+    def __init__(self, routes: Dict[str, Route], seed: Optional[int] = None):
+        self.routes = routes
+        self.rng = Random(seed)
+
+    async def handle(
+        self, route: Route, body: bytes, headers: Dict[str, str]
+    ) -> Tuple[int, str, bytes, Dict[str, str]]:
+        """
+        :return: Status code, reason, body and extra headers of the response
+        """
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            detail = [error(("body",), "JSON decode error", "json_invalid")]
+            return 422, "Unprocessable Entity", json_body({"detail": detail}), {}
+        errors = route.validate(payload)
+        if errors:
+            return 422, "Unprocessable Entity", json_body({"detail": errors}), {}
+
+        settings = route.settings
+        if settings["latency_ms"] or settings["latency_jitter_ms"]:
+            latency = self.rng.gauss(
+                settings["latency_ms"], settings["latency_jitter_ms"]
+            )
+            await asyncio.sleep(max(latency, 0) / 1000)
+        if route.errors and self.rng.random() < settings["error_rate"]:
+            return (*self.rng.choice(route.errors), {})
+        response_body = route.respond(self.rng)
+        if not route.conditional:
+            return 200, "OK", response_body, route.headers
+        response_headers = {**route.headers, "ETag": etag_of(response_body)}
+        if etag_matches(headers.get("if-none-match", ""), response_headers["ETag"]):
+            return 304, "Not Modified", b"", response_headers
+        return 200, "OK", response_body, response_headers
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                try:
+                    method, target, headers, length = parse_head(head)
+                except BadRequest as e:
+                    # The end of the request is unknown, so the connection is closed
+                    reason = HTTPStatus(e.status).phrase
+                    body = json_body({"detail": str(e)})
+                    write_response(writer, e.status, reason, body, {}, False)
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length)
+
+                route = self.routes.get(target.partition("?")[0])
+                response_headers: Dict[str, str] = {}
+                if route is None:
+                    status, reason = 404, "Not Found"
+                    response_body = json_body({"detail": "Not Found"})
+                elif method != "POST":
+                    status, reason = 405, "Method Not Allowed"
+                    response_body = json_body({"detail": "Method Not Allowed"})
+                else:
+                    status, reason, response_body, response_headers = await self.handle(
+                        route, body, headers
+                    )
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                write_response(
+                    writer, status, reason, response_body, response_headers, keep_alive
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, sock: socket.socket) -> None:
+        server = await asyncio.start_server(
+            self.serve_connection, sock=sock, limit=MAX_HEADER_SIZE
+        )
+        async with server:
+            await server.serve_forever()
+
+
+def _run_worker(server: MockServer, sock: socket.socket) -> None:
+    try:
+        asyncio.run(server.serve(sock))
+    except KeyboardInterrupt:
+        pass
+
+
+def run_mock_server(
+    routes: Dict[str, Route],
+    host: str,
+    port: int,
+    workers: int = 1,
+    seed: Optional[int] = None,
+) -> None:
+    """
+    Serve the routes until interrupted. The routes are built before forking so the
+    workers share them, and each worker gets its own seed.
+    """
+    sock = socket.create_server((host, port), backlog=4096)
+    if workers <= 1:
+        _run_worker(MockServer(routes, seed), sock)
+        return
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=_run_worker,
+            args=(MockServer(routes, None if seed is None else seed + i), sock),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    sock.close()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
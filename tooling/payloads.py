@@ -0,0 +1,148 @@
+"""
+Payloads built from the JSON schemas of the definition models.
+
+Example payloads use the examples of the fields where they exist, and the simplest
+value satisfying the constraints of the field otherwise.
+"""
+import re
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+from tooling.code_lists import enum_values
+
+
+def model_schema(model: Type[BaseModel]) -> dict:
+    """
+    JSON schema of a model with the camelCase field names used on the wire
+    """
+    return model.model_json_schema(by_alias=True)
+
+
+def fits_constraints(schema: dict, value: Any) -> bool:
+    """
+    Check the value against the length, range and pattern constraints of a schema
+    """
+    if "anyOf" in schema:
+        return any(fits_constraints(option, value) for option in schema["anyOf"])
+    if schema.get("type") == "null":
+        return value is None
+    if isinstance(value, str):
+        if len(value) < schema.get("minLength", 0):
+            return False
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            return False
+        if "pattern" in schema and not re.search(schema["pattern"], value):
+            return False
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        if "minimum" in schema and value < schema["minimum"]:
+            return False
+        if "maximum" in schema and value > schema["maximum"]:
+            return False
+        if "exclusiveMinimum" in schema and value <= schema["exclusiveMinimum"]:
+            return False
+        if "exclusiveMaximum" in schema and value >= schema["exclusiveMaximum"]:
+            return False
+    elif isinstance(value, list):
+        if len(value) < schema.get("minItems", 0):
+            return False
+        if "maxItems" in schema and len(value) > schema["maxItems"]:
+            return False
+    return True
+
+
+class ExampleBuilder:
+    """
+    Build an example payload for a JSON schema.
+
+    :param definitions: Schemas that "$ref" values point to, by name, i.e. "$defs" of a
+        model schema or "components/schemas" of an OpenAPI spec
+    :param list_size: Number of items to put in each array
+    """
+
+    def __init__(self, definitions: Dict[str, dict], list_size: int = 1):
+        self.definitions = definitions
+        self.list_size = list_size
+
+    def resolve(self, schema: dict) -> dict:
+        while "$ref" in schema:
+            schema = self.definitions[schema["$ref"].rpartition("/")[2]]
+        return schema
+
+    def build(self, schema: dict) -> Any:
+        schema = self.resolve(schema)
+        for example in schema.get("examples", []):
+            # Some examples don't fit the constraints of their field
+            if fits_constraints(schema, example):
+                return example
+        if "const" in schema:
+            return schema["const"]
+        values = enum_values(schema)
+        if values:
+            return values[0]
+        if "allOf" in schema:
+            return self.build(schema["allOf"][0])
+        if "anyOf" in schema:
+            options = [o for o in schema["anyOf"] if o.get("type") != "null"]
+            return self.build(options[0]) if options else None
+
+        schema_type = schema.get("type")
+        if schema_type == "object":
+            return {
+                name: self.build(prop)
+                for name, prop in schema.get("properties", {}).items()
+            }
+        if schema_type == "array":
+            size = max(self.list_size, schema.get("minItems", 0))
+            size = min(size, schema.get("maxItems", size))
+            item = self.build(schema.get("items", {}))
+            if schema.get("uniqueItems") and size > 1:
+                # Items of sets can't be repeated, so only one item is used
+                return [item]
+            return [item] * size
+        if schema_type == "string":
+            return self.build_string(schema)
+        if schema_type in ("integer", "number"):
+            return self.build_number(schema)
+        if schema_type == "boolean":
+            return True
+        return None
+
+    @staticmethod
+    def build_string(schema: dict) -> str:
+        string_format = schema.get("format")
+        if string_format == "date":
+            return "2023-01-01"
+        if string_format == "date-time":
+            return "2023-01-01T00:00:00Z"
+        if string_format == "email":
+            return "user@example.com"
+        if string_format == "uri":
+            return "https://example.com"
+        return "a" * max(schema.get("minLength", 1), 1)
+
+    @staticmethod
+    def build_number(schema: dict) -> float:
+        value = 0
+        if "minimum" in schema:
+            value = max(value, schema["minimum"])
+        if "exclusiveMinimum" in schema:
+            value = max(value, schema["exclusiveMinimum"] + 1)
+        if "maximum" in schema:
+            value = min(value, schema["maximum"])
+        if "exclusiveMaximum" in schema:
+            value = min(value, schema["exclusiveMaximum"] - 1)
+        if schema.get("type") == "integer":
+            return int(value)
+        return value
+
+
+def example_payload(model: Type[BaseModel], list_size: int = 1) -> dict:
+    """
+    Build a valid example payload for a model, in its JSON form
+    """
+    schema = model_schema(model)
+    payload = ExampleBuilder(schema.get("$defs", {}), list_size).build(schema)
+    # Validate the payload to catch examples that don't fit the constraints
+    model.model_validate(payload)
+    return payload
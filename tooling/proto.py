@@ -0,0 +1,255 @@
+"""
+Protocol Buffers schemas of the request and response models of the specs.
+
+Every object schema used by the request or the response becomes a message. Field
+numbers are kept in a lock file with the types of the fields, so a field keeps its
+number when other fields are added, removed or reordered, and the numbers of removed
+fields are reserved instead of being reused. A field whose type changes gets a new
+number and its old number is reserved, as the old values can't be read as the new type.
+Values keep the form they have in JSON, e.g. dates and enums are strings,
+so the messages carry the same data as the other content types.
+"""
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from tooling.schema import component_schemas, get_operation, iter_refs
+
+LOCK_VERSION = 2
+DEFAULT_LOCK = Path("proto.lock.json")
+SCALAR_TYPES = {
+    "string": "string",
+    "integer": "int64",
+    "number": "double",
+    "boolean": "bool",
+}
+# Any JSON value, for schemas without a type
+VALUE_TYPE = "google.protobuf.Value"
+
+# Numbers and types of the fields, and the reserved numbers of fields whose type
+# changed, of each message of each definition:
+# {"fields": {"origin": {"number": 2, "type": "string"}}, "reserved": [1]}
+MessageLock = Dict[str, Any]
+Numbering = Dict[str, Dict[str, MessageLock]]
+
+
+def _upgrade_lock(definitions: Dict[str, Dict[str, Dict[str, int]]]) -> Numbering:
+    """
+    Get the numbering of a lock file of version 1, which only had the numbers. The
+    types are filled in by the next export.
+    """
+    return {
+        definition: {
+            message: {
+                "fields": {
+                    wire_name: {"number": number, "type": None}
+                    for wire_name, number in numbers.items()
+                },
+                "reserved": [],
+            }
+            for message, numbers in messages.items()
+        }
+        for definition, messages in definitions.items()
+    }
+
+
+def load_lock(path: Path) -> Numbering:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") == 1:
+        return _upgrade_lock(data["definitions"])
+    if data.get("version") != LOCK_VERSION:
+        return {}
+    return data["definitions"]
+
+
+def save_lock(path: Path, numbering: Numbering) -> None:
+    data = {
+        "version": LOCK_VERSION,
+        "definitions": {name: numbering[name] for name in sorted(numbering)},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def snake_case(name: str) -> str:
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    return re.sub(r"\W", "_", name).lower()
+
+
+def json_name(field_name: str) -> str:
+    """
+    Get the JSON name protoc derives from a field name
+    """
+    parts = field_name.split("_")
+    return parts[0] + "".join(p[:1].upper() + p[1:] for p in parts[1:])
+
+
+def package_name(definition: str) -> str:
+    """
+    Get the protobuf package of a definition, e.g. energy.battery.charging_history.v1_0
+    for Energy/Battery/ChargingHistory_v1.0
+    """
+    *parents, name = definition.split("/")
+    name, _, version = name.partition("_v")
+    parts = [*parents, name] + ([f"v{version}"] if version else [])
+    return ".".join(snake_case(p).strip("_") for p in parts)
+
+
+def _is_message(schema: dict) -> bool:
+    return schema.get("type") == "object" and "properties" in schema
+
+
+class ProtoGenerator:
+    """
+    Generate the messages of the schemas of a spec.
+
+    :param definitions: Component schemas of the spec, by name
+    :param numbers: Field numbers and types of each message, updated with the new and
+        changed fields
+    """
+
+    def __init__(self, definitions: Dict[str, dict], numbers: Dict[str, MessageLock]):
+        self.definitions = definitions
+        self.numbers = numbers
+        self.uses_value = False
+
+    def _resolve(self, schema: dict) -> dict:
+        while True:
+            if "allOf" in schema and len(schema["allOf"]) == 1:
+                schema = schema["allOf"][0]
+            elif "$ref" in schema:
+                name = schema["$ref"].rpartition("/")[2]
+                if _is_message(self.definitions[name]):
+                    return schema
+                schema = self.definitions[name]
+            else:
+                return schema
+
+    def field_type(self, schema: dict) -> str:
+        """
+        Get the type of a field, "repeated" or "optional" and the type for arrays and
+        nullable fields
+        """
+        schema = self._resolve(schema)
+        if "$ref" in schema:
+            return schema["$ref"].rpartition("/")[2]
+        if "anyOf" in schema:
+            options = [o for o in schema["anyOf"] if o.get("type") != "null"]
+            if len(options) != 1:
+                self.uses_value = True
+                return VALUE_TYPE
+            field_type = self.field_type(options[0])
+            if field_type.startswith(("repeated ", "optional ")):
+                return field_type
+            return f"optional {field_type}"
+        if "enum" in schema or "const" in schema:
+            values = schema.get("enum", [schema.get("const")])
+            if all(isinstance(v, str) for v in values):
+                return "string"
+        schema_type = schema.get("type")
+        if schema_type == "array":
+            item_type = self.field_type(schema.get("items", {}))
+            if item_type.startswith(("repeated ", "optional ")):
+                # Lists of lists and of nullable values don't map to repeated fields
+                self.uses_value = True
+                return f"repeated {VALUE_TYPE}"
+            return f"repeated {item_type}"
+        if schema_type in SCALAR_TYPES:
+            return SCALAR_TYPES[schema_type]
+        self.uses_value = True
+        return VALUE_TYPE
+
+    def number(self, lock: MessageLock, wire_name: str, field_type: str) -> int:
+        """
+        Get the number of a field, a new one if the field is new or its type changed
+        """
+        # Optional only tracks presence, the values are encoded the same way
+        if field_type.startswith("optional "):
+            field_type = field_type[len("optional ") :]
+        field = lock["fields"].get(wire_name)
+        if field is not None and field["type"] is None:
+            field["type"] = field_type
+        if field is None or field["type"] != field_type:
+            used = [f["number"] for f in lock["fields"].values()] + lock["reserved"]
+            if field is not None:
+                lock["reserved"].append(field["number"])
+            field = {"number": max(used, default=0) + 1, "type": field_type}
+            lock["fields"][wire_name] = field
+        return field["number"]
+
+    def message(self, name: str) -> str:
+        schema = self.definitions[name]
+        lock = self.numbers.setdefault(name, {"fields": {}, "reserved": []})
+        lines = []
+        if schema.get("description"):
+            lines.extend(f"// {line}" for line in schema["description"].splitlines())
+        lines.append(f"message {name} {{")
+        present = set()
+        for wire_name, prop in schema["properties"].items():
+            present.add(wire_name)
+            field_type = self.field_type(prop)
+            number = self.number(lock, wire_name, field_type)
+            field_name = snake_case(wire_name)
+            option = ""
+            if json_name(field_name) != wire_name:
+                option = f' [json_name = "{wire_name}"]'
+            lines.append(f"  {field_type} {field_name} = {number}{option};")
+        removed = sorted(
+            (f["number"], w) for w, f in lock["fields"].items() if w not in present
+        )
+        reserved = sorted([n for n, _ in removed] + lock["reserved"])
+        if reserved:
+            lines.append(f"  reserved {', '.join(str(n) for n in reserved)};")
+        if removed:
+            names = ", ".join(f'"{snake_case(w)}"' for _, w in removed)
+            lines.append(f"  reserved {names};")
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def message_names(spec: dict) -> List[str]:
+    """
+    Names of the object schemas used by the request and the response of a spec, in
+    order of use
+    """
+    definitions = component_schemas(spec)
+    operation = get_operation(spec)
+    pending = [
+        operation["requestBody"]["content"]["application/json"]["schema"],
+        operation["responses"]["200"]["content"]["application/json"]["schema"],
+    ]
+    names: List[str] = []
+    while pending:
+        for ref in iter_refs(pending.pop(0)):
+            name = ref.rpartition("/")[2]
+            if name not in names:
+                names.append(name)
+                pending.append(definitions[name])
+    return [n for n in names if _is_message(definitions[n])]
+
+
+def export_proto(
+    spec: dict, definition: str, numbers: Optional[Dict[str, MessageLock]] = None
+) -> str:
+    """
+    Generate the .proto schema of a spec. New and changed fields are added to the
+    numbers.
+    """
+    numbers = {} if numbers is None else numbers
+    generator = ProtoGenerator(component_schemas(spec), numbers)
+    messages = [generator.message(name) for name in message_names(spec)]
+    header = [
+        f"// Messages of the {definition} data product, generated from its OpenAPI "
+        "spec.",
+        "// Generated by `python -m tooling export-proto`, don't edit by hand.",
+        'syntax = "proto3";',
+        "",
+        f"package {package_name(definition)};",
+    ]
+    if generator.uses_value:
+        header.extend(["", 'import "google/protobuf/struct.proto";'])
+    return "\n".join(header) + "\n\n" + "\n\n".join(messages) + "\n"
@@ -0,0 +1,151 @@
+"""
+Lazy registry of the data product definitions in the python sources.
+
+Listing the definitions and reading their metadata only parses the sources, the
+definition modules are imported on first access and cached. Aliases share the module of
+the definition they mirror.
+
+Usage:
+
+registry = DefinitionRegistry(Path("src"))
+registry.names()
+registry.metadata("Energy/Battery/ChargingHistory_v1.0").version
+definition = registry["Energy/Battery/ChargingHistory_v1.0"]
+"""
+import ast
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+from tooling.aliases import alias_definition, load_aliases
+from tooling.sources import (
+    ensure_importable,
+    get_definition_name,
+    get_module_name,
+    import_source,
+    iter_sources,
+)
+
+if TYPE_CHECKING:
+    from definition_tooling.converter import DataProductDefinition
+
+
+@dataclass(frozen=True)
+class DefinitionMetadata:
+    """
+    Metadata of a definition, read from the literal arguments of the
+    DataProductDefinition call in the source. Arguments that aren't literals are None.
+    """
+
+    name: str
+    path: Path
+    version: Optional[str] = "0.0.1"
+    title: Optional[str] = None
+    description: Optional[str] = None
+    deprecated: Optional[bool] = False
+    requires_authorization: Optional[bool] = False
+    requires_consent: Optional[bool] = False
+
+
+def _definition_call(tree: ast.Module) -> Optional[ast.Call]:
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(
+                isinstance(t, ast.Name) and t.id == "DEFINITION" for t in node.targets
+            )
+            and isinstance(node.value, ast.Call)
+        ):
+            return node.value
+    return None
+
+
+def read_metadata(path: Path, name: str) -> DefinitionMetadata:
+    """
+    Read the metadata of a definition without importing it
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    call = _definition_call(tree)
+    if call is None:
+        raise ValueError(f"DEFINITION variable not found in {path}")
+
+    fields = set(DefinitionMetadata.__dataclass_fields__) - {"name", "path"}
+    values = {}
+    for keyword in call.keywords:
+        if keyword.arg in fields:
+            try:
+                values[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                values[keyword.arg] = None
+    return DefinitionMetadata(name=name, path=path, **values)
+
+
+class DefinitionRegistry:
+    def __init__(self, src: Path = Path("src")):
+        self.src = src
+        self._paths: Dict[str, Path] = {
+            get_definition_name(p, src): p for p in iter_sources(src)
+        }
+        self._aliases = load_aliases(src)
+        self._metadata: Dict[str, DefinitionMetadata] = {}
+        self._definitions: Dict[str, "DataProductDefinition"] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> Path:
+        try:
+            return self._paths[name.lstrip("/")]
+        except KeyError:
+            raise KeyError(f"Unknown data product definition: {name}") from None
+
+    def names(self) -> List[str]:
+        return sorted([*self._paths, *self._aliases])
+
+    def metadata(self, name: str) -> DefinitionMetadata:
+        name = name.lstrip("/")
+        if name not in self._metadata:
+            alias = self._aliases.get(name)
+            if alias:
+                source = self.metadata(alias.source)
+                metadata = replace(source, name=name, **alias.overrides)
+            else:
+                metadata = read_metadata(self._path(name), name)
+            self._metadata[name] = metadata
+        return self._metadata[name]
+
+    def get(self, name: str) -> "DataProductDefinition":
+        """
+        Get a definition, importing its module on first access
+        """
+        name = name.lstrip("/")
+        alias = self._aliases.get(name)
+        if alias:
+            source = self.get(alias.source)
+        else:
+            path = self._path(name)
+        with self._lock:
+            if name not in self._definitions:
+                if alias:
+                    self._definitions[name] = alias_definition(source, alias)
+                else:
+                    ensure_importable(self.src)
+                    module = import_source(path, get_module_name(name))
+                    self._definitions[name] = getattr(module, "DEFINITION")
+        return self._definitions[name]
+
+    def is_loaded(self, name: str) -> bool:
+        return name.lstrip("/") in self._definitions
+
+    def __getitem__(self, name: str) -> "DataProductDefinition":
+        return self.get(name)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and (
+            name.lstrip("/") in self._paths or name.lstrip("/") in self._aliases
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names())
+
+    def __len__(self) -> int:
+        return len(self._paths) + len(self._aliases)
@@ -0,0 +1,86 @@
+"""
+Helpers for working with the generated OpenAPI specs and their JSON schemas
+"""
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+LOCAL_SCHEMA_PREFIX = "#/components/schemas/"
+
+
+def iter_specs(root: Path) -> Iterator[Path]:
+    """
+    Iterate over the OpenAPI specs under the root in a stable order
+    """
+    return iter(sorted(root.glob("**/*.json"), key=lambda p: p.as_posix()))
+
+
+def load_spec(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def dump_spec(spec: dict) -> str:
+    """
+    Serialize a spec the same way as the converter does
+    """
+    return json.dumps(spec, indent=2, ensure_ascii=False) + "\n"
+
+
+def iter_refs(value: Any) -> Iterator[str]:
+    """
+    Iterate over all "$ref" values in a JSON document
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str):
+                yield item
+            else:
+                yield from iter_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_refs(item)
+
+
+def rewrite_refs(value: Any, rewrite: Callable[[str], str]) -> Any:
+    """
+    Return a copy of a JSON document with all "$ref" values passed through rewrite
+    """
+    if isinstance(value, dict):
+        return {
+            key: rewrite(item)
+            if key == "$ref" and isinstance(item, str)
+            else rewrite_refs(item, rewrite)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [rewrite_refs(item, rewrite) for item in value]
+    return value
+
+
+def local_schema_name(ref: str) -> str:
+    """
+    Get the schema name from a local "#/components/schemas/Name" reference
+    """
+    if not ref.startswith(LOCAL_SCHEMA_PREFIX):
+        raise ValueError(f"Not a local schema reference: {ref}")
+    return ref[len(LOCAL_SCHEMA_PREFIX) :]
+
+
+def component_schemas(spec: dict) -> Dict[str, dict]:
+    return spec.get("components", {}).get("schemas", {})
+
+
+def get_operation(spec: dict) -> dict:
+    """
+    Get the POST operation of a data product spec
+    """
+    (path_item,) = spec["paths"].values()
+    return path_item["post"]
+
+
+def get_path(spec: dict) -> str:
+    """
+    Get the route of a data product spec, e.g. "/AirQuality/Current_v1.0"
+    """
+    (path,) = spec["paths"]
+    return path
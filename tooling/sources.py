@@ -0,0 +1,116 @@
+import ast
+import hashlib
+import importlib.util
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Sequence
+
+
+def iter_sources(src: Path) -> Iterator[Path]:
+    """
+    Iterate over the definition sources in a stable order
+    """
+    return iter(sorted(src.glob("**/*.py"), key=lambda p: p.as_posix()))
+
+
+def get_definition_name(path: Path, src: Path) -> str:
+    """
+    Get the definition name, e.g. "AirQuality/Current_v1.0", based on the file path
+    """
+    return path.relative_to(src).with_suffix("").as_posix()
+
+
+def get_module_name(definition_name: str) -> str:
+    """
+    Generate a python module name based on the definition name/path, in the same way
+    as the upstream converter does
+    """
+    return definition_name.replace(".", "_").replace("/", ".")
+
+
+def ensure_importable(src: Path) -> None:
+    """
+    Make the modules shared by the definitions, like codelists, importable. They live
+    in the root of the project, next to the sources.
+    """
+    project_root = str(src.resolve().parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+
+def import_source(path: Path, module_name: str) -> ModuleType:
+    """
+    Import a definition source file as a module
+    """
+    spec = importlib.util.spec_from_file_location(name=module_name, location=str(path))
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Failed to import {path} module")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _imported_modules(path: Path) -> List[str]:
+    """
+    List absolute module names imported by a python file, without importing it
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+            # "from package import module" imports a submodule
+            modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return modules
+
+
+@lru_cache(maxsize=None)
+def _resolve_module(name: str, roots: Sequence[Path]) -> Optional[Path]:
+    """
+    Find the file of a module that lives inside one of the roots, without importing
+    anything. Modules from site-packages and the standard library return None.
+    """
+    parts = name.split(".")
+    for root in roots:
+        base = root.joinpath(*parts)
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def forget_module_files() -> None:
+    """
+    Forget the files of the modules found so far, after files were added or removed
+    """
+    _resolve_module.cache_clear()
+
+
+def find_local_dependencies(path: Path, roots: Sequence[Path]) -> List[Path]:
+    """
+    Find all files inside the roots that the given python file transitively imports.
+
+    Package __init__ files of imported submodules are included as they're executed on
+    import as well.
+    """
+    roots = tuple(roots)
+    seen: Dict[Path, None] = {}
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        for module in _imported_modules(current):
+            parts = module.split(".")
+            for i in range(1, len(parts) + 1):
+                dependency = _resolve_module(".".join(parts[:i]), roots)
+                if dependency and dependency != path and dependency not in seen:
+                    seen[dependency] = None
+                    pending.append(dependency)
+    return sorted(seen, key=lambda p: p.as_posix())
@@ -0,0 +1,580 @@
+"""
+Compact struct mirrors of the definition models.
+
+The request and response models of a definition, and the models nested in them, are
+turned into plain Python classes with __slots__, or msgspec structs when the msgspec
+backend is used. The structs keep the values in their wire form, e.g. dates as strings
+and enums as their values, and only convert nested models, so decoding a payload is
+little more than a validation pass and setting the attributes. Attributes use the
+Python field names of the models, and the structs are read from and written to the
+camelCase wire names.
+
+The msgspec structs check the formats of strings and the unique items of arrays, which
+msgspec constraints can't express, after decoding.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from tooling.codegen import FORMAT_CHECKS, HELPERS, ValidatorGenerator, function_name
+from tooling.registry import DefinitionRegistry
+
+BACKENDS = ["slots", "msgspec"]
+INDENT = "    "
+
+MODULE_DOCSTRING = '''"""
+Struct mirrors of the models of the {name} data product.
+
+Generated by `python -m tooling gen-structs`, don't edit by hand.
+"""
+'''
+SLOTS_HEADER = """import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(value):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class ValidationError(ValueError):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def _check(validate, value):
+    errors = []
+    validate(value, (), errors)
+    if errors:
+        raise ValidationError(errors)
+"""
+SLOTS_FOOTER = '''
+
+def decode(data, struct_type, validate=True):
+    """
+    Decode a struct from JSON, validating the data unless it's trusted
+    """
+    return struct_type.from_wire(_loads(data), validate)
+
+
+def encode(struct):
+    """
+    Encode a struct to compact JSON
+    """
+    return _dumps(struct.to_wire())
+
+
+def decode_request(data, validate=True):
+    return decode(data, {request}, validate)
+
+
+def decode_response(data, validate=True):
+    return decode(data, {response}, validate)
+'''
+MSGSPEC_HEADER = """from typing import List, Literal, Optional, Union
+
+import msgspec
+from msgspec import Meta
+from typing_extensions import Annotated
+
+ValidationError = msgspec.ValidationError
+"""
+MSGSPEC_FOOTER = '''
+
+_encoder = msgspec.json.Encoder()
+_decoders = {{}}
+
+
+def decode(data, struct_type, validate=True):
+    """
+    Decode a struct from JSON, msgspec always validates the data
+    """
+    decoder = _decoders.get(struct_type)
+    if decoder is None:
+        decoder = _decoders[struct_type] = msgspec.json.Decoder(struct_type)
+    return decoder.decode(data)
+
+
+def encode(struct):
+    """
+    Encode a struct to compact JSON
+    """
+    return _encoder.encode(struct)
+
+
+def decode_request(data, validate=True):
+    return decode(data, {request}, validate)
+
+
+def decode_response(data, validate=True):
+    return decode(data, {response}, validate)
+'''
+# JSON schema keywords and the msgspec Meta constraints they map to
+MSGSPEC_CONSTRAINTS = {
+    "minimum": "ge",
+    "exclusiveMinimum": "gt",
+    "maximum": "le",
+    "exclusiveMaximum": "lt",
+    "minLength": "min_length",
+    "maxLength": "max_length",
+    "minItems": "min_length",
+    "maxItems": "max_length",
+    "pattern": "pattern",
+}
+MSGSPEC_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "null": "None",
+}
+
+
+def nested_models(model: Type[BaseModel]) -> Dict[str, Type[BaseModel]]:
+    """
+    Find the models nested in the fields of a model, including the model itself, by
+    name
+    """
+    found: Dict[str, Type[BaseModel]] = {}
+    pending = [model]
+    while pending:
+        current = pending.pop()
+        if current.__name__ in found:
+            continue
+        found[current.__name__] = current
+        for field in current.model_fields.values():
+            pending.extend(_models_in(field.annotation))
+    return found
+
+
+def _models_in(annotation: Any) -> List[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [m for arg in getattr(annotation, "__args__", ()) for m in _models_in(arg)]
+
+
+def model_schemas(models: List[Type[BaseModel]]) -> Dict[str, Tuple[dict, List[str]]]:
+    """
+    Get the wire form JSON schema of every model and nested schema used by the models,
+    with the Python field names of the properties of the objects, by name
+    """
+    schemas: Dict[str, Tuple[dict, List[str]]] = {}
+    for model in models:
+        wire = model.model_json_schema(by_alias=True)
+        python = model.model_json_schema(by_alias=False)
+        wire_defs = {model.__name__: wire, **wire.pop("$defs", {})}
+        python_defs = {model.__name__: python, **python.pop("$defs", {})}
+        for name, schema in wire_defs.items():
+            field_names = list(python_defs[name].get("properties", {}))
+            if name in schemas and schemas[name][0] != schema:
+                raise ValueError(f"Different models with the same name {name}")
+            schemas[name] = (schema, field_names)
+    return schemas
+
+
+def _is_struct(schema: dict) -> bool:
+    return schema.get("type") == "object" and "properties" in schema
+
+
+class StructGenerator:
+    """
+    Generate the source code of struct classes for the models of a definition.
+
+    :param schemas: Wire form schemas and Python field names of the models, by name
+    """
+
+    def __init__(self, schemas: Dict[str, Tuple[dict, List[str]]]):
+        self.schemas = schemas
+        self._counter = 0
+
+    def _variable(self) -> str:
+        self._counter += 1
+        return f"_x{self._counter}"
+
+    def _resolve(self, schema: dict) -> dict:
+        if "allOf" in schema and len(schema["allOf"]) == 1:
+            return self._resolve(schema["allOf"][0])
+        return schema
+
+    def _struct_name(self, schema: dict) -> Optional[str]:
+        schema = self._resolve(schema)
+        if "$ref" not in schema:
+            return None
+        name = schema["$ref"].rpartition("/")[2]
+        return name if _is_struct(self.schemas[name][0]) else None
+
+    def _nullable(self, schema: dict) -> bool:
+        schema = self._resolve(schema)
+        if "$ref" in schema:
+            return self._nullable(self.schemas[schema["$ref"].rpartition("/")[2]][0])
+        if "anyOf" in schema:
+            return any(self._nullable(o) for o in schema["anyOf"])
+        return "type" not in schema or schema["type"] == "null"
+
+    def convert(self, schema: dict, value: str, method: str) -> Optional[str]:
+        """
+        Get an expression converting the value between its wire form and the
+        structs, None if the value is used as-is
+        """
+        schema = self._resolve(schema)
+        struct = self._struct_name(schema)
+        if struct:
+            if method == "to_wire":
+                return f"{value}.to_wire()"
+            return f"{struct}._from_wire({value})"
+        if "anyOf" in schema:
+            options = [o for o in schema["anyOf"] if o.get("type") != "null"]
+            converted = [self.convert(o, value, method) for o in options]
+            if not any(converted):
+                return None
+            if len(options) > 1:
+                raise ValueError("Unions of several models aren't supported")
+            return f"None if {value} is None else {converted[0]}"
+        if schema.get("type") == "array":
+            item = self._variable()
+            converted = self.convert(schema.get("items", {}), item, method)
+            if converted:
+                return f"[{converted} for {item} in {value}]"
+        return None
+
+    def slots_class(self, name: str) -> str:
+        schema, field_names = self.schemas[name]
+        properties = schema["properties"]
+        required = set(schema.get("required", []))
+        wire_names = list(properties)
+        lines = [
+            f"class {name}:",
+            f"{INDENT}__slots__ = {tuple(field_names)!r}",
+            "",
+        ]
+
+        # Required fields first, as the positional arguments
+        ordered = sorted(
+            zip(field_names, wire_names), key=lambda f: f[1] not in required
+        )
+        arguments = []
+        for field_name, wire_name in ordered:
+            if wire_name in required:
+                arguments.append(field_name)
+            else:
+                default = properties[wire_name].get("default")
+                arguments.append(f"{field_name}={default!r}")
+        lines.append(f"{INDENT}def __init__({', '.join(['self', *arguments])}):")
+        lines.extend(
+            f"{INDENT * 2}self.{field_name} = {field_name}"
+            for field_name in field_names
+        )
+        if not field_names:
+            lines.append(f"{INDENT * 2}pass")
+
+        lines.extend(
+            [
+                "",
+                f"{INDENT}@classmethod",
+                f"{INDENT}def from_wire(cls, value, validate=True):",
+                f"{INDENT * 2}if validate:",
+                f"{INDENT * 3}_check({function_name(name)}, value)",
+                f"{INDENT * 2}return cls._from_wire(value)",
+                "",
+                f"{INDENT}@classmethod",
+                f"{INDENT}def _from_wire(cls, value):",
+                f"{INDENT * 2}self = cls.__new__(cls)",
+            ]
+        )
+        for field_name, wire_name in zip(field_names, wire_names):
+            if wire_name in required:
+                read = f"value[{wire_name!r}]"
+            else:
+                default = properties[wire_name].get("default")
+                read = f"value.get({wire_name!r}, {default!r})"
+            converted = self.convert(properties[wire_name], "_v", "from_wire")
+            if converted:
+                lines.append(f"{INDENT * 2}_v = {read}")
+                read = converted
+            lines.append(f"{INDENT * 2}self.{field_name} = {read}")
+        lines.append(f"{INDENT * 2}return self")
+
+        lines.extend(["", f"{INDENT}def to_wire(self):"])
+        items = []
+        omitted = []
+        for field_name, wire_name in zip(field_names, wire_names):
+            attribute = f"self.{field_name}"
+            converted = self.convert(properties[wire_name], attribute, "to_wire")
+            prop = properties[wire_name]
+            if wire_name not in required and not self._nullable(prop):
+                # A None default of a field that isn't nullable can only be left out
+                omitted.append((wire_name, attribute, converted or attribute))
+            else:
+                items.append(f"{wire_name!r}: {converted or attribute}")
+        if not omitted:
+            lines.append(f"{INDENT * 2}return {{{', '.join(items)}}}")
+        else:
+            lines.append(f"{INDENT * 2}wire = {{{', '.join(items)}}}")
+            for wire_name, attribute, value in omitted:
+                lines.append(f"{INDENT * 2}if {attribute} is not None:")
+                lines.append(f"{INDENT * 3}wire[{wire_name!r}] = {value}")
+            lines.append(f"{INDENT * 2}return wire")
+
+        fields = "".join(f"self.{f}, " for f in field_names)
+        other_fields = "".join(f"other.{f}, " for f in field_names)
+        lines.extend(
+            [
+                "",
+                f"{INDENT}def __eq__(self, other):",
+                f"{INDENT * 2}if other.__class__ is not self.__class__:",
+                f"{INDENT * 3}return NotImplemented",
+                f"{INDENT * 2}return ({fields}) == ({other_fields})",
+                "",
+                f"{INDENT}def __repr__(self):",
+                f'{INDENT * 2}return f"{name}('
+                + ", ".join(f"{f}={{self.{f}!r}}" for f in field_names)
+                + ')"',
+            ]
+        )
+        return "\n".join(lines)
+
+    def msgspec_type(self, schema: dict) -> str:
+        schema = self._resolve(schema)
+        struct = self._struct_name(schema)
+        if struct:
+            return struct
+        if "$ref" in schema:
+            return self.msgspec_type(self.schemas[schema["$ref"].rpartition("/")[2]][0])
+        if "anyOf" in schema:
+            options = [self.msgspec_type(o) for o in schema["anyOf"]]
+            non_null = [o for o in options if o != "None"]
+            if len(non_null) == 1 and len(options) == 2:
+                return f"Optional[{non_null[0]}]"
+            return f"Union[{', '.join(options)}]"
+        if "enum" in schema:
+            return f"Literal[{', '.join(repr(v) for v in schema['enum'])}]"
+        if "const" in schema:
+            return f"Literal[{schema['const']!r}]"
+        schema_type = schema.get("type")
+        if schema_type == "array":
+            annotation = f"List[{self.msgspec_type(schema.get('items', {}))}]"
+        elif schema_type in MSGSPEC_TYPES:
+            annotation = MSGSPEC_TYPES[schema_type]
+        else:
+            return "object"
+        constraints = [
+            f"{MSGSPEC_CONSTRAINTS[key]}={schema[key]!r}"
+            for key in MSGSPEC_CONSTRAINTS
+            if key in schema
+        ]
+        if constraints:
+            return f"Annotated[{annotation}, Meta({', '.join(constraints)})]"
+        return annotation
+
+    def post_checks(self, schema: dict, value: str, depth: int) -> List[str]:
+        """
+        Get the lines checking the format and unique items of a value of a msgspec
+        struct, raising a ValueError that msgspec reports as a validation error
+        """
+        schema = self._resolve(schema)
+        if self._struct_name(schema):
+            return []
+        if "$ref" in schema:
+            ref = schema["$ref"].rpartition("/")[2]
+            return self.post_checks(self.schemas[ref][0], value, depth)
+        pad = INDENT * depth
+        if "anyOf" in schema:
+            options = [o for o in schema["anyOf"] if o.get("type") != "null"]
+            if len(options) != 1:
+                return []
+            checks = self.post_checks(options[0], value, depth + 1)
+            return [f"{pad}if {value} is not None:", *checks] if checks else []
+
+        lines = []
+        string_format = schema.get("format")
+        if string_format in FORMAT_CHECKS:
+            lines.extend(
+                [
+                    f"{pad}if not {FORMAT_CHECKS[string_format]}({value}):",
+                    f"{pad}{INDENT}raise ValueError("
+                    f'"Input should be a valid {string_format}")',
+                ]
+            )
+        if schema.get("type") == "array":
+            item = self._variable()
+            if schema.get("uniqueItems"):
+                index = self._variable()
+                lines.extend(
+                    [
+                        f"{pad}if any({item} in {value}[:{index}] "
+                        f"for {index}, {item} in enumerate({value})):",
+                        f'{pad}{INDENT}raise ValueError("Set items should be unique")',
+                    ]
+                )
+            checks = self.post_checks(schema.get("items", {}), item, depth + 1)
+            if checks:
+                lines.extend([f"{pad}for {item} in {value}:", *checks])
+        return lines
+
+    def msgspec_class(self, name: str) -> str:
+        schema, field_names = self.schemas[name]
+        properties = schema["properties"]
+        required = set(schema.get("required", []))
+        rename = {f: w for f, w in zip(field_names, properties) if f != w}
+        # Defaults are left out when encoding, as None defaults of fields that aren't
+        # nullable can't be decoded again
+        lines = [
+            f"class {name}(msgspec.Struct, kw_only=True, omit_defaults=True, "
+            f"rename={rename!r}):",
+        ]
+        if not field_names:
+            lines.append(f"{INDENT}pass")
+        for field_name, wire_name in zip(field_names, properties):
+            annotation = self.msgspec_type(properties[wire_name])
+            if wire_name in required:
+                lines.append(f"{INDENT}{field_name}: {annotation}")
+                continue
+            default = properties[wire_name].get("default")
+            if isinstance(default, (list, dict)):
+                default = f"msgspec.field(default_factory=lambda: {default!r})"
+            else:
+                default = repr(default)
+            lines.append(f"{INDENT}{field_name}: {annotation} = {default}")
+
+        checks = []
+        for field_name, wire_name in zip(field_names, properties):
+            value = f"self.{field_name}"
+            field_schema = properties[wire_name]
+            field_checks = self.post_checks(field_schema, value, 2)
+            nullable = self._nullable(field_schema)
+            if field_checks and wire_name not in required and not nullable:
+                # Left out fields can be None even when the schema isn't nullable
+                field_checks = [
+                    f"{INDENT * 2}if {value} is not None:",
+                    *(f"{INDENT}{line}" for line in field_checks),
+                ]
+            checks.extend(field_checks)
+        if checks:
+            lines.extend(["", f"{INDENT}def __post_init__(self):", *checks])
+        return "\n".join(lines)
+
+    def struct_names(self) -> List[str]:
+        """
+        Names of the models that become structs, with the nested models before the
+        models using them
+        """
+        ordered: List[str] = []
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in ordered or name in visiting:
+                return
+            visiting.add(name)
+            for ref in _refs(self.schemas[name][0]):
+                if ref in self.schemas and _is_struct(self.schemas[ref][0]):
+                    visit(ref)
+            ordered.append(name)
+
+        for name, (schema, _) in self.schemas.items():
+            if _is_struct(schema):
+                visit(name)
+        return ordered
+
+
+def _refs(value: Any) -> List[str]:
+    if isinstance(value, dict):
+        if "$ref" in value:
+            return [value["$ref"].rpartition("/")[2]]
+        return [r for item in value.values() for r in _refs(item)]
+    if isinstance(value, list):
+        return [r for item in value for r in _refs(item)]
+    return []
+
+
+def generate_struct_module(
+    name: str, request: Type[BaseModel], response: Type[BaseModel], backend: str
+) -> str:
+    """
+    Generate the source code of the struct module of a definition
+    """
+    schemas = model_schemas([request, response])
+    generator = StructGenerator(schemas)
+    names = generator.struct_names()
+    refs = {"request": request.__name__, "response": response.__name__}
+    if backend == "msgspec":
+        classes = [generator.msgspec_class(n) for n in names]
+        return "\n".join(
+            [
+                MODULE_DOCSTRING.format(name=name) + HELPERS + "\n" + MSGSPEC_HEADER,
+                *(f"\n{c}\n" for c in classes),
+                MSGSPEC_FOOTER.format(**refs),
+            ]
+        )
+
+    validators = ValidatorGenerator({n: schema for n, (schema, _) in schemas.items()})
+    for schema_name, (schema, _) in schemas.items():
+        validators.function(function_name(schema_name), schema)
+    classes = [generator.slots_class(n) for n in names]
+    return "\n".join(
+        [
+            MODULE_DOCSTRING.format(name=name) + HELPERS + "\n" + SLOTS_HEADER,
+            validators.source(),
+            *(f"\n{c}\n" for c in classes),
+            SLOTS_FOOTER.format(**refs),
+        ]
+    )
+
+
+def write_structs(
+    registry: DefinitionRegistry, names: List[str], dest: Path, backend: str
+) -> List[Path]:
+    """
+    Generate a struct module for each definition in dest, in the directory structure
+    of the definitions
+    """
+    written = []
+    for name in names:
+        definition = registry[name]
+        out_file = dest / f"{name}.py"
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        source = generate_struct_module(
+            name, definition.request, definition.response, backend
+        )
+        out_file.write_text(source, encoding="utf-8")
+        written.append(out_file)
+    return written
+
+
+def compile_structs(
+    name: str, request: Type[BaseModel], response: Type[BaseModel], backend: str
+) -> ModuleType:
+    """
+    Generate and import the struct module of a definition without writing it to disk
+    """
+    module_name = "structs_" + "".join(c if c.isalnum() else "_" for c in name)
+    module = ModuleType(module_name)
+    source = generate_struct_module(name, request, response, backend)
+    # msgspec resolves the annotations through the module
+    sys.modules[module_name] = module
+    exec(compile(source, name, "exec"), module.__dict__)
+    return module
+
+
+def load_struct_module(path: Path) -> ModuleType:
+    """
+    Import a generated struct module from its file
+    """
+    module_name = "structs_" + path.stem.replace(".", "_")
+    spec = importlib.util.spec_from_file_location(module_name, str(path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,355 @@
+"""
+Synthetic payloads that respect the constraints of a JSON schema.
+
+A schema is compiled once into a tree of generator functions, so generating each payload
+doesn't need to interpret the schema again. The output only depends on the seed.
+"""
+import json
+import multiprocessing
+import string
+from datetime import datetime, timedelta, timezone
+from random import Random
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+from tooling.code_lists import code_list_of
+
+try:
+    import re._parser as sre_parse
+    from re._constants import (
+        ANY,
+        AT,
+        BRANCH,
+        CATEGORY,
+        CATEGORY_DIGIT,
+        CATEGORY_SPACE,
+        CATEGORY_WORD,
+        IN,
+        LITERAL,
+        MAX_REPEAT,
+        MAXREPEAT,
+        MIN_REPEAT,
+        NEGATE,
+        NOT_LITERAL,
+        RANGE,
+        SUBPATTERN,
+    )
+except ImportError:  # Python < 3.11
+    import sre_parse
+    from sre_constants import (
+        ANY,
+        AT,
+        BRANCH,
+        CATEGORY,
+        CATEGORY_DIGIT,
+        CATEGORY_SPACE,
+        CATEGORY_WORD,
+        IN,
+        LITERAL,
+        MAX_REPEAT,
+        MAXREPEAT,
+        MIN_REPEAT,
+        NEGATE,
+        NOT_LITERAL,
+        RANGE,
+        SUBPATTERN,
+    )
+
+Generator = Callable[[Random], Any]
+
+PRINTABLE = string.ascii_letters + string.digits + " "
+CATEGORIES = {
+    CATEGORY_DIGIT: string.digits,
+    CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+    CATEGORY_SPACE: " ",
+}
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+# Upper bounds for values that have no upper bound in the schema
+DEFAULT_MAX_LENGTH = 16
+DEFAULT_MAX_REPEAT = 8
+DEFAULT_NUMBER_RANGE = 1_000_000
+
+
+def compile_pattern(pattern: str) -> Generator:
+    """
+    Compile a regular expression into a generator of strings matching it
+    """
+    return _compile_regex(sre_parse.parse(pattern))
+
+
+def _character_set(items: list) -> Tuple[str, bool]:
+    characters = []
+    negate = False
+    for op, value in items:
+        if op is NEGATE:
+            negate = True
+        elif op is LITERAL:
+            characters.append(chr(value))
+        elif op is RANGE:
+            characters.extend(chr(c) for c in range(value[0], value[1] + 1))
+        elif op is CATEGORY:
+            characters.extend(CATEGORIES.get(value, ""))
+    return "".join(characters), negate
+
+
+def _compile_regex(parsed) -> Generator:
+    parts: List[Generator] = []
+    for op, value in parsed:
+        if op is LITERAL:
+            parts.append(lambda rng, c=chr(value): c)
+        elif op is NOT_LITERAL:
+            choices = PRINTABLE.replace(chr(value), "")
+            parts.append(lambda rng, c=choices: rng.choice(c))
+        elif op is ANY:
+            parts.append(lambda rng: rng.choice(PRINTABLE))
+        elif op is IN:
+            characters, negate = _character_set(value)
+            if negate:
+                characters = "".join(c for c in PRINTABLE if c not in characters)
+            parts.append(lambda rng, c=characters: rng.choice(c))
+        elif op is CATEGORY:
+            parts.append(lambda rng, c=CATEGORIES.get(value, PRINTABLE): rng.choice(c))
+        elif op in (MAX_REPEAT, MIN_REPEAT):
+            low, high, sub = value
+            if high is MAXREPEAT:
+                high = low + DEFAULT_MAX_REPEAT
+            item = _compile_regex(sub)
+            parts.append(
+                lambda rng, lo=low, hi=high, g=item: "".join(
+                    g(rng) for _ in range(rng.randint(lo, hi))
+                )
+            )
+        elif op is SUBPATTERN:
+            parts.append(_compile_regex(value[-1]))
+        elif op is BRANCH:
+            branches = [_compile_regex(b) for b in value[1]]
+            parts.append(lambda rng, b=branches: rng.choice(b)(rng))
+        elif op is AT:
+            continue
+        else:
+            raise ValueError(f"Unsupported regular expression: {op}")
+    return lambda rng: "".join(part(rng) for part in parts)
+
+
+class Synthesizer:
+    """
+    Compile JSON schemas into generators of random payloads.
+
+    :param definitions: Schemas that "$ref" values point to, by name
+    :param list_range: Minimum and maximum number of items in arrays, narrowed down by
+        the minItems and maxItems of each array
+    :param optional_probability: Probability of including an optional property
+    :param null_probability: Probability of a nullable value being null
+    """
+
+    def __init__(
+        self,
+        definitions: Dict[str, dict],
+        list_range: Tuple[int, int] = (1, 3),
+        optional_probability: float = 0.8,
+        null_probability: float = 0.1,
+    ):
+        self.definitions = definitions
+        self.list_range = list_range
+        self.optional_probability = optional_probability
+        self.null_probability = null_probability
+        self._compiled: Dict[str, Generator] = {}
+
+    def compile(self, schema: dict) -> Generator:
+        if "$ref" in schema:
+            return self._compile_ref(schema["$ref"].rpartition("/")[2])
+        if "const" in schema:
+            return lambda rng, v=schema["const"]: v
+        if schema.get("enum"):
+            return lambda rng, v=tuple(schema["enum"]): rng.choice(v)
+        code_list = code_list_of(schema)
+        if code_list:
+            return lambda rng, v=code_list.values: rng.choice(v)
+        if "allOf" in schema:
+            return self.compile(schema["allOf"][0])
+        if "anyOf" in schema:
+            return self._compile_any_of(schema["anyOf"])
+
+        compilers = {
+            "object": self._compile_object,
+            "array": self._compile_array,
+            "string": self._compile_string,
+            "integer": self._compile_integer,
+            "number": self._compile_number,
+            "boolean": lambda s: lambda rng: rng.random() < 0.5,
+            "null": lambda s: lambda rng: None,
+        }
+        schema_type = schema.get("type", "object")
+        return compilers[schema_type](schema)
+
+    def _compile_ref(self, name: str) -> Generator:
+        if name not in self._compiled:
+            # Register a forwarder first, so recursive models compile
+            self._compiled[name] = lambda rng: self._compiled[name](rng)
+            self._compiled[name] = self.compile(self.definitions[name])
+        return self._compiled[name]
+
+    def _compile_any_of(self, options: List[dict]) -> Generator:
+        nullable = any(o.get("type") == "null" for o in options)
+        generators = [self.compile(o) for o in options if o.get("type") != "null"]
+        null_probability = self.null_probability if nullable else 0.0
+
+        def generate(rng: Random) -> Any:
+            if rng.random() < null_probability:
+                return None
+            return rng.choice(generators)(rng)
+
+        return generate
+
+    def _compile_object(self, schema: dict) -> Generator:
+        required = set(schema.get("required", []))
+        properties = [
+            (name, self.compile(prop), name in required)
+            for name, prop in schema.get("properties", {}).items()
+        ]
+        probability = self.optional_probability
+
+        def generate(rng: Random) -> dict:
+            return {
+                name: generator(rng)
+                for name, generator, is_required in properties
+                if is_required or rng.random() < probability
+            }
+
+        return generate
+
+    def _compile_array(self, schema: dict) -> Generator:
+        low = max(self.list_range[0], schema.get("minItems", 0))
+        high = min(self.list_range[1], schema.get("maxItems", self.list_range[1]))
+        high = max(low, high)
+        item = self.compile(schema.get("items", {}))
+
+        if schema.get("uniqueItems"):
+
+            def generate_unique(rng: Random) -> list:
+                size = rng.randint(low, high)
+                items = []
+                # Small value spaces, like enums, may not have enough unique values
+                for _ in range(size * 10):
+                    if len(items) == size:
+                        break
+                    value = item(rng)
+                    if value not in items:
+                        items.append(value)
+                return items
+
+            return generate_unique
+
+        return lambda rng: [item(rng) for _ in range(rng.randint(low, high))]
+
+    @staticmethod
+    def _compile_string(schema: dict) -> Generator:
+        string_format = schema.get("format")
+        if string_format == "date":
+            return lambda rng: (EPOCH + timedelta(days=rng.randrange(3650))).strftime(
+                "%Y-%m-%d"
+            )
+        if string_format == "date-time":
+            return lambda rng: (
+                EPOCH + timedelta(seconds=rng.randrange(315_360_000))
+            ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if string_format == "email":
+            return (
+                lambda rng: "".join(
+                    rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))
+                )
+                + "@example.com"
+            )
+        if string_format == "uri":
+            return lambda rng: "https://example.com/" + "".join(
+                rng.choices(string.ascii_lowercase, k=8)
+            )
+        if "pattern" in schema:
+            return compile_pattern(schema["pattern"])
+
+        low = schema.get("minLength", 1)
+        high = max(low, schema.get("maxLength", max(low, DEFAULT_MAX_LENGTH)))
+        high = min(high, max(low, DEFAULT_MAX_LENGTH * 4))
+        return lambda rng: "".join(rng.choices(PRINTABLE, k=rng.randint(low, high)))
+
+    @staticmethod
+    def _bounds(schema: dict, step: float) -> Tuple[float, float]:
+        low = schema.get("minimum")
+        high = schema.get("maximum")
+        if "exclusiveMinimum" in schema:
+            low = schema["exclusiveMinimum"] + step
+        if "exclusiveMaximum" in schema:
+            high = schema["exclusiveMaximum"] - step
+        if low is None and high is None:
+            return -DEFAULT_NUMBER_RANGE, DEFAULT_NUMBER_RANGE
+        if low is None:
+            return high - DEFAULT_NUMBER_RANGE, high
+        if high is None:
+            return low, low + DEFAULT_NUMBER_RANGE
+        return low, high
+
+    def _compile_integer(self, schema: dict) -> Generator:
+        low, high = self._bounds(schema, 1)
+        low, high = int(low), int(high)
+        return lambda rng: rng.randint(low, high)
+
+    def _compile_number(self, schema: dict) -> Generator:
+        low, high = self._bounds(schema, 0.001)
+        return lambda rng: round(rng.uniform(low, high), 3)
+
+
+# Generator of the current write_ndjson call, inherited by forked workers as the
+# compiled closures can't be pickled
+_generator: Optional[Generator] = None
+
+
+def _chunk(args: Tuple[int, int, int]) -> bytes:
+    seed, chunk, size = args
+    # Each chunk has its own seed, so the output doesn't depend on the worker count
+    rng = Random(f"{seed}:{chunk}")
+    dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    lines = [dumps(_generator(rng)) for _ in range(size)]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def write_ndjson(
+    generator: Generator,
+    out: IO[bytes],
+    count: int,
+    seed: int,
+    jobs: int = 1,
+    chunk_size: int = 10_000,
+    validate: Optional[Callable[[bytes], Any]] = None,
+) -> int:
+    """
+    Write count payloads as newline delimited JSON. The output is the same for the
+    same seed regardless of the number of worker processes.
+
+    :param validate: Called with each line, e.g. to validate it with the model
+    :return: Number of bytes written
+    """
+    global _generator
+    _generator = generator
+
+    chunks = [
+        (seed, i, min(chunk_size, count - i * chunk_size))
+        for i in range((count + chunk_size - 1) // chunk_size)
+    ]
+    if jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+        pool = multiprocessing.get_context("fork").Pool(jobs)
+        results = pool.imap(_chunk, chunks)
+    else:
+        pool = None
+        results = map(_chunk, chunks)
+
+    written = 0
+    try:
+        for data in results:
+            if validate:
+                for line in data.splitlines():
+                    validate(line)
+            out.write(data)
+            written += len(data)
+    finally:
+        if pool:
+            pool.terminate()
+    return written
@@ -0,0 +1,210 @@
+"""
+Single-pass validation of the OpenAPI specs.
+
+Each spec is read and parsed once, then checked to be a well-formed OpenAPI document
+and to follow the rules of the data product definitions in DataProducts/README.md,
+using the rules of the upstream definition validator. With the gateway check the route
+of each spec is also built with openapi-to-fastapi, like the gateway and its
+openapi-validator do, which catches specs the gateway can't serve. Files can be
+validated in a pool of worker processes, and only the given files are validated when a
+list is passed.
+
+References to other documents, like the common components of the split view, are
+resolved relative to the spec. The gateway check skips the specs with such references,
+as the gateway serves them bundled.
+"""
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from tooling.components import COMMON_DOCUMENT
+from tooling.schema import iter_refs, iter_specs
+
+PARAMETER_LOCATIONS = {"query", "header", "path", "cookie"}
+OPERATIONS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+
+def resolve_pointer(document: dict, ref: str) -> bool:
+    """
+    Check that a local "#/..." reference points to something in the document
+    """
+    if not ref.startswith("#/"):
+        return False
+    value = document
+    for part in ref[2:].split("/"):
+        part = part.replace("~1", "/").replace("~0", "~")
+        if not isinstance(value, dict) or part not in value:
+            return False
+        value = value[part]
+    return True
+
+
+def resolve_ref(
+    ref: str, document: dict, path: Optional[Path], documents: Dict[Path, Any]
+) -> bool:
+    """
+    Check that a reference points to something, in the document or in another document
+    relative to its path. The other documents are loaded once into documents.
+    """
+    location, _, pointer = ref.partition("#")
+    if location:
+        if path is None:
+            return False
+        other = (path.parent / location).resolve()
+        if other not in documents:
+            try:
+                documents[other] = json.loads(other.read_bytes())
+            except (OSError, ValueError):
+                documents[other] = None
+        document = documents[other]
+        if document is None:
+            return False
+    return not pointer or resolve_pointer(document, f"#{pointer}")
+
+
+def is_standalone(spec: dict) -> bool:
+    """
+    Check that a spec only references its own components
+    """
+    return all(ref.startswith("#") for ref in iter_refs(spec))
+
+
+def validate_openapi(spec: dict, spec_path: Optional[Path] = None) -> None:
+    """
+    Check the structure of an OpenAPI 3.x document.
+
+    :param spec_path: Path of the document, to resolve references to other documents
+
+    :raises OpenApiValidationError: When the document isn't valid
+    """
+    from definition_tooling.validator import errors as err
+
+    if not isinstance(spec, dict):
+        raise err.OpenApiValidationError("The spec must be a JSON object")
+    if not isinstance(spec.get("info", {}).get("version"), str):
+        raise err.MandatoryField('version is a required field in "info" section')
+
+    for path, path_item in spec.get("paths", {}).items():
+        if not path.startswith("/"):
+            raise err.OpenApiValidationError(f'Path "{path}" must start with "/"')
+        for method, operation in path_item.items():
+            if method not in OPERATIONS:
+                continue
+            responses = operation.get("responses")
+            if not isinstance(responses, dict) or not responses:
+                raise err.OpenApiValidationError(f"No responses defined for {method}")
+            for status, response in responses.items():
+                if "description" not in response:
+                    raise err.MandatoryField(
+                        f"description is a required field of the {status} response"
+                    )
+            for parameter in operation.get("parameters", []):
+                if "name" not in parameter:
+                    raise err.MissingParameter("Parameter is missing a name")
+                if parameter.get("in") not in PARAMETER_LOCATIONS:
+                    raise err.MissingParameter(
+                        f'Parameter {parameter["name"]} has an invalid "in" value'
+                    )
+
+    documents: Dict[Path, Any] = {}
+    for ref in iter_refs(spec):
+        if not resolve_ref(ref, spec, spec_path, documents):
+            raise err.SchemaMissing(f"Reference {ref} can't be resolved")
+
+
+def validate_gateway(path: Path) -> None:
+    """
+    Build the route of a spec with openapi-to-fastapi, like the gateway does
+    """
+    from openapi_to_fastapi.routes import SpecRouter
+
+    SpecRouter(path)
+
+
+def validate_file(path: Path, root: Path, gateway: bool = False) -> Optional[str]:
+    """
+    Validate a spec file.
+
+    :param gateway: Also build the route of the spec with openapi-to-fastapi
+
+    :return: Description of the error, None if the spec is valid
+    """
+    from definition_tooling.validator import errors as err
+    from definition_tooling.validator.core import validate_spec
+
+    try:
+        spec = json.loads(path.read_bytes())
+    except ValueError:
+        return f"InvalidJSON: Incorrect JSON: {path}"
+    except OSError as e:
+        return f"ValidatorError: Failed to validate {path}: {e}"
+
+    try:
+        validate_openapi(spec, path)
+        validate_spec(spec, spec_path=path, root_path=root)
+        if gateway and is_standalone(spec):
+            validate_gateway(path)
+    except err.ValidatorError as e:
+        detail = f": {e}" if str(e) else ""
+        return f"{e.__class__.__name__}{detail}"
+    except Exception as e:
+        # Malformed specs can break the rules that expect a certain structure
+        return f"{e.__class__.__name__}: {e}"
+    return None
+
+
+def select_specs(root: Path, files: Iterable[Path]) -> List[Path]:
+    """
+    Select the spec files to validate from a list of changed files, ignoring files that
+    aren't specs in the root, like its README or the common components
+    """
+    root = root.resolve()
+    selected = []
+    for file in files:
+        resolved = file.resolve()
+        if (
+            resolved.suffix == ".json"
+            and resolved.is_relative_to(root)
+            and resolved != root / COMMON_DOCUMENT
+        ):
+            selected.append(file)
+    return sorted(set(selected), key=lambda p: p.as_posix())
+
+
+def validate_files(
+    paths: Optional[List[Path]], root: Path, jobs: int = 1, gateway: bool = False
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Validate the given specs, or all the specs in the root, yielding the error of each
+    spec in order
+    """
+    from definition_tooling.validator.core import validate_spec  # noqa: F401
+
+    if gateway:
+        from openapi_to_fastapi.routes import SpecRouter  # noqa: F401
+
+    if paths is None:
+        paths = select_specs(root, iter_specs(root))
+    # The version rules compare the paths, so they're compared as absolute paths
+    resolved = [p.resolve() for p in paths]
+    root = root.resolve()
+    if jobs <= 1 or len(paths) <= 1:
+        for path, resolved_path in zip(paths, resolved):
+            yield path, validate_file(resolved_path, root, gateway)
+        return
+
+    # The validators are imported before forking so the workers don't import them again
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        chunksize = max(len(paths) // (jobs * 4), 1)
+        results = executor.map(
+            validate_file,
+            resolved,
+            [root] * len(paths),
+            [gateway] * len(paths),
+            chunksize=chunksize,
+        )
+        yield from zip(paths, results)
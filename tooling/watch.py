@@ -0,0 +1,399 @@
+"""
+Watch mode of the converter.
+
+One process converts the definitions again whenever their sources are saved, so python,
+pydantic and the upstream tooling are imported once instead of on every save. The
+sources and the shared modules they import, like codelists, are watched with inotify.
+A change only converts the definitions that import the changed files, directly or
+through other modules, after removing the changed shared modules and the modules
+importing them from sys.modules so they're imported again.
+
+Adding, removing or renaming sources and changes to the aliases rescan all the sources
+like the incremental mode does. Changes to the tooling itself need a restart.
+
+The written specs are only formatted with the prettier hook of pre-commit, as the other
+hooks would convert and check the whole project again on every save.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from rich import print
+
+from tooling.aliases import ALIASES_FILE
+from tooling.catalog import write_catalog
+from tooling.code_lists import code_list_references
+from tooling.converter import (
+    Manifest,
+    Source,
+    alias_source,
+    collect_source,
+    collect_sources,
+    convert_definitions,
+    export_sources,
+    is_up_to_date,
+    print_timings,
+    remove_orphans,
+    styled_error,
+    sync_code_lists,
+)
+from tooling.schema import iter_specs, load_spec
+from tooling.sources import find_local_dependencies, forget_module_files
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+)
+# The only hook of pre-commit run on the specs written on a change
+FORMATTER_HOOK = "prettier"
+# struct inotify_event without the name that follows it
+EVENT = struct.Struct("iIII")
+READ_SIZE = 64 * 1024
+# Editors save in several steps, e.g. write a temporary file and rename it
+DEBOUNCE = 0.01
+
+
+class Inotify:
+    """
+    Watch directories for files that are written, moved or deleted, with the inotify
+    API of the Linux kernel. Directories created in the watched ones are watched too.
+    """
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("Watching the sources requires the inotify API of Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches: Dict[int, Path] = {}
+        # Set when the kernel dropped events, the changes have to be found otherwise
+        self.overflowed = False
+
+    def add(self, directory: Path) -> None:
+        if directory in self.watches.values():
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        self.watches[wd] = directory
+
+    def add_tree(self, root: Path) -> None:
+        self.add(root)
+        for path in sorted(root.rglob("*")):
+            if path.is_dir() and "__pycache__" not in path.parts:
+                self.add(path)
+
+    def read(self, timeout: Optional[float] = None) -> List[Tuple[Path, int]]:
+        """
+        Wait for events for up to timeout seconds, or forever if it's None
+
+        :return: The changed paths with the masks of their events
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, READ_SIZE)
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            offset += EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self.add_tree(path)
+            events.append((path, mask))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def invalidate_modules(
+    changed: Set[Path], local_files: Set[Path], project_root: Path
+) -> List[str]:
+    """
+    Remove the local modules that are or import one of the changed files from
+    sys.modules, so they're imported again
+
+    :return: Names of the removed modules
+    """
+    removed = []
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if not file or Path(file).resolve() not in local_files:
+            continue
+        path = Path(file).resolve()
+        if path in changed or changed.intersection(
+            find_local_dependencies(path, [project_root])
+        ):
+            del sys.modules[name]
+            removed.append(name)
+    return removed
+
+
+class Watcher:
+    """
+    Convert the definitions whenever their sources change, see convert_definitions for
+    the arguments
+    """
+
+    def __init__(
+        self,
+        src: Path,
+        dest: Path,
+        manifest_path: Path,
+        run_pre_commit: bool = True,
+        jobs: int = 1,
+        show_timings: bool = False,
+        index_path: Optional[Path] = None,
+        code_lists_path: Optional[Path] = None,
+    ):
+        self.src = src
+        self.dest = dest
+        self.manifest_path = manifest_path
+        self.run_pre_commit = run_pre_commit
+        self.jobs = jobs
+        self.show_timings = show_timings
+        self.index_path = index_path
+        self.code_lists_path = code_lists_path
+        self.project_root = src.resolve().parent
+        self.inotify = Inotify()
+        self.manifest = Manifest()
+        self.sources: Dict[str, Source] = {}
+        # Definitions whose specs reference code lists
+        self.code_list_users: Set[str] = set()
+
+    def input_files(self, source: Source) -> Set[Path]:
+        """
+        Get the files a definition source is built from
+        """
+        files = {source.path.resolve()}
+        for key in source.inputs:
+            if key != source.path.as_posix():
+                files.add((self.project_root / key).resolve())
+        return files
+
+    def local_files(self) -> Set[Path]:
+        files = set()
+        for source in self.sources.values():
+            if source.alias is None:
+                files |= self.input_files(source)
+        return files
+
+    def start(self) -> None:
+        """
+        Convert everything that changed while not watching, and watch the sources and
+        the directories of the shared modules they import
+        """
+        convert_definitions(
+            self.src,
+            self.dest,
+            incremental=True,
+            manifest_path=self.manifest_path,
+            run_pre_commit=self.run_pre_commit,
+            jobs=self.jobs,
+            show_timings=self.show_timings,
+            index_path=self.index_path,
+            code_lists_path=self.code_lists_path,
+        )
+        # Import the upstream tooling now, the sync skips it when nothing changed
+        from definition_tooling.converter import export_openapi_spec  # noqa: F401
+
+        self.manifest = Manifest.load(self.manifest_path)
+        self.sources = {
+            s.definition_name: s for s in collect_sources(self.src, self.dest)
+        }
+        for path in iter_specs(self.dest):
+            if code_list_references(load_spec(path)):
+                self.code_list_users.add(
+                    path.relative_to(self.dest).with_suffix("").as_posix()
+                )
+        self.inotify.add_tree(self.src)
+        self.watch_dependencies()
+
+    def watch_dependencies(self) -> None:
+        src = self.src.resolve()
+        for path in self.local_files():
+            if not path.is_relative_to(src):
+                self.inotify.add(path.parent)
+
+    def rescan(self) -> List[Source]:
+        """
+        Find the stale sources by hashing all of them, like the incremental mode
+        """
+        forget_module_files()
+        sources = collect_sources(self.src, self.dest)
+        if remove_orphans(sources, self.manifest, self.dest):
+            self.manifest.save(self.manifest_path)
+        self.sources = {s.definition_name: s for s in sources}
+        return [
+            s
+            for s in sources
+            if not is_up_to_date(s, self.manifest.definitions.get(s.definition_name))
+        ]
+
+    def affected(self, changed: Set[Path]) -> List[Source]:
+        """
+        Find the sources built from the changed files and the aliases mirroring them
+        """
+        stale = {}
+        for name, source in self.sources.items():
+            if source.alias is None and changed & self.input_files(source):
+                stale[name] = collect_source(source.path, self.src, self.dest)
+        for name, source in self.sources.items():
+            if source.alias is not None and source.alias.source in stale:
+                stale[name] = alias_source(source.alias, self.src, self.dest, stale)
+        self.sources.update(stale)
+        # Saving a file without changing it doesn't need a conversion
+        return [
+            s
+            for s in stale.values()
+            if getattr(self.manifest.definitions.get(s.definition_name), "inputs", None)
+            != s.inputs
+        ]
+
+    def is_structural(self, events: List[Tuple[Path, int]]) -> bool:
+        """
+        Check if sources or directories were added, removed or renamed, or the aliases
+        changed
+        """
+        known = self.local_files()
+        for path, mask in events:
+            if mask & IN_ISDIR or path.name == ALIASES_FILE:
+                return True
+            if path.resolve() not in known or not path.exists():
+                return True
+        return False
+
+    def handle(self, events: List[Tuple[Path, int]], changed_at: float) -> None:
+        """
+        Convert the definitions affected by the events
+        """
+        events = [
+            (p, m)
+            for p, m in events
+            if m & IN_ISDIR or p.suffix == ".py" or p.name == ALIASES_FILE
+        ]
+        if not events and not self.inotify.overflowed:
+            return
+
+        start = perf_counter()
+        changed = {p.resolve() for p, _ in events}
+        # The sources themselves are imported anew on every conversion
+        shared = {p for p in changed if not p.is_relative_to(self.src.resolve())}
+        if shared:
+            invalidate_modules(shared, self.local_files(), self.project_root)
+        if self.inotify.overflowed or self.is_structural(events):
+            self.inotify.overflowed = False
+            stale = self.rescan()
+        else:
+            stale = self.affected(changed)
+        if not stale:
+            print("Everything is up to date")
+            return
+
+        timings, written, _ = export_sources(
+            stale, self.dest, self.manifest, check_untracked=False
+        )
+        self.manifest.save(self.manifest_path)
+        self.watch_dependencies()
+        convert_time = perf_counter() - start
+        if self.show_timings and timings:
+            print_timings(timings, wall_time=convert_time, jobs=1)
+
+        if written and self.run_pre_commit:
+            format_specs(written)
+
+        # Only specs that reference code lists, before or after, can change them
+        uses_code_lists = False
+        for source, result in timings:
+            name = source.definition_name
+            uses_code_lists = uses_code_lists or name in self.code_list_users
+            if result.openapi and code_list_references(result.openapi):
+                self.code_list_users.add(name)
+                uses_code_lists = True
+            elif result.openapi:
+                self.code_list_users.discard(name)
+        if self.code_lists_path and uses_code_lists:
+            sync_code_lists(self.dest, self.code_lists_path)
+        if written and self.index_path and write_catalog(self.dest, self.index_path):
+            print(f"Updated catalog {self.index_path}")
+
+        end = perf_counter()
+        print(
+            f"Converted {len(timings)} definitions ({len(written)} changed) in "
+            f"{convert_time * 1000:.1f} ms, {(end - changed_at) * 1000:.1f} ms after "
+            "the change"
+        )
+
+    def watch(self) -> None:
+        """
+        Convert the definitions whenever their sources change, until interrupted
+        """
+        print(f"Watching {self.src} for changes, press Ctrl+C to stop")
+        while True:
+            events = self.inotify.read()
+            changed_at = perf_counter()
+            while True:
+                more = self.inotify.read(DEBOUNCE)
+                if not more:
+                    break
+                events.extend(more)
+            try:
+                self.handle(events, changed_at)
+            except Exception as e:
+                # Keep watching, the definition is converted again on the next save
+                path = Path(getattr(e, "filename", None) or self.src)
+                print(styled_error(f"{type(e).__name__}: {e}", path))
+
+
+def format_specs(files: List[Path]) -> None:
+    """
+    Format specs with the formatter hook of pre-commit, without the other hooks
+    """
+    subprocess.run(
+        ["pre-commit", "run", FORMATTER_HOOK, "--files", *[str(f) for f in files]],
+        capture_output=True,
+    )
+
+
+def watch_definitions(src: Path, dest: Path, **options) -> None:
+    """
+    Convert the definitions in src to OpenAPI specs in dest, and again whenever their
+    sources change
+    """
+    watcher = Watcher(src, dest, **options)
+    try:
+        watcher.start()
+        watcher.watch()
+    finally:
+        watcher.inotify.close()